@@ -0,0 +1,89 @@
+
+import random
+import time
+
+from entities import CircleEntity, Water
+from geometry import Vector
+from util import BACKENDS, Settings, narrowphase
+
+# Compares the broadphase backends on uniform and clustered scenes.
+# Run from src/: `python broadphase-benchmark.py` (PYGLET_HEADLESS=1 without a display)
+# Entities are circles in the DEFAULT category, so they pair with each other as well as with the water.
+# pairs counts candidate pairs, which the grid backends over-report; colliding should match on every backend.
+
+N = 2000
+FRAMES = 20
+SPEED = 3  # pixels moved per frame
+SEED = 0
+RADIUS = 3
+
+
+def uniform_scene(rand):
+    return [(rand.uniform(0, Settings.WIDTH), rand.uniform(0, Settings.HEIGHT)) for _ in range(N)]
+
+
+def clustered_scene(rand):
+    # a burst of neutrons around a few atoms, plus a pile-up clamped into the edge sectors
+    centres = [(Settings.WIDTH / 2, Settings.HEIGHT / 2), (200, 150), (Settings.WIDTH - 150, 100)]
+    points = [(cx + rand.gauss(0, 15), cy + rand.gauss(0, 15))
+              for cx, cy in (rand.choice(centres) for _ in range(N * 9 // 10))]
+    points += [(Settings.WIDTH + rand.uniform(0, 40), rand.uniform(0, Settings.HEIGHT)) for _ in range(N // 10)]
+    return points
+
+
+def make_entities(coordinates):
+    entities = [CircleEntity(x, y, 0, 0, (255, 255, 255), RADIUS) for x, y in coordinates]
+    entities.append(Water(Settings.WIDTH / 2, 0, Settings.WIDTH / 2, Settings.HEIGHT / 2))
+    return entities
+
+
+def run(physics, entities, rand):
+    physics.clear()
+    start = time.perf_counter()
+    for e in entities:
+        physics.add_to_sector(e)
+    physics.rebuild()
+    insert_time = time.perf_counter() - start
+
+    update_time = query_time = pair_time = 0
+    candidates = pairs = colliding = 0
+    for _ in range(FRAMES):
+        for e in entities:
+            if not e.static:
+                e.translate(Vector(rand.uniform(-1, 1), rand.uniform(-1, 1)), SPEED)
+
+        start = time.perf_counter()
+        physics.update_sectors()  # entities moved this frame are on the dirty list
+        update_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for e in entities:
+            candidates += len(physics.get_neighbour_entities(e))
+        query_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        frame_pairs = physics.get_candidate_pairs()
+        pair_time += time.perf_counter() - start
+        pairs += len(frame_pairs)
+        colliding += int(narrowphase.intersect_pairs(frame_pairs).sum())
+
+    physics.clear()
+    return (insert_time, update_time / FRAMES, query_time / FRAMES, candidates // FRAMES,
+            pair_time / FRAMES, pairs // FRAMES, colliding // FRAMES)
+
+
+if __name__ == '__main__':
+    Settings.VALIDATE = False
+    backends = {name: cls() for name, cls in BACKENDS.items()}
+    for backend in backends.values():
+        backend.validate = False
+
+    print(f'{"scene":<10} {"backend":<10} {"insert ms":>10} {"update ms":>10} {"query ms":>10} {"candidates":>12} '
+          f'{"pairs ms":>10} {"pairs":>10} {"colliding":>10}')
+    for scene_name, scene in (('uniform', uniform_scene), ('clustered', clustered_scene)):
+        coordinates = scene(random.Random(SEED))
+        for backend_name, physics in backends.items():
+            entities = make_entities(coordinates)
+            insert, update, query, candidates, pair, pairs, colliding = run(physics, entities, random.Random(SEED))
+            print(f'{scene_name:<10} {backend_name:<10} {insert * 1000:>10.2f} {update * 1000:>10.2f} '
+                  f'{query * 1000:>10.2f} {candidates:>12} {pair * 1000:>10.2f} {pairs:>10} {colliding:>10}')
@@ -1,13 +1,24 @@
 
 from .atom import Atom  # noqa: F401
 from .component_controller import BasicController, Controller  # noqa: F401
+from .collision_handlers import CollisionHandlers  # noqa: F401
+from .collision_handlers import GlobalCollisionHandlers as Collisions  # noqa: F401
 from .component_emitter import (Emitter, Radioactivity,  # noqa: F401
-                                TestEmitter)
+                                RandomDirection, TestEmitter)
 from .component_thermal import Thermal  # noqa: F401
-from .entity import Entity  # noqa: F401
+from .decay_scheduler import DecayScheduler  # noqa: F401
+from .decay_scheduler import GlobalDecay as Decay  # noqa: F401
+from .entity import Entity, components_only  # noqa: F401
 from .entity_control_rod import ControlRod  # noqa: F401
 from .entity_movable import Moveable  # noqa: F401
 from .entity_neutron import Neutron  # noqa: F401
 from .entity_simple_shapes import (CircleEntity, PointEntity,  # noqa: F401
                                    RectangleEntity)
 from .entity_water import Water  # noqa: F401
+from .neutron_swarm import NeutronSwarm  # noqa: F401
+from .particle_pool import GlobalParticlePool as Particles  # noqa: F401
+from .particle_pool import Particle, ParticlePool  # noqa: F401
+from .pipeline import GlobalPipeline as Pipeline  # noqa: F401
+from .pipeline import UpdatePipeline  # noqa: F401
+from .world import GlobalWorld as Components  # noqa: F401
+from .world import RowPoint, RowVector, World, WorldProxy  # noqa: F401
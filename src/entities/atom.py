@@ -1,5 +1,6 @@
 
 from image import Layer
+from util import Physics
 
 from .component_emitter import Radioactivity
 from .entity_simple_shapes import CircleEntity
@@ -12,9 +13,19 @@ RED = (255, 0, 0, 255)
 
 
 class Atom(CircleEntity):
-    def __init__(self, x, y, dx, dy, radius, emit_num, emit_chance, emit_particle, entity_space):
+    collision_category = Physics.Category.ATOM
+
+    def __init__(self, x, y, dx, dy, radius, emit_num, emit_rate, emit_particle, entity_space):
+        self.radioactivity = None  # read by the alive setter during construction
         super().__init__(x, y, dx, dy, RED, radius, static=True)
-        self.radioactivity = Radioactivity(self.pos, emit_particle, emit_num, 100, entity_space, emit_chance)
+        # emit_rate is in decays per simulated second, schedule radioactivity to start decaying
+        self.radioactivity = Radioactivity(x, y, emit_num, 100, entity_space, emit_rate)
         self.repr.append(self.radioactivity)
 
         self.image.layer = Layer.MIDGROUND
+
+    @CircleEntity.alive.setter
+    def alive(self, alive):
+        CircleEntity.alive.fset(self, alive)
+        if not alive and self.radioactivity is not None:
+            self.radioactivity.alive = False  # drops out of the decay schedule
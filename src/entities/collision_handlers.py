@@ -0,0 +1,103 @@
+
+from util import narrowphase
+
+# todo:
+# run the narrowphase once for pairs shared by several handlers
+
+
+class CollisionHandlers:
+    '''Registry of what happens when entities collide, replacing type checks in the game loop.
+
+    Pair handlers are registered for an ordered pair of entity types and apply to subclasses too.
+    Candidate pairs are bucketed by handler, only bucketed pairs go through the narrowphase, and each
+    handler is called once per update with its whole bucket. Pairs nothing is registered for are
+    dropped before any intersection test. Handlers registered with narrowphase=False get every pair
+    whose boxes overlap, for sensors or entities which test their own contents (e.g. NeutronSwarm).'''
+
+    def __init__(self):
+        self._pair_handlers = []  # (type_a, type_b, handler(pairs, dt)) in registration order
+        self._entity_handlers = []  # (type, exact, handler(entities, dt)) in registration order
+        self._pair_dispatch = {}  # (type, type) of concrete classes to ((handler, swapped), ...)
+        self._entity_dispatch = {}  # concrete class to (handler, ...)
+        self._box_only = set()  # handlers which skip the narrowphase
+
+    def register(self, type_a, type_b, handler, narrowphase=True):
+        '''Call handler(pairs, dt) with every colliding (a, b) where a is a type_a and b a type_b.'''
+        self._pair_handlers.append((type_a, type_b, handler))
+        if not narrowphase:
+            self._box_only.add(handler)
+        self._pair_dispatch.clear()
+
+    def register_entity(self, typ, handler, exact=False):
+        '''Call handler(entities, dt) with every entity of type typ on each update. Subclasses of typ
+        are included unless exact is set.'''
+        self._entity_handlers.append((typ, exact, handler))
+        self._entity_dispatch.clear()
+
+    def clear(self):
+        self._pair_handlers.clear()
+        self._entity_handlers.clear()
+        self._pair_dispatch.clear()
+        self._entity_dispatch.clear()
+        self._box_only.clear()
+
+    def _resolve_pair(self, key):
+        type_1, type_2 = key
+        targets = []
+        for type_a, type_b, handler in self._pair_handlers:
+            if issubclass(type_1, type_a) and issubclass(type_2, type_b):
+                targets.append((handler, False))
+            elif issubclass(type_2, type_a) and issubclass(type_1, type_b):
+                targets.append((handler, True))
+        targets = tuple(targets)
+        self._pair_dispatch[key] = targets
+        return targets
+
+    def bucket(self, pairs):
+        '''Group pairs by handler, each pair ordered as its handler was registered.'''
+        buckets = {}
+        dispatch = self._pair_dispatch
+        for pair in pairs:
+            e1, e2 = pair
+            key = (type(e1), type(e2))
+            targets = dispatch.get(key)
+            if targets is None:
+                targets = self._resolve_pair(key)
+            for handler, swapped in targets:
+                bucket = buckets.get(handler)
+                if bucket is None:
+                    bucket = buckets[handler] = []
+                bucket.append((e2, e1) if swapped else pair)
+        return buckets
+
+    def run(self, pairs, dt):
+        '''Narrowphase the candidate pairs which have handlers, then run each handler on its hits.'''
+        for handler, bucket in self.bucket(pairs).items():
+            if handler in self._box_only:
+                handler(bucket, dt)
+                continue
+            hits = narrowphase.intersect_pairs(bucket).tolist()
+            colliding = [pair for pair, hit in zip(bucket, hits) if hit]
+            if colliding:
+                handler(colliding, dt)
+
+    def run_entities(self, entities, dt):
+        '''Run entity handlers, each once with all of its entities.'''
+        buckets = {}
+        dispatch = self._entity_dispatch
+        for entity in entities:
+            cls = type(entity)
+            handlers = dispatch.get(cls)
+            if handlers is None:
+                handlers = dispatch[cls] = tuple(h for typ, exact, h in self._entity_handlers
+                                                 if (cls is typ if exact else issubclass(cls, typ)))
+            for handler in handlers:
+                bucket = buckets.get(handler)
+                if bucket is None:
+                    bucket = buckets[handler] = []
+                bucket.append(entity)
+        for handler, bucket in buckets.items():
+            handler(bucket, dt)
+
+
+GlobalCollisionHandlers = CollisionHandlers()
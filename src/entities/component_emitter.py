@@ -2,42 +2,81 @@
 import random
 from typing import Callable
 
-from geometry import Point, Vector
-from image import Layer
+import numpy as np
 
+from geometry import Point, Vector, VectorArray
+from util import Settings
+
+from .decay_scheduler import GlobalDecay
 from .entity import Entity
-from .entity_simple_shapes import PointEntity
+from .particle_pool import GlobalParticlePool
 
 # todo:
 # use __deepcopy__?
-# correct get_per_frame_chance
 # make nicer way add physics to particles
 # implement custom particle emission
 
+DIRECTION_RESOLUTION = 3600  # number of precomputed emission directions (0.1 degree steps)
+_unit_directions = VectorArray.from_polar_degrees(1.0, np.arange(DIRECTION_RESOLUTION) * 360 / DIRECTION_RESOLUTION)
+
+
+class RandomDirection:
+    '''Emission velocity with a fixed speed and a uniformly random direction.
+
+    Directions are drawn from a precomputed table so a whole burst costs one RNG call.'''
+    def __init__(self, speed):
+        self.speed = speed
+
+    def __call__(self):
+        return self.sample(1)[0]
+
+    def sample(self, n):
+        index = Settings.rng.integers(0, DIRECTION_RESOLUTION, n)
+        return VectorArray._wrap(_unit_directions.data[index] * self.speed)
+
 
 class Emitter(Entity):
-    def __init__(self, x, y, emit_n, emit_vec_f, output_lst):
+    '''Emits bursts of particles into output_lst, or of neutrons into swarm when one is given.
+
+    A swarm takes the whole burst as rows in one call. Particles are entities of their own, so a burst
+    of them still costs one pool acquire per particle.'''
+    def __init__(self, x, y, emit_n, emit_vec_f, output_lst, pool=None, swarm=None):
         super().__init__()
         self.origin = Point(x, y)
         self.output_lst = output_lst
         self.emit_n = emit_n
-        self.emit_vec: Vector | Callable = emit_vec_f  # allow function for use with random emit directions
-
-    def _create_particle(self):
-        if callable(self.emit_vec):
-            vel = self.emit_vec()
+        self.pool = pool if pool is not None else GlobalParticlePool  # dead particles are reused from here
+        self.swarm = swarm  # NeutronSwarm written into instead of output_lst, shared by copies
+        # allow function for use with random emit directions, or an object with sample(n) for bulk draws
+        self.emit_vec: Vector | RandomDirection | Callable = emit_vec_f
+
+    def _sample_velocities(self, n):
+        if isinstance(self.emit_vec, Vector):
+            return VectorArray.from_xy(np.full(n, self.emit_vec.x), np.full(n, self.emit_vec.y))
+        elif hasattr(self.emit_vec, 'sample'):
+            return self.emit_vec.sample(n)
+        return VectorArray.from_vectors([self.emit_vec() for _ in range(n)])
+
+    def __deepcopy__(self, memo):
+        if self.swarm is not None:
+            memo[id(self.swarm)] = self.swarm
+        return super().__deepcopy__(memo)
+
+    def _create_particles(self, n):
+        ox, oy = self.origin.coordinates
+        acquire = self.pool.acquire
+        return [acquire(ox, oy, dx, dy) for dx, dy in self._sample_velocities(n).data.tolist()]
+
+    def emit(self, n=None):
+        '''Emit n particles (emit_n by default) as a single batch.'''
+        if n is None:
+            n = self.emit_n
+        if n <= 0:
+            return
+        if self.swarm is not None:
+            self.swarm.emit(np.broadcast_to(self.origin.coordinates, (n, 2)), self._sample_velocities(n).data)
         else:
-            vel = self.emit_vec
-        particle = PointEntity(self.origin.x, self.origin.y,
-                               vel.x, vel.y, (128, 128, 128), 3)
-        particle.pos.coordinates = self.origin.coordinates
-        particle.image.layer = Layer.FOREGROUND
-        return particle
-
-    def emit(self):
-        for i in range(self.emit_n):
-            particle = self._create_particle()
-            self.output_lst.append(particle)
+            self.output_lst.extend(self._create_particles(n))
 
 
 class ProbabilityEmitter(Emitter):
@@ -60,18 +99,46 @@ class TimeEmitter(Emitter):
         self.passed_time = 0
 
     def update(self, dt):
-        for _ in range(int((self.passed_time + dt) // self.timeframe)):
-            self.emit()
+        bursts = int((self.passed_time + dt) // self.timeframe)
+        self.emit(bursts * self.emit_n)  # every elapsed timeframe in one batch
         self.passed_time = (self.passed_time + dt) % self.timeframe
 
 
-class Radioactivity(ProbabilityEmitter):
-    def __init__(self, x, y, emit_n, emit_s, output_lst, probability):
-        super().__init__(x, y, emit_n, lambda: Vector.from_polar_degrees(emit_s, random.random() * 360),
-                         output_lst, probability)
+class Radioactivity(Emitter):
+    '''Emitter decaying at random, on average decay_rate times per simulated second.
+
+    Decays are driven by a DecayScheduler rather than per-frame rolls. The owner schedules it, and it
+    is unscheduled as soon as it stops being alive.'''
+    def __init__(self, x, y, emit_n, emit_s, output_lst, decay_rate):
+        if not decay_rate >= 0:
+            raise ValueError(f'decay rate must be a non-negative number of decays per second, got {decay_rate}')
+        self.scheduler = None  # set by schedule(), read by the alive setter during Entity.__init__
+        super().__init__(x, y, emit_n, RandomDirection(emit_s), output_lst)
+        self.decay_rate = decay_rate
+
+    @Entity.alive.setter
+    def alive(self, alive):
+        self._alive = alive
+        if not alive:
+            self.unschedule()
+
+    def schedule(self, scheduler=None):
+        '''Start decaying, driven by scheduler (GlobalDecay by default).'''
+        self.unschedule()
+        self.scheduler = scheduler if scheduler is not None else GlobalDecay
+        self.scheduler.schedule(self)
+
+    def unschedule(self):
+        if self.scheduler is not None:
+            self.scheduler.unschedule(self)
+            self.scheduler = None
+
+    def __deepcopy__(self, memo):
+        result = super().__deepcopy__(memo)
+        result.scheduler = None  # a copy decays only once scheduled itself
+        return result
 
 
 class TestEmitter(TimeEmitter):
     def __init__(self, x, y, emit_n, entity_space, time):
-        super().__init__(x, y, emit_n, lambda: Vector.from_polar_degrees(100, random.random() * 360),
-                         entity_space, time)
+        super().__init__(x, y, emit_n, RandomDirection(100), entity_space, time)
@@ -4,6 +4,7 @@ from .entity import Entity
 
 # @dataclass
 class Thermal(Entity):
+    __slots__ = ('T', 'typ', 'min', 'max')
     transfer_coefficients = {}    # key is set of classes and value is matching coefficient
     dissipation_coefficients = {}  #
 
@@ -0,0 +1,80 @@
+
+import heapq
+import itertools
+
+from util import Settings
+
+# todo:
+# batch emitters decaying in the same update into one emit call
+
+
+class DecayScheduler:
+    '''Central clock for radioactive emitters.
+
+    Each scheduled emitter sits on a priority queue keyed by its next decay time, drawn from an
+    exponential distribution with the emitter's decay_rate (decays per simulated second). An update
+    only touches emitters which decay during it, so the per-frame cost scales with the number of
+    decays rather than emitters. Nothing is scheduled implicitly, owners call schedule() and
+    unschedule() themselves.'''
+
+    def __init__(self):
+        self.time = 0.0
+        self._queue = []  # heap of [decay time, schedule order, emitter or None once unscheduled]
+        self._entries = {}  # id of each scheduled emitter to its live queue entry
+        self._order = itertools.count()  # tie breaker so equal times pop in schedule order
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, emitter):
+        entry = self._entries.get(id(emitter))
+        return entry is not None and entry[-1] is emitter
+
+    def __copy__(self):  # shared, copies of scheduled emitters are not scheduled themselves
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def _push(self, emitter, start):
+        rate = emitter.decay_rate
+        if rate > 0:
+            entry = [start + Settings.rng.exponential(1 / rate), next(self._order), emitter]
+            self._entries[id(emitter)] = entry
+            heapq.heappush(self._queue, entry)
+        else:
+            self._entries.pop(id(emitter), None)
+
+    def schedule(self, emitter):
+        '''Start tracking emitter, its first decay drawn from now. Scheduling it again does nothing.'''
+        if emitter not in self:
+            self._push(emitter, self.time)
+
+    def unschedule(self, emitter):
+        '''Stop tracking emitter. Its queue entry is blanked and dropped when it reaches the front.'''
+        if emitter in self:
+            self._entries.pop(id(emitter))[-1] = None
+
+    def update(self, dt):
+        self.time += dt
+        queue = self._queue
+        while queue and queue[0][0] <= self.time:
+            _, _, emitter = heapq.heappop(queue)
+            if emitter is None:  # unscheduled
+                continue
+            if not emitter.alive:  # killed without being unscheduled
+                del self._entries[id(emitter)]
+                continue
+            if emitter.enable:
+                emitter.emit()
+            # Next decay is drawn from the end of this update so an emitter decays at most once per
+            # update, matching the per-frame probability model exactly when dt is one frame
+            self._push(emitter, self.time)
+
+    def clear(self):
+        self.time = 0.0
+        self._queue.clear()
+        self._entries.clear()
+
+
+GlobalDecay = DecayScheduler()
@@ -2,7 +2,7 @@
 # import abc
 from copy import deepcopy
 
-from util import Settings
+from util import Settings, get_state, set_state
 
 # Todo:
 # add entity disable and corresponding toggle
@@ -12,9 +12,20 @@ from util import Settings
 #   repr is free to copy itself on modifications
 
 
+def components_only(f):
+    '''Mark an _update or _prepare which does nothing but forward to repr, so UpdatePipeline can
+    flatten it. Survives decorators which copy the function's __dict__, like functools.wraps.'''
+    f.components_only = True
+    return f
+
+
 class Entity:
-    '''Base class for a drawn entity.'''
+    '''Base class for a drawn entity.
+
+    The hierarchy is slotted so entities held by the thousand stay small. Subclasses which declare
+    no __slots__ of their own get a __dict__ back, which is the place for ad-hoc attributes.'''
     # __metaclass__ = abc.ABCMeta
+    __slots__ = ('repr', 'enable', '_alive', 'id')
 
     # Note:
     # Subclasses should not implement __iter__ because it can cause confusion when adding to self.repr
@@ -31,6 +42,14 @@ class Entity:
     def __str__(self):
         return f'{type(self).__name__}()'
 
+    @property
+    def alive(self):
+        return self._alive
+
+    @alive.setter
+    def alive(self, alive):
+        self._alive = alive
+
     def __eq__(self, other):
         if isinstance(other, Entity):
             return self.id == other.id
@@ -39,7 +58,7 @@ class Entity:
     def __copy__(self):
         cls = self.__class__
         result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
+        set_state(result, get_state(self))
         # result.id = Settings.next_id()
         return result
 
@@ -47,12 +66,12 @@ class Entity:
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            setattr(result, k, deepcopy(v, memo))
+        set_state(result, {k: deepcopy(v, memo) for k, v in get_state(self).items()})
         result.id = Settings.next_id()
         return result
 
     # @abc.abstractmethod  # require this function to be overwritten
+    @components_only
     def _update(self, dt):
         '''Apply update logic'''
         for entity in self.repr:
@@ -64,6 +83,7 @@ class Entity:
             # Can run any mandatory stuffs, like base class super()._update()
             self._update(dt)
 
+    @components_only
     def _prepare(self):
         '''Prepares entity for next update.'''
         for entity in self.repr:
@@ -2,6 +2,7 @@
 from pyglet.window import key
 
 from image import Layer
+from util import Physics
 
 from .component_controller import Controller, KeyEvent, KeyMap
 from .entity_simple_shapes import RectangleEntity
@@ -27,9 +28,15 @@ def controlrod_controls(arrows, speed, minx, maxx, miny, maxy):
 
 
 class ControlRod(RectangleEntity):
+    collision_category = Physics.Category.ROD
+
     def __init__(self, x, y, w, h, speed, minx, maxx, miny, maxy, window):
-        super().__init__(x, y, 0, 0, DARK_GRAY, w, h)
+        super().__init__(x, y, 0, 0, DARK_GRAY, w, h, static=True)  # only moved by the player
         self.controller = Controller(self, window, controlrod_controls(True, speed, minx, maxx, miny, maxy))
         self.repr.append(self.controller)
 
         self.image.layer = Layer.MIDGROUND
+
+    def move(self, dt):
+        if self.enable and self.alive and (self.vel.x or self.vel.y):
+            self._move(dt)  # marks the rod dirty, so physics re-indexes the static layer on its next update
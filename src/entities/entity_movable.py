@@ -1,5 +1,6 @@
 
 from image import Layer
+from util import Physics
 
 from .component_controller import BasicController
 from .component_thermal import Thermal
@@ -9,6 +10,8 @@ GREEN = (0, 255, 0, 128)
 
 
 class Moveable(CircleEntity):
+    collision_category = Physics.Category.MOVEABLE
+
     def __init__(self, x, y, speed, radius, window, keymapping):
         super().__init__(x, y, 0, 0, GREEN, radius)
         self.controller = BasicController(self, speed, window, keymapping)
@@ -1,5 +1,6 @@
 
 from image import Layer
+from util import Physics
 
 from .entity_simple_shapes import PointEntity
 
@@ -10,6 +11,9 @@ WHITE = (255, 255, 255, 255)
 
 
 class Neutron(PointEntity):
+    __slots__ = ()
+    collision_category = Physics.Category.NEUTRON
+
     def __init__(self, x, y, dx, dy, radius):
         super().__init__(x, y, dx, dy, WHITE, radius)
 
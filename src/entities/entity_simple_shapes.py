@@ -1,24 +1,21 @@
 from image import CircleImage, RectangleImage
-from util import Physics
+from util import Physics, ShapeKind
 
 from .graphical_entity_simple import SimpleGraphicalEntity
 
 
 class PointEntity(SimpleGraphicalEntity):
     '''Base class for a 2D points.'''
+    __slots__ = ()  # held by the thousand, circles and rectangles are few and keep a __dict__
+    shape_kind = ShapeKind.Point
+    collision_category = Physics.Category.PARTICLE
+    # particles and neutrons have no effect on each other, so never pair them
+    collision_mask = Physics.Category.ALL & ~(Physics.Category.PARTICLE | Physics.Category.NEUTRON)
+
     def __init__(self, x, y, dx, dy, color, radius, static=False):
         image = CircleImage(x, y, color, radius)
         super().__init__(x, y, dx, dy, image, static)
 
-    def __contains__(self, other):
-        if isinstance(other, PointEntity):
-            return Physics.intersect_point_point(self, other)
-        elif isinstance(other, CircleEntity):
-            return Physics.intersect_point_circle(self, other)
-        elif isinstance(other, RectangleEntity):
-            return Physics.intersect_point_rectangle(self, other)
-        raise NotImplementedError(f'unsupported type(s) for collision checking: \'{type(self).__name__}\' and \'{type(other).__name__}\'')  # noqa: E501
-
     @property
     def radius(self):
         return self.image.radius
@@ -30,19 +27,12 @@ class PointEntity(SimpleGraphicalEntity):
 
 class CircleEntity(SimpleGraphicalEntity):
     '''Base class for a 2D circle.'''
+    shape_kind = ShapeKind.Circle
+
     def __init__(self, x, y, dx, dy, color, radius, static=False):
         image = CircleImage(x, y, color, radius)
         super().__init__(x, y, dx, dy, image, static)
 
-    def __contains__(self, other):
-        if isinstance(other, PointEntity):
-            return Physics.intersect_circle_point(self, other)
-        elif isinstance(other, CircleEntity):
-            return Physics.intersect_circle_circle(self, other)
-        elif isinstance(other, RectangleEntity):
-            return Physics.intersect_circle_rectangle(self, other)
-        raise NotImplementedError(f'unsupported type(s) for collision checking: \'{type(self).__name__}\' and \'{type(other).__name__}\'')  # noqa: E501
-
     @property
     def radius(self):
         return self.image.radius
@@ -54,21 +44,14 @@ class CircleEntity(SimpleGraphicalEntity):
 
 class RectangleEntity(SimpleGraphicalEntity):
     '''Base class for a 2D planes.'''
+    shape_kind = ShapeKind.Rectangle
+
     def __init__(self, x, y, dx, dy, color, w, h, static=False):
         image = RectangleImage(x, y, color, w, h)
         super().__init__(x, y, dx, dy, image, static)
 
         self.physics = Physics.PhysicsType.Complex
 
-    def __contains__(self, other):
-        if isinstance(other, PointEntity):
-            return Physics.intersect_rectangle_point(self, other)
-        elif isinstance(other, CircleEntity):
-            return Physics.intersect_rectangle_circle(self, other)
-        elif isinstance(other, RectangleEntity):
-            return Physics.intersect_rectangle_rectangle(self, other)
-        raise NotImplementedError(f'unsupported type(s) for collision checking: \'{type(self).__name__}\' and \'{type(other).__name__}\'')  # noqa: E501
-
     @property
     def width(self):
         return self.image.width
@@ -120,3 +103,15 @@ class RectangleEntity(SimpleGraphicalEntity):
     @property
     def bottom_right(self):
         return self.image.bottom_right
+
+
+# Collision kernels for each ordered pair of shapes, subclasses resolve to their nearest registered bases
+Physics.register_collision(PointEntity, PointEntity, Physics.intersect_point_point)
+Physics.register_collision(PointEntity, CircleEntity, Physics.intersect_point_circle)
+Physics.register_collision(PointEntity, RectangleEntity, Physics.intersect_point_rectangle)
+Physics.register_collision(CircleEntity, PointEntity, Physics.intersect_circle_point)
+Physics.register_collision(CircleEntity, CircleEntity, Physics.intersect_circle_circle)
+Physics.register_collision(CircleEntity, RectangleEntity, Physics.intersect_circle_rectangle)
+Physics.register_collision(RectangleEntity, PointEntity, Physics.intersect_rectangle_point)
+Physics.register_collision(RectangleEntity, CircleEntity, Physics.intersect_rectangle_circle)
+Physics.register_collision(RectangleEntity, RectangleEntity, Physics.intersect_rectangle_rectangle)
@@ -1,5 +1,6 @@
 
 from image import Layer
+from util import Physics
 
 from .component_thermal import Thermal
 from .entity_simple_shapes import RectangleEntity
@@ -12,6 +13,8 @@ BABY_BLUE = (137, 207, 240, 64)
 
 
 class Water(RectangleEntity):
+    collision_category = Physics.Category.WATER
+
     def __init__(self, x, y, w, h):
         super().__init__(x, y, 0, 0, BABY_BLUE, w, h, static=True)
         self.thermal = Thermal(50, Water, 50)
@@ -3,8 +3,9 @@ from copy import copy
 from functools import wraps
 
 from geometry import Point, Vector
+from util import Physics, Settings
 
-from .entity import Entity
+from .entity import Entity, components_only
 
 # todo:
 # Performance test
@@ -14,7 +15,12 @@ from .entity import Entity
 
 
 def static_update_function(f):
-    '''Enforce update function assumption that object will not move.'''
+    '''Enforce update function assumption that object will not move.
+
+    Only enforced when Settings.VALIDATE is set at import, otherwise f is returned untouched.'''
+    if not Settings.VALIDATE:
+        return f
+
     @wraps(f)
     def wrapper(self, *args, **kw):
         old_pos = copy(self.pos)
@@ -26,7 +32,12 @@ def static_update_function(f):
 
 
 class GraphicalEntity(Entity):
+    __slots__ = ('_pos', 'vel', 'static', 'image', 'physics', '_physics')
+    collision_category = Physics.Category.DEFAULT  # category bits this entity belongs to
+    collision_mask = Physics.Category.ALL  # categories this entity can collide with
+
     def __init__(self, x, y, dx, dy, image, static=False):
+        self._physics = None  # backend the entity is registered with, told when it moves or dies
         super().__init__()
         self._pos = Point(x, y)
         self.vel = Vector(dx, dy)
@@ -40,21 +51,39 @@ class GraphicalEntity(Entity):
 
     @property
     def pos(self):
+        '''Position of the entity. Move it with translate() or by assigning pos, which keep the image
+        and physics in step. Changing the Point in place updates neither.'''
         return self._pos
 
     @pos.setter
     def pos(self, pos):
         self._pos = pos
         self.image.update_position(pos)
+        if self._physics is not None:
+            self._physics.mark_dirty(self)
 
+    @Entity.alive.setter
+    def alive(self, alive):
+        self._alive = alive
+        if self._physics is not None:
+            self._physics.mark_dirty(self)
+
+    @components_only
     @static_update_function
     def _update(self, dt):
         '''Apply update logic. Does not move or draw the entity.'''
         super()._update(dt)
 
+    def translate(self, vector, scale=1):
+        '''Move by vector * scale in place and sync the image.'''
+        self._pos.add_scaled(vector, scale)
+        self.image.update_position(self._pos)
+        if self._physics is not None:
+            self._physics.mark_dirty(self)
+
     def _move(self, dt):
         '''Apply simulation movement logic.'''
-        self.pos += self.vel * dt
+        self.translate(self.vel, dt)
 
     def move(self, dt):
         if self.enable and self.alive and not self.static:
@@ -5,10 +5,15 @@ from .graphical_entity import GraphicalEntity
 
 
 class SimpleGraphicalEntity(GraphicalEntity):
+    __slots__ = ()
+
     def __init__(self, x, y, dx, dy, image, static=False):
         super().__init__(x, y, dx, dy, image, static)
         self.physics = Physics.PhysicsType.Simple
 
+    def __contains__(self, other):
+        return Physics.intersects(self, other)
+
     @property
     def color(self):
         return self.image.color
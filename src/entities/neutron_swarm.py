@@ -0,0 +1,205 @@
+
+import numpy as np
+
+from geometry import EPSILON, Point
+from image import Layer, PointCloudImage
+from util import Physics, ShapeKind
+
+from .entity import Entity
+
+# todo:
+# energy dependent speeds once moderation is modelled
+# share the point kernels with util.narrowphase instead of mirroring them in hits()
+
+WHITE = (255, 255, 255, 255)
+_EMPTY = (0., 0., 0., 0.)  # box of a swarm without live neutrons, told apart by identity
+
+
+class NeutronSwarm(Entity):
+    '''Whole neutron population stored as arrays and registered with physics as one entity.
+
+    Each neutron is a row of positions, velocities, energy (group index) and age, live marks the ones
+    still in flight and dead rows are compacted away on prepare. Physics sees a single rectangle
+    around the live neutrons, so a collision handler for NeutronSwarm should be registered with
+    narrowphase=False. It gets (swarm, other) once per overlapping entity and narrows it down to
+    neutrons with hits(). Neutrons are points to the tests, as Neutron is to the narrowphase.
+    A swarm with no live neutrons has an empty box and collides with nothing.'''
+    shape_kind = ShapeKind.Rectangle
+    collision_mask = Physics.Category.ALL & ~(Physics.Category.PARTICLE | Physics.Category.NEUTRON)
+    _physics = None  # backend the swarm is registered with, told when its box changes
+    COLUMNS = ('positions', 'velocities', 'energy', 'age', 'live')
+
+    def __init__(self, radius=3, bounds=None, capacity=1024, color=WHITE):
+        super().__init__()
+        self.radius = radius  # of every neutron, for the swarm's box
+        self.bounds = bounds  # (min_x, min_y, max_x, max_y) kill border, or None
+        self.static = False
+        self.physics = Physics.PhysicsType.Complex
+
+        self.positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.energy = np.zeros(capacity, dtype=np.int8)
+        self.age = np.zeros(capacity)
+        self.live = np.zeros(capacity, dtype=bool)
+        self._n = 0  # rows in use, live or awaiting compaction
+        self._box = _EMPTY  # (left, bottom, right, top) around the live neutrons
+
+        self.image = PointCloudImage(color, Layer.FOREGROUND)
+
+    def __repr__(self):
+        return f'{type(self).__name__}(id={self.id}, n={len(self)})'
+
+    @Entity.alive.setter
+    def alive(self, alive):
+        self._alive = alive
+        if self._physics is not None:
+            self._physics.mark_dirty(self)
+
+    @property
+    def collision_category(self):
+        '''NEUTRON, or NONE while the swarm is empty so it is paired with nothing.'''
+        return Physics.Category.NONE if self._box is _EMPTY else Physics.Category.NEUTRON
+
+    def __len__(self):
+        return int(np.count_nonzero(self.live[:self._n]))
+
+    def _grow(self, n):
+        capacity = max(2 * len(self.live), n)
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, np.resize(column, (capacity,) + column.shape[1:]))  # new rows are set on emit
+
+    def emit(self, xy, dxy, energy=0):
+        '''Add a neutron at each (x, y) row of xy moving at the matching (dx, dy) row of dxy.'''
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        start = self._n
+        end = start + len(xy)
+        if end > len(self.live):
+            self._grow(end)
+        self.positions[start:end] = xy
+        self.velocities[start:end] = np.asarray(dxy, dtype=np.float64).reshape(-1, 2)
+        self.energy[start:end] = energy
+        self.age[start:end] = 0.
+        self.live[start:end] = True
+        self._n = end
+        self._refresh()
+
+    def absorb(self, rows):
+        '''Kill the neutrons picked by a row mask (e.g. from hits()) or row indices.'''
+        self.live[:self._n][rows] = False
+
+    def compact(self):
+        '''Drop dead rows, keeping live neutrons in order.'''
+        n = self._n
+        live = self.live[:n]
+        k = int(np.count_nonzero(live))
+        if k < n:
+            for name in ('positions', 'velocities', 'energy', 'age'):
+                column = getattr(self, name)
+                column[:k] = column[:n][live]
+            self.live[:k] = True
+            self._n = k
+
+    def cull(self, min_x, min_y, max_x, max_y):
+        '''Kill live neutrons outside the box. Returns how many.'''
+        n = self._n
+        x = self.positions[:n, 0]
+        y = self.positions[:n, 1]
+        out = self.live[:n] & ((x < min_x) | (x > max_x) | (y < min_y) | (y > max_y))
+        self.live[:n] &= ~out
+        return int(np.count_nonzero(out))
+
+    def hits(self, entity):
+        '''Row mask of the live neutrons inside entity, with the narrowphase's point tests.'''
+        n = self._n
+        x = self.positions[:n, 0]
+        y = self.positions[:n, 1]
+        kind = entity.shape_kind
+        if kind == ShapeKind.Rectangle:
+            inside = (entity.left_x < x) & (x < entity.right_x) & (entity.bottom_y < y) & (y < entity.top_y)
+        elif kind == ShapeKind.Circle:
+            cx, cy = entity.pos.coordinates
+            inside = np.hypot(x - cx, y - cy) < entity.radius
+        else:
+            px, py = entity.pos.coordinates
+            inside = (np.abs(x - px) < EPSILON) & (np.abs(y - py) < EPSILON)
+        return inside & self.live[:n]
+
+    def static_regions(self):
+        '''Static entity (or None) under each row, from one gather on the backend's static raster.'''
+        physics = self._physics if self._physics is not None else Physics
+        n = self._n
+        return physics.static_regions_at(self.positions[:n, 0], self.positions[:n, 1])
+
+    def _refresh(self):
+        '''Recompute the box around the live neutrons, redraw them and tell physics.'''
+        n = self._n
+        live = self.live[:n]
+        xy = self.positions[:n][live]
+        if len(xy):
+            r = self.radius
+            left, bottom = xy.min(axis=0) - r
+            right, top = xy.max(axis=0) + r
+            self._box = (float(left), float(bottom), float(right), float(top))
+        else:
+            self._box = _EMPTY
+        self.image.update_points(xy)
+        if self._physics is not None:
+            self._physics.mark_dirty(self)
+
+    def _update(self, dt):
+        super()._update(dt)
+        self.age[:self._n] += dt
+
+    def _move(self, dt):
+        n = self._n
+        self.positions[:n] += self.velocities[:n] * dt  # dead rows too, cheaper than masking until compacted
+        if self.bounds is not None:
+            self.cull(*self.bounds)
+        self._refresh()
+
+    def move(self, dt):
+        if self.enable and self.alive:
+            self._move(dt)
+
+    def _prepare(self):
+        super()._prepare()
+        self.compact()
+
+    def _destroy(self):
+        self.image._destroy()
+
+    # Box seen by physics, in the same terms as RectangleEntity
+
+    @property
+    def pos(self):
+        return Point._make(self._box[0], self._box[1])
+
+    @property
+    def left_x(self):
+        return self._box[0]
+
+    @property
+    def bottom_y(self):
+        return self._box[1]
+
+    @property
+    def right_x(self):
+        return self._box[2]
+
+    @property
+    def top_y(self):
+        return self._box[3]
+
+    @property
+    def bottom_left(self):
+        return Point._make(self._box[0], self._box[1])
+
+    @property
+    def top_right(self):
+        return Point._make(self._box[2], self._box[3])
+
+    @property
+    def center(self):
+        left, bottom, right, top = self._box
+        return Point._make((left + right) / 2, (bottom + top) / 2)
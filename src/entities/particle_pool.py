@@ -0,0 +1,100 @@
+
+from image import Layer
+from util import Settings
+
+from .entity_simple_shapes import PointEntity
+from .world import WorldProxy
+
+# todo:
+# shrink the free list after a burst so a one-off spike does not pin memory forever
+
+GREY = (128, 128, 128)
+
+
+class Particle(WorldProxy, PointEntity):
+    '''PointEntity which goes back to its pool, image and all, once it is found dead.
+
+    Its components live in a World row, so whole-column systems such as World.cull reach every
+    particle at once. A pooled particle keeps its row and hands it back out with itself.'''
+    __slots__ = ('pool', '_pooled')
+
+    def __init__(self, x, y, dx, dy, color, radius, pool=None):
+        super().__init__(x, y, dx, dy, color, radius)
+        self.pool = pool
+        self._pooled = False  # sitting on the pool's free list
+
+    def _kill(self):
+        super()._kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class ParticlePool:
+    '''Free list of dead particles which emitters reuse instead of allocating new ones.
+
+    A particle is released by its first prepare() after it dies: it is taken out of physics and its
+    image hidden, then acquire() hands it out again with a fresh id, so nothing keyed by the old id
+    can mistake it for the particle it was. reserve() pre-sizes the pool for a target population.'''
+
+    def __init__(self, color=GREY, radius=3, layer=Layer.FOREGROUND):
+        self.color = color
+        self.radius = radius
+        self.layer = layer
+        self.allocated = 0  # particles ever created by this pool
+        self._free = []
+
+    def __len__(self):
+        return len(self._free)
+
+    def __copy__(self):
+        return self  # shared by every particle, copies of particles return to the same pool
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def _create(self):
+        particle = Particle(0, 0, 0, 0, self.color, self.radius, self)
+        particle.layer = self.layer  # row and image
+        self.allocated += 1
+        return particle
+
+    def reserve(self, n):
+        '''Allocate free particles until at least n are waiting.'''
+        while len(self._free) < n:
+            particle = self._create()
+            particle.alive = False
+            self.release(particle)
+
+    def acquire(self, x, y, dx, dy):
+        '''A live particle at (x, y) moving at (dx, dy), reused from the free list when possible.'''
+        if not self._free:
+            particle = self._create()
+        else:
+            particle = self._free.pop()
+            particle._pooled = False
+            particle.id = Settings.next_id()
+            particle.enable = True
+            particle.alive = True
+            particle.color = self.color
+            particle.image.visible = True
+        particle.pos.coordinates = (x, y)
+        particle.vel.x = dx
+        particle.vel.y = dy
+        particle.image.update_position(particle.pos)
+        return particle
+
+    def release(self, particle):
+        '''Put a dead particle on the free list. Releasing it again before reuse does nothing.'''
+        if particle._pooled:
+            return
+        if particle._physics is not None:  # died after physics last refiled it
+            particle._physics.remove_from_sector(particle)
+        particle.image.visible = False
+        particle._pooled = True
+        self._free.append(particle)
+
+    def clear(self):
+        self._free.clear()
+
+
+GlobalParticlePool = ParticlePool()
@@ -0,0 +1,110 @@
+
+from .entity import Entity
+
+# todo:
+# keep the flattened component lists between frames and only rebuild when a repr changes
+
+_SKIP = 0  # not an entity (e.g. an image), never called
+_FLATTEN = 1  # update/prepare only forwards to repr, so run the components directly
+_OPAQUE = 2  # has logic of its own, run its update/prepare as is
+
+
+def _forwards(cls, public, private):
+    return getattr(cls, public) is getattr(Entity, public) \
+        and getattr(getattr(cls, private), 'components_only', False)
+
+
+class UpdatePipeline:
+    '''Runs update and prepare over many entities grouped by class instead of recursing through repr.
+
+    Each class is compiled once into a plan. Classes whose update (or prepare) does nothing but
+    forward to repr make no call of their own, their components are gathered into a flat list for
+    the next round instead. Classes with logic of their own run it as usual, recursion included.
+    Anything in repr which is not an entity, like images, is dropped with one lookup. Components run
+    after every entity of the round before them, grouped by class, rather than depth first.
+
+    static_update_function checks on flattened updates are skipped along with the call.'''
+
+    def __init__(self):
+        self._update_plans = {}  # class to _SKIP, _FLATTEN or _OPAQUE
+        self._prepare_plans = {}  # class to (_SKIP, _FLATTEN or _OPAQUE, overridden _kill or None)
+
+    def _update_plan(self, cls):
+        if not issubclass(cls, Entity):
+            plan = _SKIP
+        elif _forwards(cls, 'update', '_update'):
+            plan = _FLATTEN
+        else:
+            plan = _OPAQUE
+        self._update_plans[cls] = plan
+        return plan
+
+    def _prepare_plan(self, cls):
+        if not issubclass(cls, Entity):
+            plan = (_SKIP, None)
+        else:
+            kill = cls._kill if cls._kill is not Entity._kill else None
+            plan = (_FLATTEN if _forwards(cls, 'prepare', '_prepare') else _OPAQUE, kill)
+        self._prepare_plans[cls] = plan
+        return plan
+
+    @staticmethod
+    def _group(items):
+        groups = {}
+        for item in items:
+            cls = type(item)
+            group = groups.get(cls)
+            if group is None:
+                group = groups[cls] = []
+            group.append(item)
+        return groups
+
+    def update(self, entities, dt):
+        '''update(dt) every entity and, through repr, its components.'''
+        plans = self._update_plans
+        groups = self._group(entities)
+        while groups:
+            components = []
+            for cls, members in groups.items():
+                plan = plans.get(cls)
+                if plan is None:
+                    plan = self._update_plan(cls)
+                if plan == _FLATTEN:
+                    for entity in members:
+                        if entity.enable and entity.alive:
+                            components.extend(entity.repr)
+                elif plan == _OPAQUE:
+                    for entity in members:
+                        entity.update(dt)
+            groups = self._group(components)
+
+    def prepare(self, entities):
+        '''prepare() every entity and, through repr, its components.'''
+        plans = self._prepare_plans
+        groups = self._group(entities)
+        while groups:
+            components = []
+            for cls, members in groups.items():
+                plan = plans.get(cls)
+                if plan is None:
+                    plan = self._prepare_plan(cls)
+                kind, kill = plan
+                if kind == _FLATTEN:
+                    for entity in members:
+                        if entity.alive:
+                            if entity.enable:
+                                components.extend(entity.repr)
+                        elif kill is not None:
+                            kill(entity)
+                elif kind == _OPAQUE:
+                    for entity in members:
+                        entity.prepare()
+            groups = self._group(components)
+
+    def clear(self):
+        '''Forget compiled plans, e.g. after patching a class's update.'''
+        self._update_plans.clear()
+        self._prepare_plans.clear()
+
+
+GlobalPipeline = UpdatePipeline()
@@ -0,0 +1,309 @@
+
+import weakref
+
+import numpy as np
+
+from geometry import Point, Vector
+
+
+class World:
+    '''Struct-of-arrays storage for entity components.
+
+    Each entity owns one row, its slot, for as long as it lives, and every component is a contiguous
+    column indexed by slot. Systems run over whole columns at once. Bare rows are moved by integrate,
+    rows backing a WorldProxy move through the proxy's own move(). Released rows go on a free list
+    and are handed out again before the columns grow. Columns are replaced when they grow, so do not
+    keep references to them across spawns.'''
+    COLUMNS = ('pos', 'vel', 'radius', 'temperature', 'alive', 'layer', '_used', '_owned')
+
+    def __init__(self, capacity=256):
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.radius = np.zeros(capacity)
+        self.temperature = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.layer = np.zeros(capacity, dtype=np.int8)
+        self._used = np.zeros(capacity, dtype=bool)  # handed out and not yet released
+        self._owned = np.zeros(capacity, dtype=bool)  # backs a proxy entity
+        self._size = 0  # rows below this have been handed out at least once
+        self._free = []  # released rows, reused before growing
+        self._proxies = weakref.WeakValueDictionary()  # slot to proxy entity
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self._size]))
+
+    @property
+    def capacity(self):
+        return len(self.alive)
+
+    def _grow(self):
+        capacity = 2 * self.capacity
+        for name in self.COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, np.resize(column, (capacity,) + column.shape[1:]))  # new rows are set on spawn
+
+    def spawn(self, x, y, dx=0., dy=0., radius=0., temperature=0., layer=0):
+        '''Hand out a live row and return its slot.'''
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._size == self.capacity:
+                self._grow()
+            slot = self._size
+            self._size += 1
+        self.pos[slot] = x, y
+        self.vel[slot] = dx, dy
+        self.radius[slot] = radius
+        self.temperature[slot] = temperature
+        self.alive[slot] = True
+        self.layer[slot] = layer
+        self._used[slot] = True
+        self._owned[slot] = False
+        return slot
+
+    def spawn_many(self, xy, dxy, radius=0., temperature=0., layer=0):
+        '''Hand out a live row for each (x, y) and (dx, dy) and return their slots.
+
+        The other components may be scalars or one value per row.'''
+        xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        n = len(xy)
+        reused = min(n, len(self._free))
+        slots = np.empty(n, dtype=np.intp)
+        if reused:
+            slots[:reused] = self._free[-reused:]
+            del self._free[-reused:]
+        fresh = n - reused
+        while self._size + fresh > self.capacity:
+            self._grow()
+        slots[reused:] = np.arange(self._size, self._size + fresh)
+        self._size += fresh
+
+        self.pos[slots] = xy
+        self.vel[slots] = np.asarray(dxy, dtype=np.float64).reshape(-1, 2)
+        self.radius[slots] = radius
+        self.temperature[slots] = temperature
+        self.alive[slots] = True
+        self.layer[slots] = layer
+        self._used[slots] = True
+        self._owned[slots] = False
+        return slots
+
+    def copy_row(self, source, slot):
+        for name in ('pos', 'vel', 'radius', 'temperature', 'alive', 'layer'):
+            column = getattr(self, name)
+            column[slot] = column[source]
+
+    def release(self, slot):
+        '''Return a row to the free list. The slot must not be used afterwards.'''
+        self.alive[slot] = False
+        self._used[slot] = False
+        self._owned[slot] = False
+        self._free.append(slot)
+
+    def slots(self):
+        '''Slots of every live row.'''
+        return np.flatnonzero(self.alive[:self._size])
+
+    def collect(self):
+        '''Release dead rows which no proxy holds on to. Returns how many were released.'''
+        n = self._size
+        dead = np.flatnonzero(self._used[:n] & ~self.alive[:n] & ~self._owned[:n])
+        self._used[dead] = False
+        self._free.extend(dead.tolist())
+        return len(dead)
+
+    def clear(self):
+        '''Release every bare row. Proxies keep theirs.'''
+        n = self._size
+        self.alive[:n] &= self._owned[:n]
+        self.collect()
+
+    def _notify(self, slots):
+        '''Tell physics about proxies whose rows a system changed behind their back.'''
+        proxies = self._proxies
+        for slot in slots[self._owned[slots]].tolist():
+            entity = proxies.get(slot)
+            if entity is not None and entity._physics is not None:
+                entity._physics.mark_dirty(entity)
+
+    # Systems
+
+    def integrate(self, dt):
+        '''Move every live bare row by vel * dt.'''
+        n = self._size
+        moving = (self.alive[:n] & ~self._owned[:n])[:, np.newaxis]
+        np.add(self.pos[:n], self.vel[:n] * dt, out=self.pos[:n], where=moving)
+
+    def cull(self, min_x, min_y, max_x, max_y):
+        '''Kill every live row outside the box and return their slots.'''
+        n = self._size
+        x = self.pos[:n, 0]
+        y = self.pos[:n, 1]
+        killed = np.flatnonzero(self.alive[:n] & ((x < min_x) | (x > max_x) | (y < min_y) | (y > max_y)))
+        self.alive[killed] = False
+        self._notify(killed)
+        return killed
+
+    def dissipate(self, dt, coefficient, minimum=None):
+        '''Cool every live row by T * coefficient * dt, as Thermal.dissipate does for one entity.'''
+        n = self._size
+        live = self.alive[:n]
+        temperature = self.temperature[:n]
+        np.subtract(temperature, temperature * coefficient * dt, out=temperature, where=live)
+        if minimum is not None:
+            np.maximum(temperature, minimum, out=temperature, where=live)
+
+
+GlobalWorld = World()
+
+
+def _number(name, value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise TypeError(f'\'{name}\' must be a number')
+
+
+def _row_coordinate(column, axis, name=None):
+    '''Property over one axis of a row in a World column. Validated like Coordinate when named.'''
+    def get(self):
+        return float(getattr(self._world, column)[self._slot, axis])
+
+    if name is None:
+        def set(self, value):
+            getattr(self._world, column)[self._slot, axis] = value
+    else:
+        def set(self, value):
+            getattr(self._world, column)[self._slot, axis] = _number(name, value)
+    return property(get, set)
+
+
+class RowPoint(Point):
+    '''Point whose coordinates are a row of World.pos, so in place ops write the column.'''
+    __slots__ = ('_world', '_slot')
+
+    _x = _row_coordinate('pos', 0)
+    _y = _row_coordinate('pos', 1)
+    x = _row_coordinate('pos', 0, 'x')
+    y = _row_coordinate('pos', 1, 'y')
+
+    def __init__(self, world, slot):
+        self._world = world
+        self._slot = slot
+
+    def __copy__(self):
+        return Point._make(self._x, self._y)  # detached from the row
+
+    def __deepcopy__(self, memo):
+        result = Point._make(self._x, self._y)
+        memo[id(self)] = result
+        return result
+
+
+class RowVector(Vector):
+    '''Vector whose components are a row of World.vel, so in place ops write the column.'''
+    __slots__ = ('_world', '_slot')
+
+    _x = _row_coordinate('vel', 0)
+    _y = _row_coordinate('vel', 1)
+    x = _row_coordinate('vel', 0, 'x')
+    y = _row_coordinate('vel', 1, 'y')
+
+    def __init__(self, world, slot):
+        self._world = world
+        self._slot = slot
+
+    def __copy__(self):
+        return Vector._make(self._x, self._y)  # detached from the row
+
+    def __deepcopy__(self, memo):
+        result = Vector._make(self._x, self._y)
+        memo[id(self)] = result
+        return result
+
+
+class WorldProxy:
+    '''Mixin keeping a graphical entity's components in a World row instead of on the instance.
+
+    List it before the entity class, e.g. `class Particle(WorldProxy, PointEntity)`. pos and vel
+    become views of the row, so the usual Entity API (translate, vel.x = ..., alive = False, ...)
+    reads and writes the columns and whole column systems see the entity. The entity still moves
+    itself through move(), so scripted and controlled entities behave as before. Assigning pos or
+    vel copies the value into the row. The row is released once the proxy is garbage collected.'''
+    world = GlobalWorld
+
+    def __init__(self, *args, **kw):
+        self._attach()
+        super().__init__(*args, **kw)
+        image = self.image
+        self.world.radius[self._slot] = getattr(image, 'radius', 0.)
+        self.world.layer[self._slot] = getattr(image, 'layer', 0)
+
+    def _attach(self, source=None):
+        world = self.world
+        slot = world.spawn(0., 0.)
+        if source is not None:
+            world.copy_row(source, slot)
+        world._owned[slot] = True
+        world._proxies[slot] = self
+        weakref.finalize(self, world.release, slot)
+        self._slot = slot
+        self._row_pos = RowPoint(world, slot)
+        self._row_vel = RowVector(world, slot)
+
+    def __deepcopy__(self, memo):
+        result = super().__deepcopy__(memo)
+        result._attach(self._slot)  # a copy gets a row of its own
+        return result
+
+    @property
+    def _pos(self):
+        return self._row_pos
+
+    @_pos.setter
+    def _pos(self, pos):
+        self.world.pos[self._slot] = pos.coordinates
+
+    @property
+    def vel(self):
+        return self._row_vel
+
+    @vel.setter
+    def vel(self, vel):
+        self.world.vel[self._slot] = vel.x, vel.y
+
+    @property
+    def alive(self):
+        return bool(self.world.alive[self._slot])
+
+    @alive.setter
+    def alive(self, alive):
+        self.world.alive[self._slot] = alive
+        if self._physics is not None:
+            self._physics.mark_dirty(self)
+
+    @property
+    def radius(self):
+        return float(self.world.radius[self._slot])
+
+    @radius.setter
+    def radius(self, radius):
+        self.world.radius[self._slot] = radius
+        self.image.radius = radius
+
+    @property
+    def temperature(self):
+        return float(self.world.temperature[self._slot])
+
+    @temperature.setter
+    def temperature(self, temperature):
+        self.world.temperature[self._slot] = temperature
+
+    @property
+    def layer(self):
+        return int(self.world.layer[self._slot])
+
+    @layer.setter
+    def layer(self, layer):
+        self.world.layer[self._slot] = layer
+        self.image.layer = layer
@@ -1,15 +1,13 @@
 
 import pyglet
 
-from entities import (Atom, ControlRod, Moveable, Neutron,  # noqa: F401
+from entities import (Atom, Collisions, Components, ControlRod,  # noqa: F401
+                      Decay, Moveable, Neutron, Particles, Pipeline,
                       PointEntity, TestEmitter, Thermal, Water)
 from image import ScreenGrid, draw_primitives
 from util import Physics, Settings
 
 
-def get_per_frame_chance(chance_per_second, frames_per_second):
-    return chance_per_second / frames_per_second
-
 # todo:
 # add static to graphical entities
 
@@ -39,6 +37,12 @@ class Game:
         Thermal.register_dissipation_coefficient(Water, 0.15)
         Thermal.register_dissipation_coefficient(Moveable, 1)
 
+        Collisions.clear()
+        Collisions.register(Water, Moveable, self._transfer_heat)
+        # emitted points only, as the type check this replaced, neutrons are left alone. Particles are culled
+        # over their World rows in the game loop
+        Collisions.register_entity(PointEntity, self._kill_escaped, exact=True)
+
         # State variables
         self.tt = 0.0  # track time for printing
         self.iter = 0  # iterations between prints
@@ -60,21 +64,42 @@ class Game:
         # place water
         # place control rods
 
+        Decay.clear()
+        Particles.clear()
+        Physics.clear()
+
         self.gui = []
+        self.screen_grid = None
+        self.screen_grid_version = None  # Physics.grid_version the overlay was drawn for
         self.new_entities = []
         self.cur_entities = [
             TestEmitter(Settings.WIDTH/2, Settings.HEIGHT/2, 3, self.new_entities, 5),
             Water(Settings.WIDTH/2, 0, Settings.WIDTH/2, Settings.HEIGHT/2),
-            # Atom(Settings.WIDTH/2, Settings.HEIGHT/2, 0, 0, 10, 3, get_per_frame_chance(10, Settings.FPS), Neutron(0, 0, self.DEFAULT_SPEED, 0, 3), self.new_entities),  # noqa: E501)
+            # Atom(Settings.WIDTH/2, Settings.HEIGHT/2, 0, 0, 10, 3, 10, Neutron(0, 0, self.DEFAULT_SPEED, 0, 3), self.new_entities),  # noqa: E501)
             # ControlRod(150, 50, 10, Settings.HEIGHT-150, 10, 0, Settings.WIDTH, 0, Settings.HEIGHT, self.window),
             Moveable(100, 100, self.DEFAULT_SPEED, 5, self.window, tuple())
         ]
 
         for e in self.cur_entities:
             Physics.add_to_sector(e)
-
-        if Settings.PHYSICS_GRID:
-            self.gui.append(ScreenGrid(0, 0, Settings.PHYSICS_DIVISIONS, Settings.PHYSICS_DIVISIONS, 3, (32, 32, 32)))
+            if isinstance(e, Atom):
+                e.radioactivity.schedule(Decay)
+        Physics.rebuild()  # size the grid for the starting layout
+        self._update_screen_grid()
+
+    def _update_screen_grid(self):
+        '''Draw the physics sectors, again whenever the grid was rebuilt, e.g. by an auto retune.'''
+        if not Settings.PHYSICS_GRID or not hasattr(Physics, 'divisions_x'):  # only grid backends have sectors to draw
+            return
+        if self.screen_grid_version == Physics.grid_version:
+            return
+        if self.screen_grid is not None:
+            self.gui.remove(self.screen_grid)
+            self.screen_grid._destroy()
+        self.screen_grid = ScreenGrid(0, 0, Physics.divisions_x, Physics.divisions_y, 3, (32, 32, 32),
+                                      Physics.cell_width, Physics.cell_height)
+        self.screen_grid_version = Physics.grid_version
+        self.gui.append(self.screen_grid)
 
     def _game_loop(self, dt):
         ott = self.tt
@@ -83,49 +108,31 @@ class Game:
         if self.tt < ott:
             print(f'Simulation Size:  {len(self.cur_entities)}, iter={self.iter}')
             print(f'Physics Entities: {len(Physics.get_registered_entities())}')
+            print(f'Static Entities:  {len(Physics.get_static_entities())}')
             self.iter = 0
 
         # GENERAL LOGIC
-        for e in self.cur_entities:
-            e.update(dt)
+        Decay.update(dt)
+        Pipeline.update(self.cur_entities, dt)  # components without logic of their own are never called
 
         # PHYSICS
-        for e1 in Physics.get_registered_entities():
-            # Collisions
-            for e2 in Physics.get_neighbour_entities(e1):
-                if e1.id == e2.id:
-                    continue
-                if e1 in e2:
-                    if type(e2) is Water and not e1.static and not e2.static:
-                        e1.pos -= e1.vel * dt
-                        if e2.left_x < e1.pos.x < e2.right_x:  # if top/bottom or left/right reflection
-                            e1.vel.y *= -1
-                        else:
-                            e1.vel.x *= -1
-
-                    if type(e1) is Water and type(e2) is Moveable:
-                        e1.thermal.transfer(e2.thermal, dt)
-
-            # Static Events
-            if type(e1) is PointEntity \
-                    and (e1.pos.x > self.MAX_X
-                         or e1.pos.x < self.MIN_X
-                         or e1.pos.y > self.MAX_Y
-                         or e1.pos.y < self.MIN_Y):
-                e1.alive = False
-
-            if type(e1) is PointEntity and not e1.alive:
-                e1.color = (255, 0, 0)
-
-        Physics.update_sectors(Physics.get_registered_entities())
+        # Collisions, only pairs with a registered handler reach the narrowphase
+        Collisions.run(Physics.get_candidate_pairs(), dt)
+
+        # Static Events
+        Collisions.run_entities(Physics.get_registered_entities(), dt)
+        Components.cull(self.MIN_X, self.MIN_Y, self.MAX_X, self.MAX_Y)  # escaped particles, marked dirty in Physics
+        Components.collect()
+
+        Physics.update_sectors()  # only entities which moved or died since the last update
+        self._update_screen_grid()  # may have retuned the grid
 
         # UPDATE POSITIONS
         for e in self.cur_entities:
             e.move(dt)
 
         # PREPARE ELEMENTS
-        for e in self.cur_entities:
-            e.prepare()
+        Pipeline.prepare(self.cur_entities)
 
         # DELETE ELEMENTS
         self.cur_entities = list(filter(lambda e: e.alive is True, self.cur_entities))
@@ -136,6 +143,19 @@ class Game:
             Physics.add_to_sector(e)
         self.new_entities.clear()  # fed into other objects so must maintain reference
 
+    # COLLISION HANDLERS
+    def _transfer_heat(self, pairs, dt):
+        for water, moveable in pairs:
+            water.thermal.transfer(moveable.thermal, dt)
+
+    def _kill_escaped(self, entities, dt):
+        for e in entities:
+            if e.pos.x > self.MAX_X or e.pos.x < self.MIN_X or e.pos.y > self.MAX_Y or e.pos.y < self.MIN_Y:
+                e.alive = False
+
+            if not e.alive:
+                e.color = (255, 0, 0)
+
     def start_game(self):
         pyglet.clock.schedule_interval(self._game_loop, 1/Settings.FPS)
         pyglet.app.run()
@@ -2,3 +2,4 @@ from .constants import EPSILON  # noqa: F401
 from .coordinate import Coordinate  # noqa: F401
 from .point import Point  # noqa: F401
 from .vector import Vector  # noqa: F401
+from .vector_array import VectorArray  # noqa: F401
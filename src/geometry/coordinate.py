@@ -4,16 +4,24 @@
 # rename coordinate to something akin to a protected value
 
 class Coordinate:
-    '''Handles a 1D coordinate point.'''
+    '''Handles a 1D coordinate point.
+
+    Values live in the owner's `_<name>` slot. Public writes are validated here, internal code
+    may read and write the slot directly once it knows the value is already a float.'''
+    __slots__ = ('_name', '_slot')
+
     def __set_name__(self, owner, name):
         self._name = name
+        self._slot = owner.__dict__[f'_{name}']  # member descriptor created by the owner's __slots__
 
     def __get__(self, instance, owner):
-        return instance.__dict__[self._name]
+        if instance is None:
+            return self
+        return self._slot.__get__(instance, owner)
 
     def __set__(self, instance, value):
         try:
-            instance.__dict__[self._name] = float(value)
-            return
-        except ValueError:
+            value = float(value)
+        except (TypeError, ValueError):
             raise TypeError(f'\'{self._name}\' must be a number')
+        self._slot.__set__(instance, value)
@@ -0,0 +1,106 @@
+
+import numpy as np
+
+from .constants import EPSILON
+
+# todo:
+# allow float32 storage for very large populations
+
+
+class CoordinateArray:
+    '''Handles a contiguous (N, 2) block of 2D coordinates stored in a numpy array.'''
+    _element = None  # single element type handed out when indexed, built with its trusted _make
+
+    def __init__(self, xy):
+        data = np.array(xy, dtype=np.float64)
+        if data.size == 0:
+            data = data.reshape(0, 2)
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise ValueError(f'{type(self).__name__} requires an (N, 2) array, got shape {data.shape}')
+        self.data = data
+
+    @classmethod
+    def _wrap(cls, data):
+        '''Wrap an existing (N, 2) float array without copying or validating it.'''
+        result = cls.__new__(cls)
+        result.data = data
+        return result
+
+    @classmethod
+    def from_xy(cls, x, y):
+        return cls._wrap(np.column_stack((np.asarray(x, dtype=np.float64),
+                                          np.asarray(y, dtype=np.float64))))
+
+    @classmethod
+    def zeros(cls, n):
+        return cls._wrap(np.zeros((n, 2), dtype=np.float64))
+
+    def __repr__(self):
+        return f'{type(self).__name__}(n={len(self)})'
+
+    def __str__(self):
+        return str(self.data.tolist())
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        element = self._element._make
+        for x, y in self.data.tolist():  # tolist() hands out Python floats, as _make expects
+            yield element(x, y)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            x, y = self.data[index].tolist()
+            return self._element._make(x, y)
+        return self._wrap(self.data[index])  # slices and masks share memory with this array
+
+    def __setitem__(self, index, value):
+        if isinstance(value, CoordinateArray):
+            self.data[index] = value.data
+        elif isinstance(value, self._element):
+            self.data[index] = (value.x, value.y)
+        else:
+            raise TypeError(f'cannot assign \'{type(value).__name__}\' to \'{type(self).__name__}\'')
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            # Allow sufficiently small differences to match
+            return self.data.shape == other.data.shape \
+                and bool(np.all(np.abs(self.data - other.data) < EPSILON))
+        return False
+
+    def __copy__(self):
+        return self._wrap(self.data.copy())
+
+    def __deepcopy__(self, memo):
+        result = self._wrap(self.data.copy())
+        memo[id(self)] = result
+        return result
+
+    def copy(self):
+        return self.__copy__()
+
+    @property
+    def x(self):
+        return self.data[:, 0]
+
+    @x.setter
+    def x(self, x):
+        self.data[:, 0] = x
+
+    @property
+    def y(self):
+        return self.data[:, 1]
+
+    @y.setter
+    def y(self, y):
+        self.data[:, 1] = y
+
+    @property
+    def coordinates(self):
+        return self.data
+
+    @coordinates.setter
+    def coordinates(self, xy):
+        self.data[:] = xy
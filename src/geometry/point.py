@@ -1,6 +1,4 @@
 
-from copy import deepcopy
-
 from .constants import EPSILON
 from .coordinate import Coordinate
 from .vector import Vector
@@ -8,30 +6,40 @@ from .vector import Vector
 
 class Point:
     '''Handles a 2D point on the screen.'''
+    __slots__ = ('_x', '_y')
+
     x = Coordinate()
     y = Coordinate()
 
     @staticmethod
     def from_origin(vector):
-        return Point(vector.x, vector.y)
+        return Point._make(vector._x, vector._y)
 
     @staticmethod
     def from_coordinates(x_y):
         return Point(x_y[0], x_y[1])
 
+    @classmethod
+    def _make(cls, x, y):
+        '''Trusted constructor which skips validation. x and y must already be floats.'''
+        result = object.__new__(cls)
+        result._x = x
+        result._y = y
+        return result
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
 
     def __repr__(self):
-        return f'{type(self).__name__}(x={self.x}, y={self.y})'
+        return f'{type(self).__name__}(x={self._x}, y={self._y})'
 
     def __str__(self):
-        return f'({round(self.x, 2)}, {round(self.y, 2)})'
+        return f'({round(self._x, 2)}, {round(self._y, 2)})'
 
     def __add__(self, other):
         if isinstance(other, Vector):
-            return Point(self.x + other.x, self.y + other.y)
+            return Point._make(self._x + other._x, self._y + other._y)
         raise TypeError(f'unsupported operand type(s) for +: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
     def __radd__(self, other):
@@ -39,13 +47,13 @@ class Point:
 
     def __sub__(self, other):
         if isinstance(other, Vector):
-            return Point(self.x - other.x, self.y - other.y)
+            return Point._make(self._x - other._x, self._y - other._y)
         raise TypeError(f'unsupported operand type(s) for -: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
     def __eq__(self, other):
         if isinstance(other, Point):
             # Allow sufficiently small differences to match
-            return abs(self.x - other.x) < EPSILON and abs(self.y - other.y) < EPSILON
+            return abs(self._x - other._x) < EPSILON and abs(self._y - other._y) < EPSILON
         return False
 
     # def __ne__(self, other):
@@ -55,35 +63,35 @@ class Point:
 
     def __iadd__(self, other):
         if isinstance(other, Vector):
-            self.x = self.x + other.x
-            self.y = self.y + other.y
+            self._x += other._x
+            self._y += other._y
             return self
         raise TypeError(f'unsupported operand type(s) for +=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
     def __isub__(self, other):
         if isinstance(other, Vector):
-            self.x = self.x - other.x
-            self.y = self.y - other.y
+            self._x -= other._x
+            self._y -= other._y
             return self
         raise TypeError(f'unsupported operand type(s) for -=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
     def __copy__(self):
-        cls = self.__class__
-        result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
-        return result
+        return self._make(self._x, self._y)
 
     def __deepcopy__(self, memo):
-        cls = self.__class__
-        result = cls.__new__(cls)
+        result = self._make(self._x, self._y)  # coordinates are immutable floats
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            setattr(result, k, deepcopy(v, memo))
         return result
 
+    def add_scaled(self, vector, scale):
+        '''In place `self += vector * scale` without building the intermediate vector.'''
+        self._x += vector._x * scale
+        self._y += vector._y * scale
+        return self
+
     @property
     def coordinates(self):
-        return self.x, self.y
+        return self._x, self._y
 
     @coordinates.setter
     def coordinates(self, x_y):
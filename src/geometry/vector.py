@@ -1,6 +1,5 @@
 
 import math
-from copy import deepcopy
 
 from .constants import EPSILON
 from .coordinate import Coordinate
@@ -12,6 +11,8 @@ from .coordinate import Coordinate
 
 class Vector:
     '''Handles a vector on a 2D plane with origin of (0,0).'''
+    __slots__ = ('_x', '_y')
+
     x = Coordinate()
     y = Coordinate()
 
@@ -25,11 +26,11 @@ class Vector:
 
     @staticmethod
     def from_origin(point):
-        return Vector(point.x, point.y)
+        return Vector._make(point._x, point._y)
 
     @staticmethod
     def from_positions(point1, point2):
-        return Vector(point2.x - point1.x, point2.y - point1.y)
+        return Vector._make(point2._x - point1._x, point2._y - point1._y)
 
     @staticmethod
     def unit_horizontal():
@@ -43,25 +44,33 @@ class Vector:
     def unit_diagonal():
         return Vector(1, 1).normalize()
 
+    @classmethod
+    def _make(cls, x, y):
+        '''Trusted constructor which skips validation. x and y must already be floats.'''
+        result = object.__new__(cls)
+        result._x = x
+        result._y = y
+        return result
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
 
     def __repr__(self):
-        return f'{type(self).__name__}(dx={self.x}, dy={self.y})'
+        return f'{type(self).__name__}(dx={self._x}, dy={self._y})'
 
     def __str__(self):
-        return f'[{self.x}, {self.y}]'
+        return f'[{self._x}, {self._y}]'
 
     def __add__(self, other):
         if isinstance(other, Vector):
-            return Vector(self.x + other.x, self.y + other.y)
+            return Vector._make(self._x + other._x, self._y + other._y)
         raise TypeError(f'unsupported operand type(s) for +: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
     def __sub__(self, other):
         if isinstance(other, Vector):
             # vector subtraction
-            return Vector(self.x - other.x, self.y - other.y)
+            return Vector._make(self._x - other._x, self._y - other._y)
         raise TypeError(f'unsupported operand type(s) for -: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
     def __mul__(self, other):
@@ -73,7 +82,7 @@ class Vector:
         elif isinstance(other, bool):  # disallow bool since it inherits from int
             pass
         elif isinstance(other, (int, float)):
-            return Vector(self.x * other, self.y * other)
+            return Vector._make(self._x * other, self._y * other)
         raise TypeError(f'unsupported operand type(s) for *: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
     def __truediv__(self, other):
@@ -81,18 +90,18 @@ class Vector:
             pass
         elif isinstance(other, (int, float)):
             # vector scaling
-            return Vector(self.x / other, self.y / other)
+            return Vector._make(self._x / other, self._y / other)
         raise TypeError(f'unsupported operand type(s) for /: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
     def __floordiv__(self, other):
         if isinstance(other, bool):  # disallow bool since it inherits from int
             pass
         elif isinstance(other, (int, float)):
-            return Vector(self.x // other, self.y // other)
+            return Vector._make(self._x // other, self._y // other)
         raise TypeError(f'unsupported operand type(s) for //: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
     def __neg__(self):
-        return Vector(-self.x, -self.y)
+        return Vector._make(-self._x, -self._y)
 
     def __lt__(self, other):
         if isinstance(other, Vector):
@@ -107,7 +116,7 @@ class Vector:
     def __eq__(self, other):
         if isinstance(other, Vector):
             # Allow sufficiently small differences to match
-            return abs(self.x - other.x) < EPSILON and abs(self.y - other.y) < EPSILON
+            return abs(self._x - other._x) < EPSILON and abs(self._y - other._y) < EPSILON
         return False
 
     # def __ne__(self, other):
@@ -127,15 +136,15 @@ class Vector:
 
     def __iadd__(self, other):
         if isinstance(other, Vector):
-            self.x = self.x + other.x
-            self.y = self.y + other.y
+            self._x += other._x
+            self._y += other._y
             return self
         raise TypeError(f'unsupported operand type(s) for +=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
     def __isub__(self, other):
         if isinstance(other, Vector):
-            self.x = self.x - other.x
-            self.y = self.y - other.y
+            self._x -= other._x
+            self._y -= other._y
             return self
         raise TypeError(f'unsupported operand type(s) for -=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
@@ -143,8 +152,8 @@ class Vector:
         if isinstance(other, bool):  # disallow bool since it inherits from int
             pass
         elif isinstance(other, (int, float)):
-            self.x = self.x * other
-            self.y = self.y * other
+            self._x *= other
+            self._y *= other
             return self
         raise TypeError(f'unsupported operand type(s) for *=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
@@ -152,8 +161,8 @@ class Vector:
         if isinstance(other, bool):  # disallow bool since it inherits from int
             pass
         elif isinstance(other, (int, float)):
-            self.x = self.x / other
-            self.y = self.y / other
+            self._x /= other
+            self._y /= other
             return self
         raise TypeError(f'unsupported operand type(s) for /=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
 
@@ -161,35 +170,35 @@ class Vector:
         if isinstance(other, bool):  # disallow bool since it inherits from int
             pass
         elif isinstance(other, (int, float)):
-            self.x = self.x // other
-            self.y = self.y // other
+            self._x //= other
+            self._y //= other
             return self
         raise TypeError(f'unsupported operand type(s) for //=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')  # noqa: E501
 
     def __copy__(self):
-        cls = self.__class__
-        result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
-        return result
+        return self._make(self._x, self._y)
 
     def __deepcopy__(self, memo):
-        cls = self.__class__
-        result = cls.__new__(cls)
+        result = self._make(self._x, self._y)  # coordinates are immutable floats
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            setattr(result, k, deepcopy(v, memo))
         return result
 
+    def add_scaled(self, vector, scale):
+        '''In place `self += vector * scale` without building the intermediate vector.'''
+        self._x += vector._x * scale
+        self._y += vector._y * scale
+        return self
+
     def as_cartesian(self):
-        return self.x, self.y
+        return self._x, self._y
 
     @property
     def magnitude(self):
-        return math.dist((0, 0), (self.x, self.y))
+        return math.hypot(self._x, self._y)
 
     @property
     def angle(self):
-        return math.degrees(math.atan2(self.y, self.x))
+        return math.degrees(math.atan2(self._y, self._x))
 
     def normalize(self):
         self /= self.magnitude
@@ -200,12 +209,12 @@ class Vector:
 
     def dot(self, other):
         if isinstance(other, Vector):
-            return self.x * other.x + self.y * other.y
+            return self._x * other._x + self._y * other._y
         raise TypeError(f'unsupported operand type(s) for dot(): \'{type(self).__name__}\' and \'{type(other).__name__}\'')  # noqa: E501
 
     def cross(self, other):
         if isinstance(other, Vector):
-            return self.x * other.y - self.y * other.x
+            return self._x * other._y - self._y * other._x
         raise TypeError(f'unsupported operand type(s) for cross(): \'{type(self).__name__}\' and \'{type(other).__name__}\'')  # noqa: E501
 
     def angle_between(self, other):
@@ -0,0 +1,141 @@
+
+import numbers
+
+import numpy as np
+
+from .coordinate_array import CoordinateArray
+from .vector import Vector
+
+
+def _offsets(other):
+    '''Returns the raw offsets of a Vector or VectorArray operand, or None if unsupported.'''
+    if isinstance(other, VectorArray):
+        return other.data
+    if isinstance(other, Vector):
+        return np.array((other.x, other.y))
+    return None
+
+
+def _scale(other):
+    '''Returns a scalar or per-row scale factor, or None if unsupported.'''
+    if isinstance(other, bool):  # disallow bool since it inherits from int
+        return None
+    if isinstance(other, numbers.Real):  # includes numpy scalars such as np.int64
+        return other
+    if isinstance(other, np.ndarray) and other.ndim == 1:
+        return other[:, np.newaxis]
+    return None
+
+
+class VectorArray(CoordinateArray):
+    '''Handles many vectors on a 2D plane at once. Indexing hands out a single Vector.'''
+    _element = Vector
+
+    @staticmethod
+    def from_vectors(vectors):
+        return VectorArray([(v.x, v.y) for v in vectors])
+
+    @staticmethod
+    def from_polar_degrees(magnitudes, degrees):
+        return VectorArray.from_polar_radians(magnitudes, np.radians(degrees))
+
+    @staticmethod
+    def from_polar_radians(magnitudes, radians):
+        radians = np.asarray(radians, dtype=np.float64)
+        return VectorArray.from_xy(magnitudes * np.cos(radians), magnitudes * np.sin(radians))
+
+    def __add__(self, other):
+        offsets = _offsets(other)
+        if offsets is not None:
+            return VectorArray._wrap(self.data + offsets)
+        raise TypeError(f'unsupported operand type(s) for +: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        offsets = _offsets(other)
+        if offsets is not None:
+            return VectorArray._wrap(self.data - offsets)
+        raise TypeError(f'unsupported operand type(s) for -: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
+
+    def __mul__(self, other):
+        if isinstance(other, (Vector, VectorArray)):  # dot product
+            return self.dot(other)
+        scale = _scale(other)
+        if scale is not None:
+            return VectorArray._wrap(self.data * scale)
+        raise TypeError(f'unsupported operand type(s) for *: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        scale = _scale(other)
+        if scale is not None:
+            return VectorArray._wrap(self.data / scale)
+        raise TypeError(f'unsupported operand type(s) for /: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
+
+    def __neg__(self):
+        return VectorArray._wrap(-self.data)
+
+    def __iadd__(self, other):
+        offsets = _offsets(other)
+        if offsets is not None:
+            self.data += offsets
+            return self
+        raise TypeError(f'unsupported operand type(s) for +=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
+
+    def __isub__(self, other):
+        offsets = _offsets(other)
+        if offsets is not None:
+            self.data -= offsets
+            return self
+        raise TypeError(f'unsupported operand type(s) for -=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
+
+    def __imul__(self, other):
+        scale = _scale(other)
+        if scale is not None:
+            self.data *= scale
+            return self
+        raise TypeError(f'unsupported operand type(s) for *=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
+
+    def __itruediv__(self, other):
+        scale = _scale(other)
+        if scale is not None:
+            self.data /= scale
+            return self
+        raise TypeError(f'unsupported operand type(s) for /=: \'{type(self).__name__}\' and \'{type(other).__name__}\'')
+
+    def as_cartesian(self):
+        return self.x, self.y
+
+    @property
+    def magnitude(self):
+        return np.hypot(self.data[:, 0], self.data[:, 1])
+
+    @property
+    def angle(self):
+        return np.degrees(np.arctan2(self.data[:, 1], self.data[:, 0]))
+
+    def normalize(self):
+        '''Normalize every vector in place. Zero length vectors are left as zero.'''
+        magnitude = self.magnitude[:, np.newaxis]
+        np.divide(self.data, magnitude, out=self.data, where=magnitude != 0)
+        return self
+
+    def as_polar(self):
+        return self.magnitude, self.angle
+
+    def dot(self, other):
+        offsets = _offsets(other)
+        if offsets is not None:
+            return (self.data * offsets).sum(axis=-1)
+        raise TypeError(f'unsupported operand type(s) for dot(): \'{type(self).__name__}\' and \'{type(other).__name__}\'')  # noqa: E501
+
+    def cross(self, other):
+        offsets = _offsets(other)
+        if offsets is not None:
+            offsets = np.broadcast_to(offsets, self.data.shape)
+            return self.data[:, 0] * offsets[:, 1] - self.data[:, 1] * offsets[:, 0]
+        raise TypeError(f'unsupported operand type(s) for cross(): \'{type(self).__name__}\' and \'{type(other).__name__}\'')  # noqa: E501
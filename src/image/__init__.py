@@ -1,4 +1,5 @@
 from .circle_image import CircleImage  # noqa: F401
+from .point_cloud_image import PointCloudImage  # noqa: F401
 from .rectangle_image import RectangleImage  # noqa: F401
 from .screen_grid import ScreenGrid  # noqa: F401
 from .shapes import Layer, draw_primitives  # noqa: F401
@@ -3,6 +3,8 @@ from .shapes import Circle
 
 
 class CircleImage(SimpleImage):
+    __slots__ = ()
+
     def __init__(self, bx, by, color, radius):
         shape = Circle(ox=0,
                        oy=0,
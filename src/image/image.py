@@ -9,6 +9,8 @@
 
 
 class Image:
+    __slots__ = ('_named_shapes',)
+
     def __init__(self, bx, by):
         super().__init__()
 
@@ -43,8 +45,7 @@ class Image:
             shape.layer = layer
 
     def update_position(self, new_pos):
-        for shape in self.shapes:
-            # dv = Vector.from_positions(shape.pos, new_pos)
+        for shape in self._named_shapes.values():
             shape.move_to(new_pos)
 
     def _destroy(self):
@@ -6,6 +6,7 @@ from .image import Image
 
 class SimpleImage(Image):
     '''Convinience class for images with 1 shape. Shortcuts several operations on Image.'''
+    __slots__ = ()
     _base_name = 'base'
 
     def __init__(self, bx, by, shape):
@@ -51,3 +52,11 @@ class SimpleImage(Image):
     @layer.setter
     def layer(self, layer):
         self[self._base_name].layer = layer
+
+    @property
+    def visible(self):
+        return self[self._base_name].visible
+
+    @visible.setter
+    def visible(self, visible):
+        self[self._base_name].visible = visible
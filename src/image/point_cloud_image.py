@@ -0,0 +1,84 @@
+
+import pyglet
+from pyglet.gl import GL_POINTS
+
+from .shapes import Layer
+from .shapes.constants import (shape_back, shape_background, shape_batch,
+                               shape_foreground, shape_front, shape_midground)
+
+# todo:
+# upload positions straight from the array buffer instead of through a list
+
+_layer_groups = {
+    Layer.FRONT: shape_front,
+    Layer.FOREGROUND: shape_foreground,
+    Layer.MIDGROUND: shape_midground,
+    Layer.BACKGROUND: shape_background,
+    Layer.BACK: shape_back,
+}
+
+
+class PointCloudImage:
+    '''Draws a whole population of same coloured points from one vertex list.
+
+    Unlike Image there are no shapes per point, update_points() rewrites every position at once and
+    the list is resized as the population changes.'''
+
+    def __init__(self, color, layer=Layer.FOREGROUND):
+        if len(color) == 3:  # add opacity if missing
+            color = tuple(color) + (255,)
+        self._color = tuple(color)
+        self._layer = layer
+        self._vertices = None
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def __deepcopy__(self, memo):
+        result = PointCloudImage(self._color, self._layer)  # vertex lists cannot be copied, start empty
+        memo[id(self)] = result
+        return result
+
+    @property
+    def color(self):
+        return self._color
+
+    @property
+    def layer(self):
+        return self._layer
+
+    @layer.setter
+    def layer(self, layer):
+        if layer not in _layer_groups:
+            raise ValueError(f'Unexpected layer, {layer}')
+        self._layer = layer
+        if self._vertices is not None:
+            shape_batch.migrate(self._vertices, GL_POINTS, _layer_groups[layer], shape_batch)
+
+    def update_points(self, xy):
+        '''Draw a point at each (x, y) row of xy.'''
+        n = len(xy)
+        if n == 0:
+            self._destroy()
+            return
+        if self._vertices is None:
+            program = pyglet.graphics.get_default_shader()
+            self._vertices = program.vertex_list(n, GL_POINTS, batch=shape_batch, group=_layer_groups[self._layer],
+                                                 position=('f', [0.] * (3 * n)), colors=('Bn', self._color * n))
+        elif n != self._count:
+            self._vertices.resize(n)
+            self._vertices.colors[:] = self._color * n
+        self._count = n
+
+        positions = [0.] * (3 * n)  # x, y, z per point
+        flat = xy.ravel().tolist()
+        positions[0::3] = flat[0::2]
+        positions[1::3] = flat[1::2]
+        self._vertices.position[:] = positions
+
+    def _destroy(self):
+        if self._vertices is not None:
+            self._vertices.delete()
+            self._vertices = None
+        self._count = 0
@@ -4,6 +4,8 @@ from .shapes import Rectangle
 
 
 class RectangleImage(SimpleImage):
+    __slots__ = ()
+
     def __init__(self, bx, by, color, width, height):
         shape = Rectangle(ox=0,
                           oy=0,
@@ -6,24 +6,27 @@ from .shapes import Layer, Rectangle
 
 
 class ScreenGrid(ComplexImage):
-    def __init__(self, bx, by, split_x, split_y, thickness, color):
+    def __init__(self, bx, by, split_x, split_y, thickness, color, cell_width=None, cell_height=None):
         assert split_x > 0, 'There must be 1 or more physics sectors'
         assert split_y > 0, 'There must be 1 or more physics sectors'
 
         self.split_x = split_x  # required for construction
         self.split_y = split_y
+        # sector size, the last sector may be cut off by the screen edge
+        self.cell_width = cell_width if cell_width is not None else Settings.WIDTH // split_x
+        self.cell_height = cell_height if cell_height is not None else Settings.HEIGHT // split_y
         self._thickness = thickness
         self._color = color
 
         super().__init__(bx, by)
 
     def _construct(self):
-        for x in range(0, Settings.WIDTH, Settings.WIDTH // self.split_x):
+        for x in (i * self.cell_width for i in range(self.split_x)):
             rect = Rectangle(x - self.thickness/2, 0, self.color, self.thickness, Settings.HEIGHT)
             rect.layer = Layer.BACK
             self[f'rect-x={x}'] = rect
 
-        for y in range(0, Settings.HEIGHT, Settings.HEIGHT // self.split_y):
+        for y in (i * self.cell_height for i in range(self.split_y)):
             rect = Rectangle(0, y - self.thickness/2, self.color, Settings.WIDTH, self.thickness)
             rect.layer = Layer.BACK
             self[f'rect-y={y}'] = rect
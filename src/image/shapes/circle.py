@@ -4,6 +4,8 @@ from .shapes import Shape
 
 
 class Circle(Shape):
+    __slots__ = ()
+
     def __init__(self, ox, oy, color, radius):
         shape = pyglet.shapes.Circle(x=ox,
                                      y=oy,
@@ -6,6 +6,8 @@ from .shapes import Shape
 
 
 class Rectangle(Shape):
+    __slots__ = ()
+
     def __init__(self, ox, oy, color, width, height):
         shape = pyglet.shapes.Rectangle(x=ox,
                                         y=oy,
@@ -42,36 +44,37 @@ class Rectangle(Shape):
 
     @property
     def center(self):
-        return Point(self.pos.x + self.width/2, self.pos.y + self.height/2)
+        x, y = self.primitive.position
+        return Point._make(float(x + self.width/2), float(y + self.height/2))
 
     @property
     def left_x(self):
-        return self.pos.x
+        return self.primitive.x
 
     @property
     def right_x(self):
-        return self.pos.x + self.width
+        return self.primitive.x + self.width
 
     @property
     def bottom_y(self):
-        return self.pos.y
+        return self.primitive.y
 
     @property
     def top_y(self):
-        return self.pos.y + self.height
+        return self.primitive.y + self.height
 
     @property
     def top_left(self):
-        return Point(self.left_x, self.top_y)
+        return Point._make(float(self.left_x), float(self.top_y))
 
     @property
     def top_right(self):
-        return Point(self.right_x, self.top_y)
+        return Point._make(float(self.right_x), float(self.top_y))
 
     @property
     def bottom_left(self):
-        return Point(self.left_x, self.bottom_y)
+        return Point._make(float(self.left_x), float(self.bottom_y))
 
     @property
     def bottom_right(self):
-        return Point(self.right_x, self.bottom_y)
+        return Point._make(float(self.right_x), float(self.bottom_y))
@@ -3,6 +3,7 @@ import enum
 from copy import deepcopy
 
 from geometry import Point, Vector
+from util import get_state, set_state
 
 from .constants import (shape_back, shape_background, shape_batch,
                         shape_foreground, shape_front, shape_midground)
@@ -34,6 +35,8 @@ class Layer(enum.IntEnum):
 
 
 class Shape:
+    __slots__ = ('_offset', 'primitive')
+
     def __init__(self, ox, oy, primitive):
         self._offset = Vector(ox, oy)
         self.primitive = primitive
@@ -55,25 +58,26 @@ class Shape:
     def __copy__(self):
         cls = self.__class__
         result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
+        set_state(result, get_state(self))
         return result
 
     def __deepcopy__(self, memo):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
+        state = get_state(self)
+        for k, v in state.items():
             if k == 'primitive':  # pyglet.shapes are not pickleable so recreate a fresh one
                 inputs = {_priv_to_pub_pyglet_shape_mapping[pk]: pv for pk, pv in v.__dict__.items()
                           if pk in _priv_to_pub_pyglet_shape_mapping}
-                new_primitive = v.__class__(**inputs)
-                setattr(result, k, new_primitive)
+                state[k] = v.__class__(**inputs)
             else:
-                setattr(result, k, deepcopy(v, memo))
+                state[k] = deepcopy(v, memo)
+        set_state(result, state)
         return result
 
     def delete(self):
-        self.primitive.destroy()
+        self.primitive.delete()
 
     @property
     def color(self):
@@ -85,12 +89,22 @@ class Shape:
             color = color + (255,)
         self.primitive.color = color
 
+    @property
+    def visible(self):
+        return self.primitive.visible
+
+    @visible.setter
+    def visible(self, visible):
+        self.primitive.visible = visible
+
     def move_to(self, new_basepos):
-        self.primitive.position = (new_basepos + self.offset).coordinates
+        offset = self._offset
+        self.primitive.position = (new_basepos._x + offset._x, new_basepos._y + offset._y)
 
     @property
     def pos(self):
-        return Point.from_coordinates(self.primitive.position)
+        x, y = self.primitive.position
+        return Point._make(float(x), float(y))
 
     @property
     def offset(self):
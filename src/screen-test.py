@@ -3,8 +3,8 @@
 
 import pyglet
 
-from entities import (Atom, ControlRod, Moveable, Neutron,  # noqa: F401
-                      TestEmitter, Thermal, Water)
+from entities import (Atom, ControlRod, Decay, Moveable,  # noqa: F401
+                      Neutron, TestEmitter, Thermal, Water)
 from image import draw_primitives
 
 # may be needed on MacOS to prevent screen from having issues due to high DPI
@@ -15,10 +15,6 @@ WIDTH, HEIGHT = 640, 480
 FPS = 60
 
 
-def get_per_frame_chance(chance, fps):
-    return chance / fps
-
-
 if __name__ == '__main__':
     window = pyglet.window.Window(width=WIDTH, height=HEIGHT, caption=TITLE)
 
@@ -29,7 +25,8 @@ if __name__ == '__main__':
 
     n = Neutron(100, 100, SPEED, -SPEED*2, 3)
     w = Water(WIDTH/2, 0, WIDTH/2, HEIGHT/2)
-    a = Atom(WIDTH/2, HEIGHT/2, 0, 0, 10, 3, get_per_frame_chance(0.5, FPS), Neutron(0, 0, SPEED, -SPEED*2, 3), to_add)  # noqa: E501
+    a = Atom(WIDTH/2, HEIGHT/2, 0, 0, 10, 3, 0.5, Neutron(0, 0, SPEED, -SPEED*2, 3), to_add)  # noqa: E501
+    a.radioactivity.schedule(Decay)
     c = ControlRod(150, 50, 10, HEIGHT-150, 10, 0, WIDTH, 0, HEIGHT, window)
     m = Moveable(100, 200, SPEED, 5, window, tuple())
 
@@ -49,6 +46,7 @@ if __name__ == '__main__':
             print(f'Simulation Size: {len(entities)}')
 
         # GENERAL LOGIC
+        Decay.update(dt)
         for e in entities:
             e.update(dt)
 
@@ -3,6 +3,9 @@ import enum
 import itertools
 import math
 
+from . import narrowphase
+from .bvh import StaticBVH
+from .occupancy import StaticRaster
 from .settings import GlobalSettings as Settings
 
 # todo:
@@ -14,6 +17,25 @@ class PhysicsLib:
         Simple = 1
         Complex = 2
 
+    class Category:
+        '''Collision category bits. Plain ints rather than enum.IntFlag to keep the pair filter cheap.
+
+        Two entities can only collide when each one's category is in the other's collision_mask.'''
+        NONE = 0
+        DEFAULT = 1 << 0
+        PARTICLE = 1 << 1
+        NEUTRON = 1 << 2
+        ATOM = 1 << 3
+        WATER = 1 << 4
+        ROD = 1 << 5
+        MOVEABLE = 1 << 6
+        ALL = (1 << 16) - 1
+
+    @staticmethod
+    def can_collide(a, b):
+        '''Whether the categories and masks of a and b let them collide.'''
+        return bool(a.collision_category & b.collision_mask and b.collision_category & a.collision_mask)
+
     @staticmethod
     def intersect_circle_rectangle(circle, rect):
         Xn = max(rect.bottom_left.x, min(circle.pos.x, rect.top_right.x))
@@ -52,7 +74,7 @@ class PhysicsLib:
         return math.dist(circle.pos.coordinates, point.pos.coordinates) < circle.radius
 
     @staticmethod
-    def intersect_circle_point(point, circle):
+    def intersect_circle_point(circle, point):
         return PhysicsLib.intersect_point_circle(point, circle)
 
     @staticmethod
@@ -75,93 +97,375 @@ class PhysicsLib:
 
     @staticmethod
     def intersect_rectangle_rectangle(rect1, rect2):
-        return rect1.left_x < rect2.right_x and rect1.right_x > rect2.left_x and \
-            rect1.bottom_y > rect2.top_y and rect1.top_y < rect2.bottom_y
+        return rect1.left_x < rect2.right_x and rect2.left_x < rect1.right_x and \
+            rect1.bottom_y < rect2.top_y and rect2.bottom_y < rect1.top_y
+
+    # COLLISION DISPATCH
+    _collision_kernels = {}  # (type, type) to kernel, as registered
+    _collision_dispatch = {}  # (type, type) of concrete classes to the kernel resolved for them
+
+    @staticmethod
+    def register_collision(type_a, type_b, kernel):
+        '''Test collisions of a type_a instance with a type_b instance (or their subclasses) using
+        kernel(a, b). Each argument order needs its own registration.'''
+        PhysicsLib._collision_kernels[type_a, type_b] = kernel
+        PhysicsLib._collision_dispatch.clear()  # resolved subclasses may now map elsewhere
+
+    @staticmethod
+    def _resolve_collision(type_a, type_b):
+        '''Kernel registered for the most specific bases of type_a and type_b, or None.'''
+        kernels = PhysicsLib._collision_kernels
+        for base_a in type_a.__mro__:
+            for base_b in type_b.__mro__:
+                kernel = kernels.get((base_a, base_b))
+                if kernel is not None:
+                    return kernel
+        return None
+
+    @staticmethod
+    def intersects(a, b):
+        '''Whether a and b collide. Kernels are resolved once per pair of classes, after which a
+        query is a single dict lookup.'''
+        key = (type(a), type(b))
+        try:
+            kernel = PhysicsLib._collision_dispatch[key]
+        except KeyError:
+            kernel = PhysicsLib._collision_dispatch[key] = PhysicsLib._resolve_collision(*key)
+        if kernel is None:
+            raise NotImplementedError(f'unsupported type(s) for collision checking: \'{type(a).__name__}\' and \'{type(b).__name__}\'')  # noqa: E501
+        return kernel(a, b)
+
+    @staticmethod
+    def bounding_box(entity):
+        '''Axis aligned (left, bottom, right, top) box around an entity.'''
+        if entity.physics == PhysicsLib.PhysicsType.Complex:
+            return entity.left_x, entity.bottom_y, entity.right_x, entity.top_y
+        x, y = entity.pos.coordinates
+        r = getattr(entity, 'radius', 0)
+        return x - r, y - r, x + r, y + r
 
-    def __new__(cls):  # make a singleton class
-        if not hasattr(cls, 'instance'):
+    def __new__(cls):  # make a singleton class, one per backend subclass
+        if 'instance' not in cls.__dict__:
             cls.instance = super(PhysicsLib, cls).__new__(cls)
+            cls.instance._initialize()
         return cls.instance
 
+    def _initialize(self):
+        self.validate = Settings.VALIDATE
+        self.auto_tune = Settings.PHYSICS_CELL_SIZE is None
+        self._sector_assignment = {}  # assignment of entity to its sector
+        if self.auto_tune:  # start from the default divisions until there is something to tune against
+            self._build_grid(Settings.WIDTH / Settings.PHYSICS_DIVISIONS, Settings.HEIGHT / Settings.PHYSICS_DIVISIONS)
+        else:
+            self._build_grid(Settings.PHYSICS_CELL_SIZE, Settings.PHYSICS_CELL_SIZE)
+        self._tuned_population = 0
+        self._initialize_registry()
+
+    def _initialize_registry(self):
+        '''State shared by every backend: the entity registry, the dirty list and the static layer.'''
+        self._registry = {}  # dynamic entity id to entity, insertion ordered
+        self._registered = None  # cached tuple of the registry, reset when it changes
+        self._dirty = {}  # entity id to entities moved or killed since the last update
+        self._stale = {}  # dirty dynamic entities whose recorded box has not been refreshed, see _refresh_stale
+        self._static = StaticBVH(self.bounding_box)  # static entities, never re-sectored
+        self._raster = StaticRaster(Settings.WIDTH, Settings.HEIGHT, Settings.PHYSICS_RASTER_CELL)
+
+    def __copy__(self):  # singleton, entities copied with a reference to it keep the same backend
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    # REGISTRY
+    # Entities keep a reference to their backend and report moves and deaths with mark_dirty
+    def _register(self, entity):
+        self._registry[entity.id] = entity
+        self._registered = None
+        entity._physics = self
+
+    def _unregister(self, entity):
+        del self._registry[entity.id]
+        self._registered = None
+        self._dirty.pop(entity.id, None)
+        self._stale.pop(entity.id, None)
+        if entity._physics is self:
+            entity._physics = None
+
+    def _clear_registry(self):
+        self._registry.clear()
+        self._registered = None
+        self._dirty.clear()
+        self._stale.clear()
+        self._static.clear()
+
+    def is_registered(self, entity):
+        '''Whether entity itself, not merely a copy sharing its id, is registered.'''
+        return self._registry.get(entity.id) is entity or entity in self._static
+
+    def mark_dirty(self, entity):
+        '''Note that entity moved or died, so the next update_sectors() refiles it. The static layer
+        is invalidated straight away, so its queries and raster never answer from a stale layout.
+
+        Copies keep the id and backend of their original, so anything but the registered entity
+        itself is ignored rather than allowed to stand in for it.'''
+        if not self.is_registered(entity):
+            return
+        self._dirty[entity.id] = entity
+        if entity.static:
+            self._static.invalidate()
+        else:
+            self._stale[entity.id] = entity
+
+    def _take_dirty(self):
+        '''Registered entities marked dirty since the last call.'''
+        dirty = [e for e in self._dirty.values() if self.is_registered(e)]
+        self._dirty.clear()
+        self._stale.clear()  # everything dirty is refiled
+        return dirty
+
+    def _refresh_stale(self):
+        '''Refile entities moved since they were last filed, for indexes which answer from recorded boxes.
+
+        The game moves entities after update_sectors(), so without this their queries and sweeps would see
+        the previous frame. Grid sectors are widened by a ring of neighbours instead. Deaths and static
+        entities are still left to update_sectors().'''
+        stale = [e for e in self._stale.values() if self._registry.get(e.id) is e]
+        self._stale.clear()
+        for entity in stale:
+            self._move_between_sector(entity)
+
+    def get_registered_entities(self):
+        '''Dynamic entities, as a tuple which is only rebuilt after entities are added or removed.'''
+        if self._registered is None:
+            self._registered = tuple(self._registry.values())
+        return self._registered
+
+    def _unique_registered_entities(self):
+        return list(self._registry.values())
+
     # COLLISION DETECTION OPTIMIZATION (SECTORS)
-    _sectors = {(x, y): [] for x in range(Settings.PHYSICS_DIVISIONS) for y in range(Settings.PHYSICS_DIVISIONS)}
-    _sector_assignment = {}  # assignment of entity to its sector
+    TARGET_PER_CELL = 4  # entities per cell the tuner aims for
+    grid_version = 0  # bumped whenever the grid is rebuilt, so drawings of it know to follow
+
+    def _build_grid(self, cell_width, cell_height):
+        self.grid_version += 1
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.divisions_x = max(1, math.ceil(Settings.WIDTH / cell_width))
+        self.divisions_y = max(1, math.ceil(Settings.HEIGHT / cell_height))
+
+        # Each sector maps entity id to entity. Dicts give O(1) insert/remove and keep insertion order,
+        # so iteration over a sector is deterministic between runs
+        self._sectors = {(x, y): {} for x in range(self.divisions_x) for y in range(self.divisions_y)}
+
+        # Precomputed 3x3 neighbourhood of each sector, clamped to the grid
+        self._neighbours = {
+            (x, y): tuple((nx, ny)
+                          for nx in range(max(x-1, 0), min(x+2, self.divisions_x))
+                          for ny in range(max(y-1, 0), min(y+2, self.divisions_y)))
+            for x, y in self._sectors}
+
+    def tune_cell_size(self, entities):
+        '''Square cell size suited to entities: wide enough that touching simple entities are always
+        neighbours, and small enough to hold roughly TARGET_PER_CELL entities on average.'''
+        simple = [e for e in entities if e.physics == PhysicsLib.PhysicsType.Simple]
+        if not simple:
+            return max(Settings.WIDTH / Settings.PHYSICS_DIVISIONS, Settings.HEIGHT / Settings.PHYSICS_DIVISIONS)
+        min_size = 2 * max(getattr(e, 'radius', 0) for e in simple)
+        density_size = math.sqrt(Settings.WIDTH * Settings.HEIGHT * PhysicsLib.TARGET_PER_CELL / len(simple))
+        return min(max(min_size, density_size, 1), max(Settings.WIDTH, Settings.HEIGHT))
+
+    def rebuild(self, cell_size=None):
+        '''Rebuild the grid with square cells, tuning the size to the registered entities if not given.'''
+        entities = self._unique_registered_entities()
+        if cell_size is None:
+            cell_size = self.tune_cell_size(entities)
+        self._build_grid(cell_size, cell_size)
+        self._sector_assignment.clear()
+        for entity in entities:
+            self.add_to_sector(entity)
+        self._tuned_population = len(entities)
+
+    def _retune_if_needed(self):
+        population = len(self._sector_assignment)
+        if population > 2 * self._tuned_population or 2 * population < self._tuned_population:
+            self.rebuild()
 
     def _get_sector_coords(self, entity):
+        max_x = self.divisions_x - 1
+        max_y = self.divisions_y - 1
+        pos = entity.pos
         if entity.physics == PhysicsLib.PhysicsType.Complex:
-            base_w = int(entity.pos.x // (Settings.WIDTH // Settings.PHYSICS_DIVISIONS))
-            base_h = int(entity.pos.y // (Settings.HEIGHT // Settings.PHYSICS_DIVISIONS))
-            ext_w = int(entity.top_right.x // (Settings.WIDTH // Settings.PHYSICS_DIVISIONS))
-            ext_h = int(entity.top_right.y // (Settings.HEIGHT // Settings.PHYSICS_DIVISIONS))
-            return {(min(max(x, 0), Settings.PHYSICS_DIVISIONS-1),
-                    min(max(y, 0), Settings.PHYSICS_DIVISIONS-1))
-                    for x, y in itertools.product(range(base_w, ext_w+1), range(base_h, ext_h+1))}
+            top_right = entity.top_right
+            base_w = min(max(int(pos.x // self.cell_width), 0), max_x)
+            base_h = min(max(int(pos.y // self.cell_height), 0), max_y)
+            ext_w = min(max(int(top_right.x // self.cell_width), 0), max_x)
+            ext_h = min(max(int(top_right.y // self.cell_height), 0), max_y)
+            return {(x, y) for x in range(base_w, ext_w+1) for y in range(base_h, ext_h+1)}
         else:
-            sector_w = int(entity.pos.x // (Settings.WIDTH // Settings.PHYSICS_DIVISIONS))
-            sector_h = int(entity.pos.y // (Settings.HEIGHT // Settings.PHYSICS_DIVISIONS))
-            return {(min(max(sector_w, 0), Settings.PHYSICS_DIVISIONS-1),
-                     min(max(sector_h, 0), Settings.PHYSICS_DIVISIONS-1))}
+            return {(min(max(int(pos.x // self.cell_width), 0), max_x),
+                     min(max(int(pos.y // self.cell_height), 0), max_y))}
 
     def _get_neighbor_sector_coords(self, entity):
         origin_sector = self._get_sector_coords(entity)
-        return {(min(max(sector[0]+x, 0), Settings.PHYSICS_DIVISIONS-1),
-                min(max(sector[1]+y, 0), Settings.PHYSICS_DIVISIONS-1))
-                for x, y in itertools.product(range(-1, 2), range(-1, 2)) for sector in origin_sector}
+        if len(origin_sector) == 1:
+            return self._neighbours[next(iter(origin_sector))]
+        return {n for sector in origin_sector for n in self._neighbours[sector]}
+
+    # VALIDATION
+    # Expensive invariant checks, only run when validate is set (see [debug] validate in config)
+    def _validate_assignment(self, entity):
+        '''Assert entity is filed in exactly its assigned sectors.'''
+        assignment = self.get_sector(entity)
+        for x, y in self._sectors:
+            if (x, y) in assignment:
+                assert entity.id in self._sectors[(x, y)]
+            else:
+                assert entity.id not in self._sectors[(x, y)]
+
+    # STATIC LAYER
+    # Static entities live in a BVH built once, queried only by dynamic entities and never paired with each other
+    def _static_pairs(self, entities):
+        '''(dynamic, static) pairs whose bounding boxes overlap and whose masks let them collide.'''
+        query = self._static.query
+        return [(e, s) for e in entities for s in query(self.bounding_box(e))
+                if e.collision_category & s.collision_mask and s.collision_category & e.collision_mask]
+
+    def invalidate_static(self):
+        '''Re-index the static layer, e.g. after a static entity was moved.'''
+        self._static.invalidate()
+
+    def get_static_entities(self):
+        return tuple(self._static)
+
+    def _add_static(self, entity):
+        self._static.add(entity)
+        entity._physics = self
+
+    def _remove_static(self, entity):
+        self._static.remove(entity)
+        self._dirty.pop(entity.id, None)
+        if entity._physics is self:
+            entity._physics = None
+        return entity
+
+    def _update_static(self, entity):
+        '''Drop a killed static entity, or re-index the layer around one which moved.'''
+        if entity not in self._static:
+            return
+        if not entity.alive:
+            self._remove_static(entity)
+        else:
+            self._static.invalidate()
+
+    def _refresh_static(self):
+        '''End of update_sectors: drop killed static entities and re-bake the raster if it is in use,
+        so lookups after an update never see the layout from before it.'''
+        self._static.purge()
+        if self._raster.version is not None:
+            self._static_raster()
+
+    def _static_raster(self):
+        '''Occupancy bitmap of the live static layer, re-baked whenever the layer has changed.'''
+        if self._raster.version != self._static.version:
+            self._raster.bake([e for e in self._static if e.alive], self._static.version)
+        return self._raster
+
+    def static_region_at(self, x, y):
+        '''Static entity covering (x, y) to within half a raster cell, or None.'''
+        return self._static_raster().region_at(x, y)
+
+    def static_regions_at(self, xs, ys):
+        '''Static entity (or None) covering each point, resolved with one array gather.'''
+        return self._static_raster().regions_at(xs, ys)
 
     def add_to_sector(self, entity):
+        if entity.static:
+            return self._add_static(entity)
+
         sector_coords = self._get_sector_coords(entity)
         self._sector_assignment[entity.id] = sector_coords
         for sector in sector_coords:
-            self._sectors[sector].append(entity)
+            self._sectors[sector][entity.id] = entity
+        self._register(entity)
 
-            assert entity in self._sectors[sector]
-        assert entity.id in self._sector_assignment
+        if self.validate:
+            self._validate_assignment(entity)
 
     def _move_between_sector(self, entity):
         old_sector_coords = self._sector_assignment[entity.id]
         new_sector_coords = self._get_sector_coords(entity)
 
         for old_sector in old_sector_coords - new_sector_coords:
-            assert old_sector in old_sector_coords
-            assert old_sector not in new_sector_coords
-
-            self._sectors[old_sector].remove(entity)
+            del self._sectors[old_sector][entity.id]
 
         for new_sector in new_sector_coords - old_sector_coords:
-            assert new_sector not in old_sector_coords
-            assert new_sector in new_sector_coords
-
-            self._sectors[new_sector].append(entity)
+            self._sectors[new_sector][entity.id] = entity
 
         self._sector_assignment[entity.id] = new_sector_coords
 
-        assignment = self.get_sector(entity)
-        for x, y in self._sectors:
-            if (x, y) in assignment:
-                assert entity in self._sectors[(x, y)]
-            else:
-                assert entity not in self._sectors[(x, y)]
+        if self.validate:
+            self._validate_assignment(entity)
 
     def remove_from_sector(self, entity):
-        sector_coords = self._get_sector_coords(entity)
+        if entity in self._static:
+            return self._remove_static(entity)
+
         assert entity.id in self._sector_assignment
+        sector_coords = self._sector_assignment[entity.id]  # where it was filed, not where it is now
 
         for sector in sector_coords:
-            assert entity in self._sectors[sector]
-            self._sectors[sector].remove(entity)
+            del self._sectors[sector][entity.id]
 
         del self._sector_assignment[entity.id]
-        assert entity.id not in self._sector_assignment
+        self._unregister(entity)
+
+        if self.validate:
+            self._validate_assignment(entity)
         return entity
 
-    def get_neighbour_entities(self, entity):
+    def _dynamic_neighbours(self, entity):
         return [e
                 for x, y in self._get_neighbor_sector_coords(entity)
-                for e in self._sectors[x, y]
+                for e in self._sectors[x, y].values()
                ]  # noqa: E124
 
-    def update_sectors(self, entities):
+    def get_neighbour_entities(self, entity):
+        return self._dynamic_neighbours(entity) + self._static.query(self.bounding_box(entity))
+
+    def get_candidate_pairs(self):
+        '''Every pair of registered entities sharing a neighbourhood, each pair exactly once.
+        Static entities are only paired with dynamic ones, and pairs rejected by the collision masks are skipped.'''
+        pairs = []
+        entities = self._unique_registered_entities()
+        for e1 in entities:
+            category = e1.collision_category
+            mask = e1.collision_mask
+            seen = set()  # entities spanning several sectors show up once per sector
+            for e2 in self._dynamic_neighbours(e1):
+                if e2.id > e1.id and e2.id not in seen \
+                        and category & e2.collision_mask and e2.collision_category & mask:
+                    seen.add(e2.id)
+                    pairs.append((e1, e2))
+        pairs.extend(self._static_pairs(entities))
+        return pairs
+
+    def get_colliding_pairs(self):
+        '''Candidate pairs which actually intersect, tested in batches by the narrowphase.'''
+        pairs = self.get_candidate_pairs()
+        hits = narrowphase.intersect_pairs(pairs)
+        return [pair for pair, hit in zip(pairs, hits.tolist()) if hit]
+
+    def update_sectors(self, entities=None):
+        '''Refile entities which moved or died. Without entities, only those marked dirty since the
+        last update are processed: moves through translate() or the pos setter and deaths mark an
+        entity, changing its Point in place (entity.pos.x = ...) does not.'''
+        if entities is None:
+            entities = self._take_dirty()
         for entity in entities:
+            if entity.static:
+                self._update_static(entity)
+                continue
             assert entity.id in self._sector_assignment
             # Ensure entity is where it should be then delete in case it was moved from previous call
             if self._get_sector_coords(entity) != self._sector_assignment[entity.id]:
@@ -170,13 +474,166 @@ class PhysicsLib:
             if not entity.alive:
                 self.remove_from_sector(entity)
 
-    def get_registered_entities(self):
-        return tuple(itertools.chain(*(self._sectors[x, y] for x, y in self._sectors)))
+        self._refresh_static()
+        if self.auto_tune:
+            self._retune_if_needed()
+
+    # SPATIAL QUERIES
+    # Backends provide _query_box, the index supplies candidates and the exact shape tests below filter them
+    def _query_box(self, box):
+        '''Dynamic entities which may overlap box (a superset, each entity once).
+
+        Simple entities are filed by their centre, so the sectors under box are widened by one ring,
+        the same reach the 3x3 neighbourhood relies on.'''
+        left, bottom, right, top = box
+        max_x = self.divisions_x - 1
+        max_y = self.divisions_y - 1
+        x0 = min(max(int(left // self.cell_width) - 1, 0), max_x)
+        x1 = min(max(int(right // self.cell_width) + 1, 0), max_x)
+        y0 = min(max(int(bottom // self.cell_height) - 1, 0), max_y)
+        y1 = min(max(int(top // self.cell_height) + 1, 0), max_y)
+        found = {}
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                found.update(self._sectors[x, y])
+        return found.values()
+
+    def _ray_step(self):
+        '''Length of the ray segments raycast queries the index with.'''
+        return max(self.cell_width, self.cell_height)
+
+    def _candidates(self, box, types, ignore):
+        entities = itertools.chain(self._query_box(box), self._static.query(box))
+        return [e for e in entities
+                if e is not ignore and (types is None or isinstance(e, types))]
+
+    @staticmethod
+    def distance_to(entity, x, y):
+        '''Distance from (x, y) to the shape of entity, 0 inside it. Points count as their centre.'''
+        if entity.physics == PhysicsLib.PhysicsType.Complex:
+            dx = max(entity.left_x - x, 0, x - entity.right_x)
+            dy = max(entity.bottom_y - y, 0, y - entity.top_y)
+            return math.hypot(dx, dy)
+        cx, cy = entity.pos.coordinates
+        r = entity.radius if entity.shape_kind == narrowphase.ShapeKind.Circle else 0
+        return max(math.hypot(x - cx, y - cy) - r, 0)
+
+    @staticmethod
+    def _ray_distance(entity, ox, oy, dx, dy):
+        '''Distance along the unit ray (ox, oy) + t(dx, dy) to its first contact with entity, or None.
+        Points are hit within their drawn radius.'''
+        if entity.physics == PhysicsLib.PhysicsType.Complex:
+            t0, t1 = 0, math.inf
+            for o, d, low, high in ((ox, dx, entity.left_x, entity.right_x), (oy, dy, entity.bottom_y, entity.top_y)):
+                if d == 0:
+                    if not low <= o <= high:
+                        return None
+                    continue
+                near, far = (low - o) / d, (high - o) / d
+                if near > far:
+                    near, far = far, near
+                t0, t1 = max(t0, near), min(t1, far)
+                if t0 > t1:
+                    return None
+            return t0
+        cx, cy = entity.pos.coordinates
+        fx, fy = ox - cx, oy - cy
+        c = fx * fx + fy * fy - entity.radius * entity.radius
+        if c <= 0:  # starts inside
+            return 0
+        b = fx * dx + fy * dy
+        disc = b * b - c
+        if b > 0 or disc < 0:  # pointing away or passing by
+            return None
+        return -b - math.sqrt(disc)
+
+    def query_rect(self, left, bottom, right, top, types=None, ignore=None):
+        '''Entities whose shapes overlap the rectangle, optionally only instances of types.'''
+        box = (left, bottom, right, top)
+        result = []
+        for e in self._candidates(box, types, ignore):
+            if e.physics == PhysicsLib.PhysicsType.Complex:
+                if e.left_x <= right and left <= e.right_x and e.bottom_y <= top and bottom <= e.top_y:
+                    result.append(e)
+            else:
+                x, y = e.pos.coordinates
+                r = e.radius if e.shape_kind == narrowphase.ShapeKind.Circle else 0
+                dx = max(left - x, 0, x - right)
+                dy = max(bottom - y, 0, y - top)
+                if dx * dx + dy * dy <= r * r:
+                    result.append(e)
+        return result
+
+    def query_radius(self, pos, radius, types=None, ignore=None):
+        '''Entities whose shapes come within radius of pos, optionally only instances of types.'''
+        x, y = pos.coordinates
+        box = (x - radius, y - radius, x + radius, y + radius)
+        return [e for e in self._candidates(box, types, ignore) if self.distance_to(e, x, y) <= radius]
+
+    def raycast(self, origin, direction, max_distance=None, types=None, ignore=None):
+        '''First entity hit by the ray from origin along direction, as (entity, distance), or None.
+
+        The ray is walked in segments of _ray_step, querying the index for each, so only entities near
+        the path are tested. Without max_distance the ray stops where it leaves the screen.'''
+        ox, oy = origin.coordinates
+        length = math.hypot(direction.x, direction.y)
+        if length == 0:
+            return None
+        dx, dy = direction.x / length, direction.y / length
+        if max_distance is None:
+            max_distance = math.hypot(max(ox, Settings.WIDTH - ox), max(oy, Settings.HEIGHT - oy))
+
+        step = self._ray_step()
+        tested = set()
+        best = None
+        start = 0
+        while start < max_distance:
+            end = min(start + step, max_distance)
+            x0, y0 = ox + dx * start, oy + dy * start
+            x1, y1 = ox + dx * end, oy + dy * end
+            for e in self._candidates((min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)), types, ignore):
+                if e.id in tested:
+                    continue
+                tested.add(e.id)
+                t = self._ray_distance(e, ox, oy, dx, dy)
+                if t is not None and t <= max_distance and (best is None or t < best[1]):
+                    best = (e, t)
+            if best is not None and best[1] <= end:  # nothing further along can be closer
+                return best
+            start = end
+        return best
+
+    def nearest(self, pos, k=1, types=None, ignore=None):
+        '''Up to k entities closest to pos, nearest first, optionally only instances of types.
+
+        Searches a box around pos which doubles until it holds k entities within its inner radius.'''
+        x, y = pos.coordinates
+        radius = self._ray_step()
+        limit = math.hypot(Settings.WIDTH, Settings.HEIGHT) + math.hypot(x, y)
+        while True:
+            box = (x - radius, y - radius, x + radius, y + radius)
+            found = sorted(((self.distance_to(e, x, y), e.id, e) for e in self._candidates(box, types, ignore)))
+            within = [e for d, _, e in found if d <= radius]
+            if len(within) >= k or radius > limit:
+                break
+            radius *= 2
+        if len(within) < k:  # entities beyond the screen, fall back to a full scan
+            everything = itertools.chain(self._registry.values(), self._static)
+            found = sorted((self.distance_to(e, x, y), e.id, e) for e in everything
+                           if e is not ignore and (types is None or isinstance(e, types)))
+            within = [e for _, _, e in found]
+        return within[:k]
 
     def get_sector(self, entity):
         if entity.id in self._sector_assignment:
             return self._sector_assignment[entity.id]
         return {}
 
+    def clear(self):
+        '''Forget every registered entity.'''
+        for sector in self._sectors.values():
+            sector.clear()
+        self._sector_assignment.clear()
+        self._clear_registry()
+        self._tuned_population = 0
 
-GlobalPhysics = PhysicsLib()
@@ -2,7 +2,10 @@
 import configparser
 import os
 
+import numpy as np
+
 config_filename = 'config'
+validate_env_var = 'REACTOR_VALIDATE'  # overrides [debug] validate when set
 
 
 class Settings(object):
@@ -19,9 +22,21 @@ class Settings(object):
         self.FPS = config.getint('screen', 'fps') if not default else 30
 
         self.PHYSICS_GRID = config.getboolean('physics', 'grid') if not default else False
+        self.PHYSICS_BACKEND = config.get('physics', 'backend', fallback='grid') if not default else 'grid'
+        cell_size = config.get('physics', 'cell_size', fallback='auto') if not default else 'auto'
+        self.PHYSICS_CELL_SIZE = None if cell_size == 'auto' else float(cell_size)  # None tunes from entities
+        self.PHYSICS_RASTER_CELL = config.getfloat('physics', 'raster_cell', fallback=4) if not default else 4
+
+        # Expensive invariant checks in physics and entities. Not tied to `python -O`
+        self.VALIDATE = config.getboolean('debug', 'validate', fallback=False) if not default else False
+        if validate_env_var in os.environ:
+            self.VALIDATE = os.environ[validate_env_var] not in ('', '0')
+
+        self.SEED = config.getint('simulation', 'seed', fallback=None) if not default else None
 
         self.TITLE = "RBMK Reactor Simulation"
         self.entity_id = 0  # provided to all Entities and incremented
+        self.rng = np.random.default_rng(self.SEED)  # shared generator for vectorized sampling
 
     def next_id(self):
         self.entity_id += 1
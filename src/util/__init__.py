@@ -1,7 +1,15 @@
 
-from .physics import GlobalPhysics as Physics  # noqa: F401
-from .physics import PhysicsLib  # noqa: F401
 from .settings import GlobalSettings as Settings  # noqa: F401
 from .settings import init_settings
 
-init_settings()
+init_settings()  # settings must be loaded before the physics singleton is constructed
+
+from .backends import BACKENDS, create_physics, register_backend  # noqa: E402, F401
+from .backends import GlobalPhysics as Physics  # noqa: E402, F401
+from .hash_grid import HashGridPhysicsLib  # noqa: E402, F401
+from .narrowphase import ShapeKind  # noqa: E402, F401
+from .physics import PhysicsLib  # noqa: E402, F401
+from .quadtree import QuadtreePhysicsLib  # noqa: E402, F401
+from .slots import get_state, set_state  # noqa: E402, F401
+from .sweep_and_prune import SweepAndPrunePhysicsLib  # noqa: E402, F401
+from .vectorized import NumpyPhysicsLib  # noqa: E402, F401
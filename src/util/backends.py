@@ -0,0 +1,35 @@
+
+from .hash_grid import HashGridPhysicsLib
+from .physics import PhysicsLib
+from .quadtree import QuadtreePhysicsLib
+from .settings import GlobalSettings as Settings
+from .sweep_and_prune import SweepAndPrunePhysicsLib
+from .vectorized import NumpyPhysicsLib
+
+# todo:
+# allow switching backend at runtime, moving registered entities across
+
+BACKENDS = {  # [physics] backend in config to implementation
+    'grid': PhysicsLib,
+    'hashgrid': HashGridPhysicsLib,
+    'quadtree': QuadtreePhysicsLib,
+    'sap': SweepAndPrunePhysicsLib,
+    'numpy': NumpyPhysicsLib,
+}
+
+
+def register_backend(name, cls):
+    '''Make a PhysicsLib subclass selectable as [physics] backend = name.'''
+    if not issubclass(cls, PhysicsLib):
+        raise TypeError(f'physics backend must subclass PhysicsLib, got \'{cls.__name__}\'')
+    BACKENDS[name] = cls
+
+
+def create_physics(name):
+    '''Singleton instance of the backend registered as name.'''
+    if name not in BACKENDS:
+        raise ValueError(f'unknown physics backend \'{name}\', expected one of {", ".join(BACKENDS)}')
+    return BACKENDS[name]()
+
+
+GlobalPhysics = create_physics(Settings.PHYSICS_BACKEND)
@@ -0,0 +1,122 @@
+
+# todo:
+# refit boxes in place when a static entity moves instead of rebuilding
+
+
+class BVHNode:
+    '''Node of a StaticBVH. Leaves hold (box, entity) items, branches hold two children.'''
+    __slots__ = ('box', 'left', 'right', 'items')
+
+    def __init__(self, box, left=None, right=None, items=None):
+        self.box = box
+        self.left = left
+        self.right = right
+        self.items = items
+
+    def __repr__(self):
+        return f'{type(self).__name__}(box={self.box}, leaf={self.items is not None})'
+
+
+def _union(boxes):
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+
+class StaticBVH:
+    '''Bounding volume hierarchy over entities which never move.
+
+    The tree is built lazily on the first query after a change, so a static layout is indexed once
+    and later frames only pay for queries. Killed entities are skipped when found by a query and
+    removed on the next purge.'''
+
+    def __init__(self, bounding_box, leaf_size=4):
+        self.bounding_box = bounding_box  # entity to (left, bottom, right, top)
+        self.leaf_size = leaf_size
+        self._entities = {}  # entity id to entity, insertion ordered
+        self._root = None
+        self._dirty = False
+        self._dead = {}  # killed entities seen by queries, removed by purge
+        self.version = 0  # bumped on every change so derived structures know to rebuild
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __iter__(self):
+        return iter(self._entities.values())
+
+    def __contains__(self, entity):
+        return self._entities.get(entity.id) is entity  # not a copy sharing its id
+
+    def add(self, entity):
+        self._entities[entity.id] = entity
+        self._dirty = True
+        self.version += 1
+
+    def remove(self, entity):
+        del self._entities[entity.id]
+        self._dead.pop(entity.id, None)
+        self._dirty = True
+        self.version += 1
+        return entity
+
+    def invalidate(self):
+        '''Rebuild before the next query, e.g. after a static entity was moved or resized.'''
+        self._dirty = True
+        self.version += 1
+
+    def purge(self):
+        '''Remove killed entities found by queries since the last purge.'''
+        for entity in list(self._dead.values()):
+            self.remove(entity)
+
+    def clear(self):
+        self._entities.clear()
+        self._dead.clear()
+        self._root = None
+        self._dirty = False
+        self.version += 1
+
+    def build(self):
+        items = [(self.bounding_box(e), e) for e in self._entities.values()]
+        self._root = self._build(items) if items else None
+        self._dirty = False
+
+    def _build(self, items):
+        box = _union([b for b, _ in items])
+        if len(items) <= self.leaf_size:
+            return BVHNode(box, items=items)
+
+        # Median split along the axis with the widest spread of centres
+        xs = [b[0] + b[2] for b, _ in items]
+        ys = [b[1] + b[3] for b, _ in items]
+        axis = 0 if max(xs) - min(xs) >= max(ys) - min(ys) else 1
+        items.sort(key=lambda item: item[0][axis] + item[0][axis + 2])
+        mid = len(items) // 2
+        return BVHNode(box, self._build(items[:mid]), self._build(items[mid:]))
+
+    def query(self, box):
+        '''Live entities whose bounding boxes overlap box.'''
+        if self._dirty:
+            self.build()
+        if self._root is None:
+            return []
+
+        left, bottom, right, top = box
+        result = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            b = node.box
+            if b[0] > right or b[2] < left or b[1] > top or b[3] < bottom:
+                continue
+            if node.items is None:
+                stack.append(node.right)
+                stack.append(node.left)
+                continue
+            for b, entity in node.items:
+                if b[0] <= right and b[2] >= left and b[1] <= top and b[3] >= bottom:
+                    if entity.alive:
+                        result.append(entity)
+                    else:
+                        self._dead[entity.id] = entity
+        return result
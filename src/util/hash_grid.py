@@ -0,0 +1,129 @@
+
+import math
+
+from .physics import PhysicsLib
+from .settings import GlobalSettings as Settings
+
+# todo:
+# drop cells which stay empty for a while instead of straight away, to avoid churn at cell edges
+
+
+class HashGridPhysicsLib(PhysicsLib):
+    '''PhysicsLib on a sparse hashed grid covering an unbounded world.
+
+    Sectors are keyed by unclamped integer cell coordinates and only occupied cells are stored, so
+    entities outside the screen spread over their own cells instead of piling into the border ones.
+    Tuple keys hash quickly in Python, so Morton codes would add encoding cost for no gain.'''
+
+    def _build_grid(self, cell_width, cell_height):
+        self.grid_version += 1
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.divisions_x = max(1, math.ceil(Settings.WIDTH / cell_width))  # cells across the screen, for drawing
+        self.divisions_y = max(1, math.ceil(Settings.HEIGHT / cell_height))
+        self._sectors = {}  # occupied cell to {entity id: entity}
+
+    def _cell(self, x, y):
+        return int(x // self.cell_width), int(y // self.cell_height)
+
+    def _get_sector_coords(self, entity):
+        if entity.physics == PhysicsLib.PhysicsType.Complex:
+            x0, y0 = self._cell(entity.left_x, entity.bottom_y)
+            x1, y1 = self._cell(entity.right_x, entity.top_y)
+            return {(x, y) for x in range(x0, x1+1) for y in range(y0, y1+1)}
+        return {self._cell(*entity.pos.coordinates)}
+
+    def _get_neighbor_sector_coords(self, entity):
+        return {(x + dx, y + dy)
+                for x, y in self._get_sector_coords(entity)
+                for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+
+    def _validate_assignment(self, entity):
+        assignment = self.get_sector(entity)
+        for cell, sector in self._sectors.items():
+            assert sector, f'empty cell {cell} was not dropped'
+            assert (entity.id in sector) == (cell in assignment)
+
+    def _file(self, entity, cell):
+        sector = self._sectors.get(cell)
+        if sector is None:
+            sector = self._sectors[cell] = {}
+        sector[entity.id] = entity
+
+    def _unfile(self, entity, cell):
+        sector = self._sectors[cell]
+        del sector[entity.id]
+        if not sector:
+            del self._sectors[cell]
+
+    def add_to_sector(self, entity):
+        if entity.static:
+            return self._add_static(entity)
+
+        sector_coords = self._get_sector_coords(entity)
+        self._sector_assignment[entity.id] = sector_coords
+        for cell in sector_coords:
+            self._file(entity, cell)
+        self._register(entity)
+
+        if self.validate:
+            self._validate_assignment(entity)
+
+    def _move_between_sector(self, entity):
+        old_sector_coords = self._sector_assignment[entity.id]
+        new_sector_coords = self._get_sector_coords(entity)
+
+        for cell in old_sector_coords - new_sector_coords:
+            self._unfile(entity, cell)
+
+        for cell in new_sector_coords - old_sector_coords:
+            self._file(entity, cell)
+
+        self._sector_assignment[entity.id] = new_sector_coords
+
+        if self.validate:
+            self._validate_assignment(entity)
+
+    def remove_from_sector(self, entity):
+        if entity in self._static:
+            return self._remove_static(entity)
+
+        assert entity.id in self._sector_assignment
+        for cell in self._sector_assignment.pop(entity.id):
+            self._unfile(entity, cell)
+        self._unregister(entity)
+
+        if self.validate:
+            self._validate_assignment(entity)
+        return entity
+
+    def _dynamic_neighbours(self, entity):
+        sectors = self._sectors
+        return [e
+                for cell in self._get_neighbor_sector_coords(entity) if cell in sectors
+                for e in sectors[cell].values()
+               ]  # noqa: E124
+
+    def _query_box(self, box):
+        left, bottom, right, top = box
+        x0, y0 = self._cell(left, bottom)
+        x1, y1 = self._cell(right, top)
+        x0, y0, x1, y1 = x0 - 1, y0 - 1, x1 + 1, y1 + 1  # simple entities are filed by their centre
+        found = {}
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._sectors):  # fewer occupied cells than cells under the box
+            for (x, y), sector in self._sectors.items():
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    found.update(sector)
+        else:
+            for x in range(x0, x1 + 1):
+                for y in range(y0, y1 + 1):
+                    sector = self._sectors.get((x, y))
+                    if sector is not None:
+                        found.update(sector)
+        return found.values()
+
+    def clear(self):
+        self._sectors.clear()
+        self._sector_assignment.clear()
+        self._clear_registry()
+        self._tuned_population = 0
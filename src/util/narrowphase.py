@@ -0,0 +1,120 @@
+
+import enum
+
+import numpy as np
+
+from geometry import EPSILON
+
+# todo:
+# share one shape table between the handler buckets of an update instead of gathering per call
+
+
+class ShapeKind(enum.IntEnum):
+    '''Collision shape of an entity, used to group candidate pairs for the batched tests.'''
+    Point = 0
+    Circle = 1
+    Rectangle = 2
+
+
+X0, Y0, R, X1, Y1 = range(5)  # columns of the shape table, see gather()
+
+
+def _shape_row(entity):
+    if entity.shape_kind == ShapeKind.Rectangle:
+        return entity.left_x, entity.bottom_y, 0.0, entity.right_x, entity.top_y
+    x, y = entity.pos.coordinates
+    return x, y, entity.radius if entity.shape_kind == ShapeKind.Circle else 0.0, x, y
+
+
+def gather(entities):
+    '''Shape table of entities, one float64 row each, read in a single pass.
+
+    Rectangles are (left, bottom, 0, right, top), points and circles (x, y, radius, x, y), so
+    X0, Y0 is always the centre or the bottom left corner and X1, Y1 the top right.'''
+    return np.array([_shape_row(e) for e in entities], dtype=np.float64).reshape(-1, 5)
+
+
+# Kernels take the shape table rows of the two sides of each pair and mirror the scalar PhysicsLib.intersect_*
+
+def point_point(points1, points2):
+    return (np.abs(points1[:, X0] - points2[:, X0]) < EPSILON) & (np.abs(points1[:, Y0] - points2[:, Y0]) < EPSILON)
+
+
+def point_circle(points, circles):
+    return np.hypot(points[:, X0] - circles[:, X0], points[:, Y0] - circles[:, Y0]) < circles[:, R]
+
+
+def point_rectangle(points, rects):
+    px, py = points[:, X0], points[:, Y0]
+    return (rects[:, X0] < px) & (px < rects[:, X1]) & (rects[:, Y0] < py) & (py < rects[:, Y1])
+
+
+def circle_circle(circles1, circles2):
+    distance = np.hypot(circles1[:, X0] - circles2[:, X0], circles1[:, Y0] - circles2[:, Y0])
+    return distance < circles1[:, R] + circles2[:, R]
+
+
+def circle_rectangle(circles, rects):
+    cx, cy, r = circles[:, X0], circles[:, Y0], circles[:, R]
+    left, bottom, right, top = rects[:, X0], rects[:, Y0], rects[:, X1], rects[:, Y1]
+    dx = np.clip(cx, left, right) - cx
+    dy = np.clip(cy, bottom, top) - cy
+    inside = (left <= cx) & (cx <= right) & (bottom <= cy) & (cy <= top)
+    return (dx * dx + dy * dy <= r * r) | inside
+
+
+def rectangle_rectangle(rects1, rects2):
+    return (rects1[:, X0] < rects2[:, X1]) & (rects2[:, X0] < rects1[:, X1]) \
+        & (rects1[:, Y0] < rects2[:, Y1]) & (rects2[:, Y0] < rects1[:, Y1])
+
+
+KERNELS = {  # keyed by kinds in ascending order, so each unordered combination has one kernel
+    (ShapeKind.Point, ShapeKind.Point): point_point,
+    (ShapeKind.Point, ShapeKind.Circle): point_circle,
+    (ShapeKind.Point, ShapeKind.Rectangle): point_rectangle,
+    (ShapeKind.Circle, ShapeKind.Circle): circle_circle,
+    (ShapeKind.Circle, ShapeKind.Rectangle): circle_rectangle,
+    (ShapeKind.Rectangle, ShapeKind.Rectangle): rectangle_rectangle,
+}
+
+
+def group_pairs(pairs):
+    '''Number the entities of pairs and split the pairs by kind combination.
+
+    Returns (entities, {kinds: (indices, firsts, seconds)}) where firsts and seconds are int arrays
+    of rows into entities, each pair ordered to match its kernel. Entities in several pairs get one row.'''
+    entities = []
+    rows = {}  # id of entity to its row, entities are unhashable
+    groups = {}
+    for i, (e1, e2) in enumerate(pairs):
+        row1 = rows.get(id(e1))
+        if row1 is None:
+            row1 = rows[id(e1)] = len(entities)
+            entities.append(e1)
+        row2 = rows.get(id(e2))
+        if row2 is None:
+            row2 = rows[id(e2)] = len(entities)
+            entities.append(e2)
+        k1 = e1.shape_kind
+        k2 = e2.shape_kind
+        if k1 > k2:
+            row1, row2, k1, k2 = row2, row1, k2, k1
+        group = groups.get((k1, k2))
+        if group is None:
+            group = groups[k1, k2] = ([], [], [])
+        group[0].append(i)
+        group[1].append(row1)
+        group[2].append(row2)
+    return entities, {kinds: (indices, np.array(firsts, dtype=np.intp), np.array(seconds, dtype=np.intp))
+                      for kinds, (indices, firsts, seconds) in groups.items()}
+
+
+def intersect_pairs(pairs):
+    '''Boolean mask of which (entity, entity) pairs intersect. Shapes are gathered once per entity,
+    then each kind combination is tested with one kernel call on rows taken from the table.'''
+    hits = np.zeros(len(pairs), dtype=bool)
+    entities, groups = group_pairs(pairs)
+    table = gather(entities)
+    for kinds, (indices, firsts, seconds) in groups.items():
+        hits[indices] = KERNELS[kinds](table[firsts], table[seconds])
+    return hits
@@ -0,0 +1,86 @@
+
+import math
+
+import numpy as np
+
+from .narrowphase import ShapeKind
+
+# todo:
+# signed distance field so queries can also tell how far a point is from the nearest region
+
+
+class StaticRaster:
+    '''Fixed resolution bitmap of which static entity covers each cell.
+
+    A cell belongs to a region when its centre lies inside the region's shape, so answers are exact
+    to within half a cell. Where regions overlap the one baked last wins. Points have no area and
+    are not baked.'''
+
+    def __init__(self, width, height, cell_size):
+        self.cell_size = cell_size
+        self.labels = np.full((max(1, math.ceil(width / cell_size)), max(1, math.ceil(height / cell_size))),
+                              -1, dtype=np.int32)  # indexed [x, y], -1 where no region
+        self.entities = []  # label to entity
+        self._lookup = np.array([None], dtype=object)  # entities followed by None, indexed by label
+        self.version = None  # version of the static layer last baked
+
+    def _cell_range(self, low, high, n):
+        '''Cells whose centres lie in [low, high].'''
+        c = self.cell_size
+        return max(math.ceil(low / c - 0.5), 0), min(math.floor(high / c - 0.5) + 1, n)
+
+    def bake(self, entities, version=None):
+        self.labels.fill(-1)
+        self.entities = []
+        nx, ny = self.labels.shape
+        for entity in entities:
+            kind = entity.shape_kind
+            if kind == ShapeKind.Point:
+                continue
+            label = len(self.entities)
+            self.entities.append(entity)
+
+            if kind == ShapeKind.Rectangle:
+                x0, x1 = self._cell_range(entity.left_x, entity.right_x, nx)
+                y0, y1 = self._cell_range(entity.bottom_y, entity.top_y, ny)
+                if x0 < x1 and y0 < y1:
+                    self.labels[x0:x1, y0:y1] = label
+            else:
+                cx, cy = entity.pos.coordinates
+                r = entity.radius
+                x0, x1 = self._cell_range(cx - r, cx + r, nx)
+                y0, y1 = self._cell_range(cy - r, cy + r, ny)
+                if x0 < x1 and y0 < y1:
+                    xs = (np.arange(x0, x1) + 0.5) * self.cell_size - cx
+                    ys = (np.arange(y0, y1) + 0.5) * self.cell_size - cy
+                    inside = xs[:, None] ** 2 + ys[None, :] ** 2 <= r * r
+                    self.labels[x0:x1, y0:y1][inside] = label
+
+        self._lookup = np.array(self.entities + [None], dtype=object)
+        self.version = version
+
+    def label_at(self, x, y):
+        ix = int(x // self.cell_size)
+        iy = int(y // self.cell_size)
+        nx, ny = self.labels.shape
+        if 0 <= ix < nx and 0 <= iy < ny:
+            return int(self.labels[ix, iy])
+        return -1
+
+    def labels_at(self, xs, ys):
+        '''Labels of many points with one gather. Points off the bitmap get -1.'''
+        ix = np.floor_divide(np.asarray(xs, dtype=np.float64), self.cell_size).astype(np.intp)
+        iy = np.floor_divide(np.asarray(ys, dtype=np.float64), self.cell_size).astype(np.intp)
+        nx, ny = self.labels.shape
+        inside = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+        labels = np.full(ix.shape, -1, dtype=np.int32)
+        labels[inside] = self.labels[ix[inside], iy[inside]]
+        return labels
+
+    def region_at(self, x, y):
+        '''Static entity covering (x, y), or None.'''
+        return self._lookup[self.label_at(x, y)]
+
+    def regions_at(self, xs, ys):
+        '''Object array of the static entity (or None) covering each point.'''
+        return self._lookup[self.labels_at(xs, ys)]
@@ -0,0 +1,255 @@
+
+from .physics import PhysicsLib
+from .settings import GlobalSettings as Settings
+
+# todo:
+# keep per-item boxes so queries can also prune inside crowded nodes
+
+
+class QuadNode:
+    '''Region of a QuadTree. Its loose bounds extend half its size past each edge.'''
+    __slots__ = ('x0', 'y0', 'x1', 'y1', 'hw', 'hh', 'loose', 'depth', 'parent', 'children', 'items', 'count')
+
+    def __init__(self, x0, y0, x1, y1, depth, parent):
+        self.x0 = x0
+        self.y0 = y0
+        self.x1 = x1
+        self.y1 = y1
+        self.hw = (x1 - x0) / 2
+        self.hh = (y1 - y0) / 2
+        self.loose = (x0 - self.hw, y0 - self.hh, x1 + self.hw, y1 + self.hh)
+        self.depth = depth
+        self.parent = parent
+        self.children = None
+        self.items = {}  # entity id to entity, insertion ordered for deterministic queries
+        self.count = 0  # entities in this subtree
+
+    def __repr__(self):
+        return f'{type(self).__name__}(depth={self.depth}, x0={self.x0}, y0={self.y0}, x1={self.x1}, y1={self.y1})'
+
+    def contains(self, box):
+        '''Whether box lies inside the loose bounds.'''
+        x0, y0, x1, y1 = self.loose
+        return x0 <= box[0] and y0 <= box[1] and box[2] <= x1 and box[3] <= y1
+
+    def intersects(self, box):
+        '''Whether box overlaps the loose bounds.'''
+        x0, y0, x1, y1 = self.loose
+        return box[0] <= x1 and box[2] >= x0 and box[1] <= y1 and box[3] >= y0
+
+    def child_for(self, box):
+        '''Child whose tight bounds hold the centre of box and whose loose bounds hold all of it.'''
+        if self.children is None:
+            return None
+        cx = (box[0] + box[2]) / 2
+        cy = (box[1] + box[3]) / 2
+        if not (self.x0 <= cx <= self.x1 and self.y0 <= cy <= self.y1):
+            return None
+        child = self.children[(cx >= self.x0 + self.hw) + 2 * (cy >= self.y0 + self.hh)]
+        if box[2] - box[0] <= 2 * child.hw and box[3] - box[1] <= 2 * child.hh:
+            return child
+        return None
+
+
+class QuadTree:
+    '''Adaptive loose quadtree which subdivides regions holding more than capacity entities.
+
+    Entities are filed by their centre in the deepest node whose loose bounds hold their whole
+    bounding box. Small movers never get stuck straddling child edges, and large rectangles stay
+    high in the tree while point-like entities sink to small leaves.'''
+
+    def __init__(self, x0, y0, x1, y1, capacity=8, max_depth=8):
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self.root = QuadNode(x0, y0, x1, y1, 0, None)
+        self.location = {}  # entity id to the node holding it
+
+    def __len__(self):
+        return len(self.location)
+
+    def __iter__(self):
+        for node in self.nodes():
+            yield from node.items.values()
+
+    def nodes(self):
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.children is not None:
+                stack.extend(reversed(node.children))
+
+    def node_for(self, box):
+        '''Deepest existing node box can be filed in (the root if no child fits).'''
+        node = self.root
+        child = node.child_for(box)
+        while child is not None:
+            node = child
+            child = node.child_for(box)
+        return node
+
+    def insert(self, entity):
+        node = self.node_for(PhysicsLib.bounding_box(entity))
+        node.items[entity.id] = entity
+        self.location[entity.id] = node
+        self._adjust_count(node, 1)
+
+        if node.children is None and len(node.items) > self.capacity and node.depth < self.max_depth:
+            self._split(node)
+        return self.location[entity.id]
+
+    def remove(self, entity):
+        node = self.location.pop(entity.id)
+        del node.items[entity.id]
+        self._adjust_count(node, -1)
+        self._collapse(node)
+        return entity
+
+    def move(self, entity):
+        self.remove(entity)
+        return self.insert(entity)
+
+    def query(self, box):
+        '''Entities filed in nodes whose loose bounds overlap box. Items in the root are always included.'''
+        left, bottom, right, top = box
+        result = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            result.extend(node.items.values())
+            if node.children is not None:
+                for child in node.children:
+                    x0, y0, x1, y1 = child.loose
+                    if left <= x1 and right >= x0 and bottom <= y1 and top >= y0:
+                        stack.append(child)
+        return result
+
+    def clear(self):
+        root = self.root
+        self.root = QuadNode(root.x0, root.y0, root.x1, root.y1, 0, None)
+        self.location.clear()  # keep the same dict so aliases stay valid
+
+    @staticmethod
+    def _adjust_count(node, delta):
+        while node is not None:
+            node.count += delta
+            node = node.parent
+
+    def _split(self, node):
+        mx = (node.x0 + node.x1) / 2
+        my = (node.y0 + node.y1) / 2
+        depth = node.depth + 1
+        node.children = (QuadNode(node.x0, node.y0, mx, my, depth, node),
+                         QuadNode(mx, node.y0, node.x1, my, depth, node),
+                         QuadNode(node.x0, my, mx, node.y1, depth, node),
+                         QuadNode(mx, my, node.x1, node.y1, depth, node))
+
+        items = node.items
+        node.items = {}
+        for entity_id, entity in items.items():
+            target = node.child_for(PhysicsLib.bounding_box(entity)) or node
+            target.items[entity_id] = entity
+            self.location[entity_id] = target
+            if target is not node:
+                target.count += 1
+
+        for child in node.children:
+            if len(child.items) > self.capacity and depth < self.max_depth:
+                self._split(child)
+
+    def _collapse(self, node):
+        '''Merge the highest ancestor whose whole subtree now fits comfortably in one node.'''
+        target = None
+        while node is not None:
+            if node.children is not None and node.count <= self.capacity // 2:
+                target = node
+            node = node.parent
+        if target is None:
+            return
+
+        stack = list(target.children)
+        target.children = None
+        while stack:
+            node = stack.pop()
+            for entity_id, entity in node.items.items():
+                target.items[entity_id] = entity
+                self.location[entity_id] = target
+            if node.children is not None:
+                stack.extend(node.children)
+
+
+class QuadtreePhysicsLib(PhysicsLib):
+    '''PhysicsLib backed by an adaptive quadtree instead of a uniform grid.
+
+    Crowded regions subdivide while sparse ones stay coarse, so clustered scenes do not pile
+    into a few grid cells. Sector assignments are the tree nodes holding each entity.
+
+    In broadphase-benchmark.py it is slower than the grid on uniform scenes. On clustered ones it
+    hands out about a third fewer neighbour candidates, but walking the tree still costs more time
+    than the grid spends on the extra candidates.'''
+
+    def _initialize(self):
+        self.validate = Settings.VALIDATE
+        self.auto_tune = False  # the tree adapts as entities are added and removed
+        self._tree = QuadTree(0, 0, Settings.WIDTH, Settings.HEIGHT)
+        self._sector_assignment = self._tree.location
+        self._initialize_registry()
+
+    def rebuild(self, cell_size=None):
+        '''Rebuild the tree from scratch. cell_size is ignored, leaves size themselves.'''
+        entities = self._unique_registered_entities()
+        self._tree.clear()
+        for entity in entities:
+            self._tree.insert(entity)
+
+    def _get_sector_coords(self, entity):
+        return self._tree.node_for(self.bounding_box(entity))
+
+    def _validate_assignment(self, entity):
+        assignment = self.get_sector(entity)
+        for node in self._tree.nodes():
+            if node is assignment:
+                assert entity.id in node.items
+            else:
+                assert entity.id not in node.items
+
+    def add_to_sector(self, entity):
+        if entity.static:
+            return self._add_static(entity)
+
+        self._tree.insert(entity)
+        self._register(entity)
+
+        if self.validate:
+            self._validate_assignment(entity)
+
+    def _move_between_sector(self, entity):
+        self._tree.move(entity)
+
+        if self.validate:
+            self._validate_assignment(entity)
+
+    def remove_from_sector(self, entity):
+        if entity in self._static:
+            return self._remove_static(entity)
+
+        assert entity.id in self._sector_assignment
+        self._tree.remove(entity)
+        self._unregister(entity)
+
+        if self.validate:
+            self._validate_assignment(entity)
+        return entity
+
+    def _dynamic_neighbours(self, entity):
+        return self._tree.query(self.bounding_box(entity))
+
+    def _query_box(self, box):
+        return self._tree.query(box)
+
+    def _ray_step(self):
+        return max(Settings.WIDTH, Settings.HEIGHT) / Settings.PHYSICS_DIVISIONS
+
+    def clear(self):
+        self._tree.clear()
+        self._clear_registry()
@@ -0,0 +1,42 @@
+
+import functools
+import types
+
+# todo:
+# pickle support through __getstate__/__setstate__ built on the same helpers
+
+
+@functools.cache
+def _members(cls):
+    '''Member descriptors of every slot of cls and its bases, keyed by attribute name.'''
+    members = {}
+    for klass in reversed(cls.__mro__):
+        if '__slots__' in vars(klass):
+            for name, value in vars(klass).items():
+                if isinstance(value, types.MemberDescriptorType):
+                    members[name] = value
+    return members
+
+
+def get_state(obj):
+    '''Every attribute set on obj, slotted or in its __dict__, as a name to value dict.'''
+    state = {}
+    for name, member in _members(type(obj)).items():
+        try:
+            state[name] = member.__get__(obj)
+        except AttributeError:  # slot never assigned
+            pass
+    state.update(getattr(obj, '__dict__', ()))
+    return state
+
+
+def set_state(obj, state):
+    '''Write a get_state() dict onto obj. Slots are written through their descriptors, so properties
+    shadowing them in subclasses are bypassed.'''
+    members = _members(type(obj))
+    for name, value in state.items():
+        member = members.get(name)
+        if member is not None:
+            member.__set__(obj, value)
+        else:
+            obj.__dict__[name] = value
@@ -0,0 +1,162 @@
+
+import bisect
+
+from .physics import PhysicsLib
+from .settings import GlobalSettings as Settings
+
+# todo:
+# sweep along whichever axis has the greater spread
+
+
+class SweepAndPrunePhysicsLib(PhysicsLib):
+    '''PhysicsLib which finds candidates by sweeping bounding boxes along the x axis.
+
+    Entities are kept sorted by the left edge of their box. Between frames the order barely
+    changes, so re-sorting the previous order is close to linear (timsort detects the existing
+    runs, like an insertion sort would). A sweep then yields every overlapping pair exactly once.
+    Sector assignments are the bounding boxes recorded at the last update, refreshed for entities
+    moved since then before the next sweep or query.'''
+
+    def _initialize(self):
+        self.validate = Settings.VALIDATE
+        self.auto_tune = False  # nothing to tune, the sweep adapts to the boxes
+        self._sector_assignment = {}  # entity id to its bounding box at the last update
+        self._order = []  # entities sorted by box left edge, may hold removed entities until next sort
+        self._lefts = []  # left edges of _order as of the last sort
+        self._needs_sort = False
+        self._pairs = None  # cached result of the last sweep
+        self._adjacency = None  # entity id to the entities it is paired with in the last sweep
+        self._initialize_registry()
+
+    def _sort(self):
+        boxes = self._sector_assignment
+        if len(self._order) != len(boxes):  # drop removed entities (and duplicates from re-adding)
+            self._order = list({e.id: e for e in self._order if e.id in boxes}.values())
+        self._order.sort(key=lambda e: boxes[e.id][0])
+        self._lefts = [boxes[e.id][0] for e in self._order]  # for bisecting in box queries
+        self._needs_sort = False
+        self._pairs = None
+        self._adjacency = None
+
+    def rebuild(self, cell_size=None):
+        '''Recompute every box and re-sort. cell_size is ignored.'''
+        for entity_id, entity in self._registry.items():
+            self._sector_assignment[entity_id] = self.bounding_box(entity)
+        self._sort()
+
+    def _get_sector_coords(self, entity):
+        return self.bounding_box(entity)
+
+    def _validate_assignment(self, entity):
+        live = [e.id for e in self._order if e.id in self._sector_assignment]
+        assert len(live) == len(set(live))
+        assert (entity.id in self._registry) == (entity.id in self._sector_assignment)
+        assert (entity.id in self._registry) == (entity.id in live)
+
+    def add_to_sector(self, entity):
+        if entity.static:
+            return self._add_static(entity)
+
+        self._register(entity)
+        self._sector_assignment[entity.id] = self.bounding_box(entity)
+        self._order.append(entity)  # sorted into place on the next update
+        self._needs_sort = True
+
+        if self.validate:
+            self._validate_assignment(entity)
+
+    def _move_between_sector(self, entity):
+        self._sector_assignment[entity.id] = self.bounding_box(entity)
+        self._needs_sort = True
+
+    def remove_from_sector(self, entity):
+        if entity in self._static:
+            return self._remove_static(entity)
+
+        assert entity.id in self._sector_assignment
+        self._unregister(entity)
+        del self._sector_assignment[entity.id]
+        self._needs_sort = True
+
+        if self.validate:
+            self._validate_assignment(entity)
+        return entity
+
+    def update_sectors(self, entities=None):
+        if entities is None:
+            entities = self._take_dirty()
+        for entity in entities:
+            if entity.static:
+                self._update_static(entity)
+                continue
+            assert entity.id in self._sector_assignment
+            if not entity.alive:
+                self.remove_from_sector(entity)
+            else:
+                self._move_between_sector(entity)
+        if self._needs_sort:  # nothing moved keeps the last sweep
+            self._sort()
+        self._refresh_static()
+
+    def _sweep(self):
+        '''Pairs of dynamic entities whose boxes overlap, cached until the next sort. Masks are left
+        to get_candidate_pairs, so a changed collision_mask applies without re-sweeping.'''
+        self._refresh_stale()
+        if self._needs_sort:
+            self._sort()
+        if self._pairs is None:
+            boxes = self._sector_assignment
+            pairs = []
+            active = []  # (box, entity) still overlapping the sweep line
+            for entity in self._order:
+                box = boxes[entity.id]
+                left, bottom, _, top = box
+                active = [a for a in active if a[0][2] >= left]
+                for other_box, other in active:
+                    if other_box[1] <= top and bottom <= other_box[3]:
+                        pairs.append((other, entity))
+                active.append((box, entity))
+            self._pairs = pairs
+        return self._pairs
+
+    def get_candidate_pairs(self):
+        '''Pairs of entities whose boxes overlap and whose masks let them collide, each pair exactly once.
+        Categories and masks are read live, the sweep itself is cached.'''
+        pairs = [(e1, e2) for e1, e2 in self._sweep()
+                 if e1.collision_category & e2.collision_mask and e2.collision_category & e1.collision_mask]
+        return pairs + self._static_pairs(self._registry.values())
+
+    def _dynamic_neighbours(self, entity):
+        pairs = self._sweep()
+        if self._adjacency is None:
+            self._adjacency = {entity_id: [e] for entity_id, e in self._registry.items()}
+            for e1, e2 in pairs:
+                self._adjacency[e1.id].append(e2)
+                self._adjacency[e2.id].append(e1)
+        return self._adjacency.get(entity.id, [entity])
+
+    def _query_box(self, box):
+        '''Entities starting left of the box's right edge are scanned, the rest skipped by bisection.'''
+        self._refresh_stale()
+        if self._needs_sort:
+            self._sort()
+        left, bottom, right, top = box
+        boxes = self._sector_assignment
+        result = []
+        for entity in self._order[:bisect.bisect_right(self._lefts, right)]:
+            b = boxes[entity.id]
+            if b[2] >= left and b[1] <= top and b[3] >= bottom:
+                result.append(entity)
+        return result
+
+    def _ray_step(self):
+        return max(Settings.WIDTH, Settings.HEIGHT) / Settings.PHYSICS_DIVISIONS
+
+    def clear(self):
+        self._clear_registry()
+        self._sector_assignment.clear()
+        self._order.clear()
+        self._lefts.clear()
+        self._needs_sort = False
+        self._pairs = None
+        self._adjacency = None
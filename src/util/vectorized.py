@@ -0,0 +1,188 @@
+
+import numpy as np
+
+from .physics import PhysicsLib
+from .settings import GlobalSettings as Settings
+
+# todo:
+# hand candidate rows straight to the narrowphase instead of building entity tuples
+
+
+class NumpyPhysicsLib(PhysicsLib):
+    '''PhysicsLib which keeps every dynamic bounding box in NumPy arrays and finds pairs in bulk.
+
+    Boxes live in an (n, 4) array with one row per entity, refreshed only for dirty entities.
+    Candidate pairs come from a vectorised sort and sweep: a searchsorted on the sorted left edges
+    gives each entity's run of x overlaps, which is expanded and filtered on y and the collision
+    masks without a Python loop. Sector assignments are array rows.
+
+    Box overlaps are cached between updates, categories and masks are gathered live on every call so
+    changing an entity's collision_mask takes effect straight away. Boxes of entities moved since the
+    last update are refreshed before the next sweep or query, so both see current positions.
+
+    Spatial queries bisect the same sort: only rows whose left edge lies within the widest box of
+    the query's x range are tested. Each query still pays NumPy's fixed call overhead, so many tiny
+    queries over a few hundred entities are slower here than on the grid, and a single very wide
+    box widens every query window.'''
+
+    def _initialize(self):
+        self.validate = Settings.VALIDATE
+        self.auto_tune = False  # nothing to tune, the sweep adapts to the boxes
+        self._sector_assignment = {}  # entity id to its row
+        self._rows = []  # row to entity
+        self._boxes = np.empty((64, 4))  # (left, bottom, right, top) per row, grown as needed
+        self._overlaps = None  # cached (a, b) row arrays of the last sweep
+        self._sorted = None  # cached (order, sorted left edges, widest box width), shared by sweep and queries
+        self._initialize_registry()
+
+    def _invalidate(self):
+        self._overlaps = None
+        self._sorted = None
+
+    def _grow(self):
+        capacity = 2 * len(self._boxes)
+        self._boxes = np.resize(self._boxes, (capacity, 4))
+
+    def _get_sector_coords(self, entity):
+        return self._sector_assignment[entity.id]  # rows do not depend on position
+
+    def _validate_assignment(self, entity):
+        assert len(self._rows) == len(self._sector_assignment) == len(self._registry)
+        for row, e in enumerate(self._rows):
+            assert self._sector_assignment[e.id] == row
+        if entity.id in self._sector_assignment:
+            row = self._sector_assignment[entity.id]
+            assert tuple(self._boxes[row]) == self.bounding_box(entity)
+
+    def rebuild(self, cell_size=None):
+        '''Refresh every box. cell_size is ignored.'''
+        for row, entity in enumerate(self._rows):
+            self._boxes[row] = self.bounding_box(entity)
+        self._invalidate()
+
+    def add_to_sector(self, entity):
+        if entity.static:
+            return self._add_static(entity)
+
+        row = len(self._rows)
+        if row == len(self._boxes):
+            self._grow()
+        self._rows.append(entity)
+        self._sector_assignment[entity.id] = row
+        self._boxes[row] = self.bounding_box(entity)
+        self._register(entity)
+        self._invalidate()
+
+        if self.validate:
+            self._validate_assignment(entity)
+
+    def _move_between_sector(self, entity):
+        self._boxes[self._sector_assignment[entity.id]] = self.bounding_box(entity)
+        self._invalidate()
+
+    def remove_from_sector(self, entity):
+        if entity in self._static:
+            return self._remove_static(entity)
+
+        assert entity.id in self._sector_assignment
+        row = self._sector_assignment.pop(entity.id)
+        last = len(self._rows) - 1
+        moved = self._rows.pop()
+        if row != last:  # fill the hole with the last row
+            self._rows[row] = moved
+            self._sector_assignment[moved.id] = row
+            self._boxes[row] = self._boxes[last]
+        self._unregister(entity)
+        self._invalidate()
+
+        if self.validate:
+            self._validate_assignment(entity)
+        return entity
+
+    def update_sectors(self, entities=None):
+        if entities is None:
+            entities = self._take_dirty()
+        for entity in entities:
+            if entity.static:
+                self._update_static(entity)
+                continue
+            assert entity.id in self._sector_assignment
+            if not entity.alive:
+                self.remove_from_sector(entity)
+            else:
+                self._move_between_sector(entity)
+        self._refresh_static()
+
+    def _sorted_rows(self):
+        '''Rows sorted by left edge, the sorted left edges and the widest box, cached until a box changes.'''
+        if self._sorted is None:
+            boxes = self._boxes[:len(self._rows)]
+            order = np.argsort(boxes[:, 0], kind='stable')
+            reach = float(np.max(boxes[:, 2] - boxes[:, 0])) if len(boxes) else 0.0
+            self._sorted = order, boxes[order, 0], reach
+        return self._sorted
+
+    def _sweep_rows(self):
+        '''Row pairs (a, b) of dynamic entities whose boxes overlap, cached until a box changes.'''
+        self._refresh_stale()
+        if self._overlaps is None:
+            n = len(self._rows)
+            boxes = self._boxes[:n]
+            order, lefts, _ = self._sorted_rows()
+            # entities after i in sorted order start at or after its left edge, so they overlap it on x
+            # exactly when they start before its right edge
+            ends = np.searchsorted(lefts, boxes[order, 2], side='right')
+            counts = np.maximum(ends - np.arange(n) - 1, 0)
+            i = np.repeat(np.arange(n), counts)
+            j = i + 1 + np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+            a = order[i]
+            b = order[j]
+            keep = (boxes[a, 1] <= boxes[b, 3]) & (boxes[b, 1] <= boxes[a, 3])
+            self._overlaps = a[keep], b[keep]
+        return self._overlaps
+
+    def _collision_bits(self):
+        '''Live categories and masks of every row.'''
+        rows = self._rows
+        n = len(rows)
+        categories = np.fromiter((e.collision_category for e in rows), dtype=np.int64, count=n)
+        masks = np.fromiter((e.collision_mask for e in rows), dtype=np.int64, count=n)
+        return categories, masks
+
+    def _sweep(self):
+        '''Overlapping pairs whose current masks let them collide.'''
+        rows = self._rows
+        a, b = self._sweep_rows()
+        categories, masks = self._collision_bits()
+        keep = (categories[a] & masks[b] != 0) & (categories[b] & masks[a] != 0)
+        return [(rows[x], rows[y]) for x, y in zip(a[keep].tolist(), b[keep].tolist())]
+
+    def get_candidate_pairs(self):
+        '''Pairs of entities whose boxes overlap, each pair exactly once.'''
+        return self._sweep() + self._static_pairs(self._registry.values())
+
+    def _query_box(self, box):
+        '''Rows starting within the widest box of the query's x range are found by bisection, only
+        those are tested against the box.'''
+        self._refresh_stale()
+        order, lefts, reach = self._sorted_rows()
+        left, bottom, right, top = box
+        start = np.searchsorted(lefts, left - reach, side='left')
+        end = np.searchsorted(lefts, right, side='right')
+        window = order[start:end]
+        boxes = self._boxes[window]
+        hits = window[(boxes[:, 2] >= left) & (boxes[:, 1] <= top) & (boxes[:, 3] >= bottom)]
+        rows = self._rows
+        return [rows[row] for row in hits.tolist()]
+
+    def _dynamic_neighbours(self, entity):
+        return self._query_box(self.bounding_box(entity))
+
+    def _ray_step(self):
+        return max(Settings.WIDTH, Settings.HEIGHT) / Settings.PHYSICS_DIVISIONS
+
+    def clear(self):
+        self._sector_assignment.clear()
+        self._rows.clear()
+        self._invalidate()
+        self._clear_registry()
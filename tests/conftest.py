@@ -0,0 +1,49 @@
+
+import itertools
+import os
+
+import pytest
+
+# Run the suite with the expensive debug invariant checks enabled. Must be set before `util` is imported
+os.environ.setdefault('REACTOR_VALIDATE', '1')
+
+from entities import CircleEntity  # noqa: E402
+from util import BACKENDS, PhysicsLib  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clear_backends():
+    '''Backends are singletons, so every test starts and ends with all of them empty.'''
+    for cls in BACKENDS.values():
+        cls().clear()
+    yield
+    for cls in BACKENDS.values():
+        cls().clear()
+
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request):
+    '''Each registered physics backend in turn.'''
+    return BACKENDS[request.param]()
+
+
+def make_circle(x, y, r=3, static=False):
+    return CircleEntity(x, y, 0, 0, (255, 255, 255), r, static=static)
+
+
+def boxes_overlap(a, b):
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def brute_force_pairs(entities):
+    '''Ids of every pair of entities whose boxes overlap and whose masks let them collide.'''
+    return {frozenset((e1.id, e2.id)) for e1, e2 in itertools.combinations(entities, 2)
+            if boxes_overlap(PhysicsLib.bounding_box(e1), PhysicsLib.bounding_box(e2))
+            and PhysicsLib.can_collide(e1, e2)}
+
+
+def pair_ids(pairs):
+    ids = [frozenset((e1.id, e2.id)) for e1, e2 in pairs]
+    assert len(ids) == len(set(ids))  # every pair reported once
+    assert all(len(pair) == 2 for pair in ids)  # never paired with itself
+    return set(ids)
@@ -0,0 +1,154 @@
+import random
+
+import pytest
+
+from conftest import brute_force_pairs, make_circle, pair_ids
+from entities import PointEntity, RectangleEntity, Water
+from geometry import Point, Vector
+from util import (BACKENDS, NumpyPhysicsLib, Physics, PhysicsLib, Settings, SweepAndPrunePhysicsLib,
+                  create_physics, register_backend)
+
+Numpy = NumpyPhysicsLib()
+EXACT = (SweepAndPrunePhysicsLib, NumpyPhysicsLib)  # sweeps pair exactly the overlapping boxes, grids a superset
+
+
+def make_scene(seed):
+    rand = random.Random(seed)
+    entities = [make_circle(rand.uniform(0, 300), rand.uniform(0, 300), rand.uniform(2, 10)) for _ in range(100)]
+    entities += [PointEntity(rand.uniform(0, 300), rand.uniform(0, 300), 0, 0, (255, 255, 255), 3) for _ in range(30)]
+    entities.append(RectangleEntity(50, 50, 0, 0, (255, 255, 255), 60, 30))
+    return entities
+
+
+def assert_pairs_match(physics, entities):
+    expected = brute_force_pairs(entities)
+    pairs = pair_ids(physics.get_candidate_pairs())
+    if isinstance(physics, EXACT):
+        assert pairs == expected
+    else:
+        assert pairs >= expected
+    by_id = {e.id: e for e in entities}
+    colliding = {pair for pair in expected if PhysicsLib.intersects(*(by_id[i] for i in pair))}
+    assert pair_ids(physics.get_colliding_pairs()) == colliding
+
+
+def test_configured_backend():
+    assert Settings.PHYSICS_BACKEND == 'grid'
+    assert type(Physics) is BACKENDS[Settings.PHYSICS_BACKEND]
+
+
+@pytest.mark.parametrize('name', list(BACKENDS))
+def test_create_physics(name):
+    physics = create_physics(name)
+    assert type(physics) is BACKENDS[name]
+    assert create_physics(name) is physics
+
+
+def test_create_physics_unknown():
+    with pytest.raises(ValueError):
+        create_physics('octree')
+
+
+def test_register_backend():
+    class CustomPhysicsLib(PhysicsLib):
+        pass
+
+    register_backend('custom', CustomPhysicsLib)
+    try:
+        assert type(create_physics('custom')) is CustomPhysicsLib
+    finally:
+        del BACKENDS['custom']
+
+    with pytest.raises(TypeError):
+        register_backend('bad', object)
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_backend_pairs_match_brute_force(backend, seed):
+    entities = make_scene(seed)
+    for e in entities:
+        backend.add_to_sector(e)
+    backend.rebuild()
+    assert_pairs_match(backend, entities)
+
+    rand = random.Random(seed)
+    for _ in range(2):
+        for e in entities:
+            e.translate(Vector(rand.uniform(-1, 1), rand.uniform(-1, 1)), 10)
+        backend.update_sectors()
+        assert_pairs_match(backend, entities)
+
+    for e in entities[::3]:
+        e.alive = False
+    backend.update_sectors()
+    remaining = [e for e in entities if e.alive]
+    assert sorted(e.id for e in backend.get_registered_entities()) == sorted(e.id for e in remaining)
+    assert_pairs_match(backend, remaining)
+
+
+def test_numpy_grows_and_static_pairs():
+    circles = [make_circle(i % 40 * 10, i // 40 * 10, 6) for i in range(200)]  # past the initial capacity
+    water = Water(0, 0, 100, 100)
+    for e in circles + [water]:
+        Numpy.add_to_sector(e)
+
+    assert len(Numpy.get_registered_entities()) == 200
+    pairs = pair_ids(Numpy.get_candidate_pairs())
+    assert frozenset((circles[0].id, water.id)) in pairs
+    assert pairs >= brute_force_pairs(circles)
+    assert {e.id for e in Numpy.get_neighbour_entities(circles[0])} >= {circles[0].id, circles[1].id, water.id}
+
+
+def test_backend_pairs_respect_mask_changes(backend):
+    points = [PointEntity(10 + i, 10, 0, 0, (255, 255, 255), 3) for i in range(5)]
+    circle = make_circle(12, 10)
+    water = Water(0, 0, 50, 50)
+    for e in points + [circle, water]:
+        backend.add_to_sector(e)
+    backend.rebuild()
+
+    pairs = pair_ids(backend.get_candidate_pairs())
+    assert {frozenset((p.id, circle.id)) for p in points} <= pairs
+    assert frozenset((circle.id, water.id)) in pairs
+
+    circle.collision_mask = PhysicsLib.Category.ALL & ~(PhysicsLib.Category.PARTICLE | PhysicsLib.Category.WATER)
+    pairs = pair_ids(backend.get_candidate_pairs())  # no update in between
+    assert not any(circle.id in pair for pair in pairs)
+    assert pairs == brute_force_pairs(points) | {frozenset((p.id, water.id)) for p in points}
+
+    del circle.collision_mask  # back to the class default
+    assert frozenset((points[0].id, circle.id)) in pair_ids(backend.get_candidate_pairs())
+
+
+def test_numpy_query_window_reaches_wide_boxes():
+    wide = RectangleEntity(0, 0, 0, 0, (255, 255, 255), 400, 10)
+    points = [PointEntity(50 * i, 5, 0, 0, (255, 255, 255), 3) for i in range(10)]
+    for e in [wide] + points:
+        Numpy.add_to_sector(e)
+    order, lefts, reach = Numpy._sorted_rows()
+    assert reach == 400
+    assert lefts.tolist() == sorted(lefts.tolist())
+
+    found = Numpy._query_box((390, 0, 395, 10))  # far right of where wide starts
+    assert {e.id for e in found} == {wide.id}
+    found = Numpy._query_box((440, 0, 460, 10))
+    assert {e.id for e in found} == {points[9].id}
+
+    wide.translate(Vector(1000, 0))
+    Numpy.update_sectors()
+    assert Numpy._sorted_rows()[1].tolist()[-1] == 1000
+
+
+def test_backend_sees_moves_before_refiling(backend):
+    circle = make_circle(100, 100, 5)
+    other = make_circle(130, 100, 5)
+    backend.add_to_sector(circle)
+    backend.add_to_sector(other)
+    backend.update_sectors()
+    assert backend.get_colliding_pairs() == []
+
+    circle.translate(Vector(10, 0))  # marked dirty, refiled only by the next update_sectors()
+    assert [e.id for e in backend.query_radius(Point(110, 100), 1)] == [circle.id]
+    assert backend.query_radius(Point(100, 100), 1) == []
+    other.translate(Vector(-12, 0))
+    assert pair_ids(backend.get_colliding_pairs()) == {frozenset((circle.id, other.id))}
@@ -0,0 +1,102 @@
+import itertools
+import random
+
+import pytest
+
+from conftest import boxes_overlap
+from entities import PointEntity, RectangleEntity, Water
+from util import PhysicsLib, Settings
+from util.bvh import StaticBVH
+
+def make_point(x, y, r=3):
+    return PointEntity(x, y, 0, 0, (255, 255, 255), r)
+
+
+def make_static_rects(n, seed=0):
+    rand = random.Random(seed)
+    return [RectangleEntity(rand.uniform(0, 500), rand.uniform(0, 500), 0, 0, (255, 255, 255),
+                            rand.uniform(5, 60), rand.uniform(5, 60), static=True) for _ in range(n)]
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_bvh_query_matches_brute_force(seed):
+    rects = make_static_rects(100, seed)
+    bvh = StaticBVH(PhysicsLib.bounding_box)
+    for r in rects:
+        bvh.add(r)
+
+    rand = random.Random(seed)
+    for _ in range(50):
+        x, y = rand.uniform(0, 500), rand.uniform(0, 500)
+        box = (x, y, x + rand.uniform(0, 30), y + rand.uniform(0, 30))
+        expected = {r.id for r in rects if boxes_overlap(PhysicsLib.bounding_box(r), box)}
+        found = bvh.query(box)
+        assert len(found) == len(expected)
+        assert {r.id for r in found} == expected
+
+
+def test_bvh_builds_lazily_once():
+    bvh = StaticBVH(PhysicsLib.bounding_box)
+    for r in make_static_rects(20):
+        bvh.add(r)
+    assert bvh._root is None
+
+    bvh.query((0, 0, 10, 10))
+    root = bvh._root
+    bvh.query((100, 100, 200, 200))
+    assert bvh._root is root
+
+    bvh.invalidate()
+    bvh.query((0, 0, 10, 10))
+    assert bvh._root is not root
+
+
+def test_bvh_skips_and_purges_killed():
+    rects = make_static_rects(20)
+    bvh = StaticBVH(PhysicsLib.bounding_box)
+    for r in rects:
+        bvh.add(r)
+
+    rects[0].alive = False
+    assert rects[0] not in bvh.query(PhysicsLib.bounding_box(rects[0]))
+    assert rects[0] in bvh
+
+    bvh.purge()
+    assert rects[0] not in bvh
+    assert len(bvh) == 19
+
+
+def test_static_entities_are_not_sectored(backend):
+    water = Water(0, 0, 100, 100)
+    p = make_point(50, 50)
+    backend.add_to_sector(water)
+    backend.add_to_sector(p)
+
+    assert backend.get_registered_entities() == (p,)
+    assert backend.get_static_entities() == (water,)
+    assert water.id not in backend._sector_assignment
+
+    backend.update_sectors((water, p))
+    assert backend.get_static_entities() == (water,)
+
+    assert backend.remove_from_sector(water) is water
+    assert backend.get_static_entities() == ()
+
+
+def test_static_pairs_skip_static_static(backend):
+    statics = make_static_rects(30)
+    rand = random.Random(4)
+    points = [make_point(rand.uniform(0, 500), rand.uniform(0, 500)) for _ in range(60)]
+    for e in statics + points:
+        backend.add_to_sector(e)
+    backend.rebuild(Settings.WIDTH / Settings.PHYSICS_DIVISIONS)
+
+    pairs = {frozenset((e1.id, e2.id)) for e1, e2 in backend.get_candidate_pairs()}
+    static_ids = {s.id for s in statics}
+    assert not any(pair <= static_ids for pair in pairs)
+
+    expected = {frozenset((p.id, s.id)) for p, s in itertools.product(points, statics)
+                if boxes_overlap(PhysicsLib.bounding_box(p), PhysicsLib.bounding_box(s))}
+    assert expected <= pairs
+    neighbours = {e.id for e in backend.get_neighbour_entities(points[0])}
+    assert {s.id for s in statics if frozenset((points[0].id, s.id)) in expected} <= neighbours
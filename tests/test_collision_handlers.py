@@ -0,0 +1,91 @@
+import pytest
+
+from conftest import make_circle
+from entities import CircleEntity, CollisionHandlers, Neutron, Particle, PointEntity, RectangleEntity, Water
+
+
+def make_point(x, y):
+    return PointEntity(x, y, 0, 0, (255, 255, 255), 3)
+
+
+@pytest.fixture
+def recorder():
+    calls = []
+
+    def make(name):
+        def handler(items, dt):
+            calls.append((name, list(items), dt))
+        return handler
+    return calls, make
+
+
+def test_handlers_receive_pairs_in_registered_order(recorder):
+    calls, make = recorder
+    handlers = CollisionHandlers()
+    handlers.register(Water, CircleEntity, make('heat'))
+    water = Water(0, 0, 50, 50)
+    circle = make_circle(10, 10)
+
+    handlers.run([(circle, water)], 0.5)
+    assert calls == [('heat', [(water, circle)], 0.5)]
+
+
+def test_handlers_apply_to_subclasses(recorder):
+    calls, make = recorder
+    handlers = CollisionHandlers()
+    handlers.register(PointEntity, RectangleEntity, make('hit'))
+    neutron = Neutron(10, 10, 0, 0, 3)
+    water = Water(0, 0, 50, 50)
+
+    handlers.run([(water, neutron)], 1)
+    assert calls == [('hit', [(neutron, water)], 1)]
+
+
+def test_handlers_run_once_per_bucket(recorder):
+    calls, make = recorder
+    handlers = CollisionHandlers()
+    handlers.register(Water, CircleEntity, make('heat'))
+    handlers.register(CircleEntity, CircleEntity, make('bump'))
+    water = Water(0, 0, 50, 50)
+    circles = [make_circle(10 + i, 10) for i in range(3)]
+
+    handlers.run([(water, c) for c in circles] + [(circles[0], circles[1])], 1)
+    assert sorted(name for name, _, _ in calls) == ['bump', 'heat']
+    assert dict((name, items) for name, items, _ in calls)['heat'] == [(water, c) for c in circles]
+
+
+def test_unhandled_and_missed_pairs_are_dropped(recorder):
+    calls, make = recorder
+    handlers = CollisionHandlers()
+    handlers.register(Water, CircleEntity, make('heat'))
+    water = Water(0, 0, 50, 50)
+
+    assert handlers.bucket([(make_point(10, 10), water), (make_point(1, 1), make_point(1, 1))]) == {}
+    handlers.run([(water, make_circle(200, 200))], 1)  # candidate but not touching
+    assert calls == []
+
+
+def test_entity_handlers(recorder):
+    calls, make = recorder
+    handlers = CollisionHandlers()
+    handlers.register_entity(PointEntity, make('border'))
+    points = [make_point(1, 1), Neutron(2, 2, 0, 0, 3)]
+
+    handlers.run_entities(points + [make_circle(1, 1)], 1)
+    assert calls == [('border', points, 1)]
+
+    handlers.clear()
+    handlers.run_entities(points, 1)
+    assert len(calls) == 1
+
+
+def test_entity_handlers_exact(recorder):
+    calls, make = recorder
+    handlers = CollisionHandlers()
+    border = make('border')
+    handlers.register_entity(PointEntity, border, exact=True)
+    handlers.register_entity(Particle, border, exact=True)
+    point, particle = make_point(1, 1), Particle(2, 2, 0, 0, (255, 255, 255), 3)
+
+    handlers.run_entities([point, Neutron(2, 2, 0, 0, 3), particle], 1)
+    assert calls == [('border', [point, particle], 1)]
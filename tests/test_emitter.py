@@ -1,9 +1,12 @@
+import math
+from copy import deepcopy
 
+import numpy as np
 import pytest
 
-from entities import Emitter
+from entities import Atom, DecayScheduler, Emitter, NeutronSwarm, Radioactivity, RandomDirection
 from entities.component_emitter import ProbabilityEmitter, TimeEmitter
-from geometry import Point, Vector
+from geometry import EPSILON, Point, Vector
 
 params_emitter_params = [
     (0, 0, 1, Vector(1, 1))
@@ -60,3 +63,188 @@ def test_timeemitter_creation(x, y, n, vf):
     for i in range(iterations):
         emitter.update(dt)
         assert len(output) == 0 + (i+1)*dt // timeframe
+
+
+@pytest.mark.parametrize('x,y,n,vf', params_emitter_params)
+def test_emitter_emit_batch(x, y, n, vf):
+    output = []
+    emitter = Emitter(x, y, n, vf, output)
+
+    emitter.emit(5)
+    assert len(output) == 5
+    for particle in output:
+        assert particle.pos == Point(x, y)
+        assert particle.vel == vf
+
+    emitter.emit(0)
+    assert len(output) == 5
+
+
+@pytest.mark.parametrize('n', [0, 1, 50])
+def test_emitter_emit_into_swarm(n):
+    output = []
+    swarm = NeutronSwarm(capacity=4)
+    emitter = Emitter(10, 20, n, RandomDirection(100), output, swarm=swarm)
+
+    emitter.emit()
+    assert output == []
+    assert len(swarm) == n
+    assert (swarm.positions[:n] == (10, 20)).all()
+    assert np.allclose(np.hypot(*swarm.velocities[:n].T), 100)
+
+    clone = deepcopy(emitter)
+    assert clone.swarm is swarm
+    clone.emit(2)
+    assert len(swarm) == n + 2
+
+
+@pytest.mark.parametrize('speed', [1, 100])
+def test_random_direction_sample(speed):
+    direction = RandomDirection(speed)
+    vels = direction.sample(50)
+    assert len(vels) == 50
+    assert all(abs(m - speed) < EPSILON for m in vels.magnitude)
+    assert abs(direction().magnitude - speed) < EPSILON
+
+
+@pytest.mark.parametrize('speed', [1, 100])
+def test_emitter_random_direction_emit(speed):
+    output = []
+    emitter = Emitter(0, 0, 10, RandomDirection(speed), output)
+
+    emitter.emit()
+    assert len(output) == 10
+    assert all(abs(p.vel.magnitude - speed) < EPSILON for p in output)
+
+
+@pytest.mark.parametrize('x,y,n,vf', params_emitter_params)
+def test_timeemitter_multiple_bursts(x, y, n, vf):
+    output = []
+    emitter = TimeEmitter(x, y, n, vf, output, 0.25)
+
+    emitter.update(1)  # 4 timeframes elapse in one update
+    assert len(output) == 4 * n
+
+
+class CountingEmitter:  # minimal stand in for a scheduled emitter
+    def __init__(self, rate):
+        self.decay_rate = rate
+        self.alive = True
+        self.enable = True
+        self.emitted = 0
+
+    def emit(self):
+        self.emitted += 1
+
+
+@pytest.mark.parametrize('probability', [0.01, 0.2])
+def test_decayscheduler_matches_per_frame_probability(probability):
+    fps = 60
+    frames = 200
+    scheduler = DecayScheduler()
+    emitters = [CountingEmitter(-math.log1p(-probability) * fps) for _ in range(500)]
+    for emitter in emitters:
+        scheduler.schedule(emitter)
+
+    for _ in range(frames):
+        scheduler.update(1 / fps)
+
+    trials = len(emitters) * frames
+    expected = trials * probability
+    sigma = math.sqrt(trials * probability * (1 - probability))
+    assert abs(sum(e.emitted for e in emitters) - expected) < 5 * sigma
+    assert len(scheduler) == len(emitters)
+
+
+def test_decayscheduler_drops_dead_and_skips_disabled():
+    scheduler = DecayScheduler()
+    dead, disabled = CountingEmitter(1000), CountingEmitter(1000)
+    disabled.enable = False
+    scheduler.schedule(dead)
+    scheduler.schedule(disabled)
+    dead.alive = False
+
+    scheduler.update(1)
+    assert dead.emitted == 0
+    assert disabled.emitted == 0
+    assert len(scheduler) == 1  # disabled emitter stays scheduled
+
+
+def test_decayscheduler_unschedule():
+    scheduler = DecayScheduler()
+    kept, dropped = CountingEmitter(1000), CountingEmitter(1000)
+    scheduler.schedule(kept)
+    scheduler.schedule(dropped)
+    scheduler.schedule(dropped)  # already scheduled
+    assert len(scheduler) == 2
+
+    scheduler.unschedule(dropped)
+    assert len(scheduler) == 1
+    assert dropped not in scheduler and kept in scheduler
+    scheduler.update(1)
+    assert dropped.emitted == 0 and kept.emitted == 1
+
+
+def test_radioactivity_scheduled_emission():
+    output = []
+    scheduler = DecayScheduler()
+    emitter = Radioactivity(0, 0, 2, 10, output, 30)
+    assert len(scheduler) == 0  # constructing does not schedule
+    emitter.schedule(scheduler)
+    assert emitter in scheduler
+
+    emitter.update(1)  # per-frame updates do not roll for decays
+    assert len(output) == 0
+
+    for _ in range(100):
+        scheduler.update(1 / 60)
+    assert len(output) > 0
+    assert len(output) % 2 == 0
+
+    emitter.kill()
+    assert len(scheduler) == 0
+    scheduler.update(100)
+    assert len(scheduler) == 0
+
+
+@pytest.mark.parametrize('fps', [30, 240])
+def test_radioactivity_rate_is_per_simulated_second(fps):
+    output = []
+    scheduler = DecayScheduler()
+    emitters = [Radioactivity(0, 0, 1, 10, output, 0.5) for _ in range(200)]
+    for emitter in emitters:
+        emitter.schedule(scheduler)
+    for _ in range(10 * fps):  # 10 simulated seconds
+        scheduler.update(1 / fps)
+    # at most one decay per update, so the count is binomial over the updates
+    trials = len(emitters) * 10 * fps
+    probability = -math.expm1(-0.5 / fps)
+    expected = trials * probability
+    assert abs(len(output) - expected) < 5 * math.sqrt(expected)
+
+
+@pytest.mark.parametrize('kill', [lambda a: setattr(a, 'alive', False), lambda a: a.kill()])
+def test_atom_death_unschedules_radioactivity(kill):
+    scheduler = DecayScheduler()
+    atom = Atom(0, 0, 0, 0, 10, 1, 5, None, [])
+    atom.radioactivity.schedule(scheduler)
+    assert len(scheduler) == 1
+    kill(atom)
+    assert not atom.radioactivity.alive
+    assert len(scheduler) == 0
+
+
+def test_radioactivity_copy_is_not_scheduled():
+    scheduler = DecayScheduler()
+    emitter = Radioactivity(0, 0, 1, 10, [], 5)
+    emitter.schedule(scheduler)
+    clone = deepcopy(emitter)
+    assert clone not in scheduler and clone.scheduler is None
+    clone.kill()
+    assert emitter in scheduler
+
+
+@pytest.mark.parametrize('rate', [-0.1, -1, math.nan])
+def test_radioactivity_invalid_rate(rate):
+    with pytest.raises(ValueError):
+        Radioactivity(0, 0, 1, 10, [], rate)
@@ -1,16 +1,18 @@
 
 import math
+from copy import copy, deepcopy
 
 import pytest
 
-from entities import CircleEntity, PointEntity, RectangleEntity
-from entities.graphical_entity import GraphicalEntity
+from entities import CircleEntity, Neutron, PointEntity, RectangleEntity
+from entities.graphical_entity import GraphicalEntity, static_update_function
 from entities.graphical_entity_complex import ComplexGraphicalEntity
 from entities.graphical_entity_simple import SimpleGraphicalEntity
 from geometry import EPSILON, Point, Vector
 from image import CircleImage
 from image.image_complex import ComplexImage
 from image.rectangle_image import RectangleImage
+from util import get_state
 
 params_setup_args = [
     (1, 2, 3, 4, (255, 128, 64, 32), 5),
@@ -70,6 +72,30 @@ def test_graphical_entity_move(x, y, dx, dy, c, r):
     assert e.pos == Point(x, y) + Vector(dx, dy) * 2
 
 
+@pytest.mark.parametrize('x,y,dx,dy,c,r', params_setup_args)
+def test_graphical_entity_translate(x, y, dx, dy, c, r):
+    i = CircleImage(0, 0, c, r)
+    e = GraphicalEntity(x, y, dx, dy, i)
+
+    pos = e.pos
+    e.translate(e.vel, -0.5)
+    assert e.pos is pos  # moved in place
+    assert e.pos == Point(x, y) - Vector(dx, dy) * 0.5
+    assert i.shapes[0].pos == e.pos
+
+
+@pytest.mark.parametrize('x,y,dx,dy,c,r', params_setup_args)
+def test_graphical_entity_static_update(x, y, dx, dy, c, r):
+    class MovingUpdate(GraphicalEntity):
+        @static_update_function
+        def _update(self, dt):
+            self.translate(self.vel, dt)
+
+    e = MovingUpdate(x, y, dx, dy, CircleImage(0, 0, c, r))
+    with pytest.raises(AssertionError):
+        e.update(1)
+
+
 @pytest.mark.parametrize('x,y,dx,dy,c,r', params_setup_args)
 def test_simple_graphical_entity_creation(x, y, dx, dy, c, r):
     i = CircleImage(0, 0, c, r)
@@ -159,15 +185,59 @@ def test_rectangle_entity_creation(x, y, dx, dy, c, w, h):
     assert type(e.image) is RectangleImage
 
 
+@pytest.mark.parametrize('x,y,dx,dy,c,r', params_setup_args)
+def test_point_entity_is_slotted(x, y, dx, dy, c, r):
+    e = PointEntity(x, y, dx, dy, c, r)
+    assert not hasattr(e, '__dict__')
+    assert not hasattr(e.image, '__dict__')
+    assert not hasattr(e.image.shapes[0], '__dict__')
+    assert not hasattr(Neutron(x, y, dx, dy, r), '__dict__')
+    with pytest.raises(AttributeError):
+        e.extra = 1
+
+
+@pytest.mark.parametrize('x,y,dx,dy,c,r', params_setup_args)
+def test_point_entity_copy_deepcopy(x, y, dx, dy, c, r):
+    e = PointEntity(x, y, dx, dy, c, r)
+    shallow = copy(e)
+    assert shallow.id == e.id
+    assert shallow.pos is e.pos and shallow.image is e.image
+
+    deep = deepcopy(e)
+    assert deep.id != e.id
+    assert deep.pos == e.pos and deep.pos is not e.pos
+    assert deep.vel == e.vel and deep.radius == e.radius and deep.color == e.color
+    assert deep.image is not e.image
+    deep.translate(Vector(1, 1))
+    assert e.pos == Point(x, y)
+
+
+@pytest.mark.parametrize('x,y,dx,dy,c,r', params_setup_args)
+def test_point_entity_state_has_no_dead_slots(x, y, dx, dy, c, r):
+    e = PointEntity(x, y, dx, dy, c, r)
+    e.alive = False
+    state = get_state(e)
+    assert state['_alive'] is False
+    assert 'alive' not in state
+    assert copy(e).alive is False and deepcopy(e).alive is False
+
+
+@pytest.mark.parametrize('x,y,dx,dy,c,r', params_circle_args)
+def test_unslotted_subclass_takes_extra_attributes(x, y, dx, dy, c, r):
+    e = CircleEntity(x, y, dx, dy, c, r)
+    e.extra = 1
+    assert deepcopy(e).extra == 1
+    assert copy(e).extra == 1
+
+
 @pytest.mark.parametrize('x1,y1,w1,h1,x2,y2,w2,h2', params_2_rect_args)
 def test_rectangle_rectangle_entity_contains(x1, y1, w1, h1, x2, y2, w2, h2):
-    truth1 = x1+w1 < x2+w2 < x2 < x1 and y1+h1 < y2+h2 < y2 < y1
-    truth2 = x2+w2 < x1+w1 < x1 < x2 and y2+h2 < y1+h1 < y1 < y2
+    truth = x1 < x2+w2 and x2 < x1+w1 and y1 < y2+h2 and y2 < y1+h1  # open boxes overlap
     e1 = RectangleEntity(x1, y1, 0, 0, (255, 255, 255), w1, h1)
     e2 = RectangleEntity(x2, y2, 0, 0, (255, 255, 255), w2, h2)
 
-    assert (e1 in e2) == truth1
-    assert (e2 in e1) == truth2
+    assert (e1 in e2) == truth
+    assert (e2 in e1) == truth
 
 
 def test_different_shape_entity_contains():
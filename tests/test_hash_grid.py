@@ -0,0 +1,75 @@
+import itertools
+import random
+
+import pytest
+
+from conftest import boxes_overlap, make_circle
+from entities import RectangleEntity
+from geometry import Vector
+from util import HashGridPhysicsLib, PhysicsLib, Settings
+
+HashGrid = HashGridPhysicsLib()
+CELL = Settings.WIDTH / Settings.PHYSICS_DIVISIONS
+
+
+@pytest.fixture(autouse=True)
+def fixed_cells():
+    HashGrid.auto_tune = False
+    HashGrid.rebuild(CELL)
+
+
+def test_hash_grid_is_separate_singleton():
+    assert HashGridPhysicsLib() is HashGrid
+    assert PhysicsLib() is not HashGrid
+
+
+def test_hash_grid_does_not_clamp_off_screen():
+    inside = make_circle(10, 10)
+    left = make_circle(-10 * CELL, 10)
+    far = make_circle(Settings.WIDTH * 3, Settings.HEIGHT * 3)
+    for e in (inside, left, far):
+        HashGrid.add_to_sector(e)
+
+    assert HashGrid.get_sector(inside) == {(0, 0)}
+    assert HashGrid.get_sector(left) == {(-10, 0)}
+    assert HashGrid.get_sector(far) == {HashGrid._cell(Settings.WIDTH * 3, Settings.HEIGHT * 3)}
+    assert len(HashGrid._sectors) == 3
+    assert HashGrid.get_neighbour_entities(left) == [left]
+
+
+def test_hash_grid_drops_empty_cells():
+    c = make_circle(10, 10)
+    HashGrid.add_to_sector(c)
+    c.translate(Vector(5 * CELL, 0))
+    HashGrid.update_sectors()
+    assert set(HashGrid._sectors) == {(5, 0)}
+
+    c.alive = False
+    HashGrid.update_sectors()
+    assert HashGrid._sectors == {}
+    assert HashGrid.get_registered_entities() == ()
+
+
+def test_hash_grid_rectangle_spans_cells():
+    r = RectangleEntity(-CELL, -CELL, 0, 0, (255, 255, 255), 2.5 * CELL, CELL / 2)
+    HashGrid.add_to_sector(r)
+    assert HashGrid.get_sector(r) == {(-1, -1), (0, -1), (1, -1)}
+    HashGrid.remove_from_sector(r)
+    assert HashGrid._sectors == {}
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_hash_grid_pairs_cover_overlaps(seed):
+    rand = random.Random(seed)
+    # a world three screens wide, most of it off screen
+    entities = [make_circle(rand.uniform(-Settings.WIDTH, 2 * Settings.WIDTH),
+                            rand.uniform(-Settings.HEIGHT, 2 * Settings.HEIGHT), rand.uniform(2, 20))
+                for _ in range(300)]
+    for e in entities:
+        HashGrid.add_to_sector(e)
+
+    pairs = [frozenset((e1.id, e2.id)) for e1, e2 in HashGrid.get_candidate_pairs()]
+    assert len(pairs) == len(set(pairs))
+    expected = {frozenset((e1.id, e2.id)) for e1, e2 in itertools.combinations(entities, 2)
+                if boxes_overlap(PhysicsLib.bounding_box(e1), PhysicsLib.bounding_box(e2))}
+    assert expected <= set(pairs)
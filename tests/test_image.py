@@ -163,6 +163,16 @@ def test_screengrid_creation():
     assert i.color == c
 
 
+def test_screengrid_follows_cell_size():
+    i = ScreenGrid(0, 0, 3, 2, 3, (255, 255, 255, 255), 37.5, 50)
+    assert {name for name, _ in i._shapes} == {'rect-x=0.0', 'rect-x=37.5', 'rect-x=75.0', 'rect-y=0', 'rect-y=50'}
+
+
+def test_screengrid_destroy():
+    i = ScreenGrid(0, 0, 3, 2, 3, (255, 255, 255, 255))
+    i._destroy()  # the overlay is dropped this way whenever the physics grid is rebuilt
+
+
 def test_screengrid_assignment():
     sx, sy = 4, 4
     t, c = 3, (255, 255, 255, 255)
@@ -0,0 +1,101 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from entities import CircleEntity, PointEntity, RectangleEntity
+from util import Physics, Settings, ShapeKind, narrowphase
+
+
+def make_shapes(n, seed=0):
+    rand = random.Random(seed)
+    shapes = []
+    for _ in range(n):
+        x, y = rand.uniform(0, 100), rand.uniform(0, 100)
+        kind = rand.choice((PointEntity, CircleEntity, RectangleEntity))
+        if kind is RectangleEntity:
+            shapes.append(RectangleEntity(x, y, 0, 0, (255, 255, 255), rand.uniform(5, 40), rand.uniform(5, 40)))
+        else:
+            shapes.append(kind(x, y, 0, 0, (255, 255, 255), rand.uniform(1, 15)))
+    # exact overlaps so the point-point kernel sees hits too
+    shapes.append(PointEntity(50, 50, 0, 0, (255, 255, 255), 3))
+    shapes.append(PointEntity(50, 50, 0, 0, (255, 255, 255), 3))
+    return shapes
+
+
+def test_shape_kinds():
+    assert PointEntity.shape_kind == ShapeKind.Point
+    assert CircleEntity.shape_kind == ShapeKind.Circle
+    assert RectangleEntity.shape_kind == ShapeKind.Rectangle
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_intersect_pairs_matches_scalar(seed):
+    pairs = list(itertools.combinations(make_shapes(40, seed), 2))
+    hits = narrowphase.intersect_pairs(pairs)
+
+    assert hits.dtype == bool
+    assert hits.tolist() == [e1 in e2 for e1, e2 in pairs]
+    assert hits.tolist() == [e2 in e1 for e1, e2 in pairs]
+
+
+def test_intersect_pairs_groups_every_combination():
+    shapes = make_shapes(40)
+    pairs = list(itertools.combinations(shapes, 2))
+    entities, groups = narrowphase.group_pairs(pairs)
+
+    assert [e.id for e in entities] == [e.id for e in shapes]  # each entity numbered once
+    assert set(groups) == set(narrowphase.KERNELS)
+    assert sorted(i for indices, _, _ in groups.values() for i in indices) == list(range(len(pairs)))
+    for (k1, k2), (indices, firsts, seconds) in groups.items():
+        assert all(entities[row].shape_kind == k1 for row in firsts)
+        assert all(entities[row].shape_kind == k2 for row in seconds)
+        for i, row1, row2 in zip(indices, firsts, seconds):
+            assert {entities[row1].id, entities[row2].id} == {e.id for e in pairs[i]}
+
+
+def test_gather():
+    point = PointEntity(1, 2, 0, 0, (255, 255, 255), 3)
+    circle = CircleEntity(3, 4, 0, 0, (255, 255, 255), 5)
+    rect = RectangleEntity(6, 7, 0, 0, (255, 255, 255), 8, 9)
+    assert narrowphase.gather([point, circle, rect]).tolist() == [
+        [1, 2, 0, 1, 2],
+        [3, 4, 5, 3, 4],
+        [6, 7, 0, 14, 16],
+    ]
+    assert narrowphase.gather([]).shape == (0, 5)
+
+
+@pytest.mark.parametrize('x, y, w, h, expected', [
+    (5, 5, 10, 10, True),  # corner overlap
+    (2, 2, 2, 2, True),  # inside
+    (-5, -5, 30, 30, True),  # contains
+    (10, 0, 5, 5, False),  # touching edge
+    (20, 20, 5, 5, False),
+])
+def test_rectangle_rectangle_overlap(x, y, w, h, expected):
+    a = RectangleEntity(0, 0, 0, 0, (255, 255, 255), 10, 10)
+    b = RectangleEntity(x, y, 0, 0, (255, 255, 255), w, h)
+    assert narrowphase.intersect_pairs([(a, b), (b, a)]).tolist() == [expected, expected]
+    assert (a in b) == (b in a) == expected
+
+
+def test_intersect_pairs_empty():
+    hits = narrowphase.intersect_pairs([])
+    assert isinstance(hits, np.ndarray)
+    assert len(hits) == 0
+
+
+def test_get_colliding_pairs():
+    Physics.clear()
+    Physics.auto_tune = False
+    shapes = make_shapes(40)
+    for e in shapes:
+        Physics.add_to_sector(e)
+    Physics.rebuild(Settings.WIDTH / Settings.PHYSICS_DIVISIONS)
+
+    colliding = Physics.get_colliding_pairs()
+    assert colliding == [(e1, e2) for e1, e2 in Physics.get_candidate_pairs() if e1 in e2]
+    assert colliding
+    Physics.clear()
@@ -0,0 +1,131 @@
+import copy
+
+import numpy as np
+import pytest
+
+from entities import CircleEntity, CollisionHandlers, NeutronSwarm, RectangleEntity, Water
+
+
+def make_swarm(xy, dxy=None, **kw):
+    swarm = NeutronSwarm(**kw)
+    xy = np.asarray(xy, dtype=float)
+    swarm.emit(xy, np.zeros_like(xy) if dxy is None else dxy)
+    return swarm
+
+
+def test_swarm_emit_grows():
+    swarm = NeutronSwarm(radius=2, capacity=2)
+    swarm.emit([(10, 20), (30, 40)], [(1, 0), (0, 1)])
+    swarm.emit([(5, 50)], [(0, 0)], energy=1)
+    assert len(swarm) == 3
+    assert swarm.positions[:3].tolist() == [[10, 20], [30, 40], [5, 50]]
+    assert swarm.energy[:3].tolist() == [0, 0, 1]
+    assert (swarm.left_x, swarm.bottom_y, swarm.right_x, swarm.top_y) == (3, 18, 32, 52)
+    assert len(swarm.image) == 3
+
+
+def test_swarm_move_integrates_and_culls():
+    swarm = make_swarm([(10, 10), (90, 10)], [(20, 0), (20, 0)], bounds=(0, 0, 100, 100))
+    swarm.update(0.5)
+    swarm.move(0.5)
+    assert swarm.positions[:2].tolist() == [[20, 10], [100, 10]]
+    assert swarm.age[:2].tolist() == [0.5, 0.5]
+    assert len(swarm) == 2
+
+    swarm.move(0.5)
+    assert len(swarm) == 1
+    assert swarm.right_x == 30 + swarm.radius
+
+
+def test_swarm_absorb_and_compact():
+    swarm = make_swarm([(i, 0) for i in range(5)])
+    swarm.energy[:5] = range(5)
+    swarm.absorb(np.array([True, False, True, False, False]))
+    swarm.absorb([4])
+    assert len(swarm) == 2
+    swarm.prepare()
+    assert swarm._n == 2
+    assert swarm.positions[:2, 0].tolist() == [1, 3]
+    assert swarm.energy[:2].tolist() == [1, 3]
+
+
+@pytest.mark.parametrize('other, expected', [
+    (lambda: RectangleEntity(10, 10, 0, 0, (255, 255, 255), 20, 20), [False, True, False]),
+    (lambda: CircleEntity(0, 0, 0, 0, (255, 255, 255), 6), [True, False, False]),
+])
+def test_swarm_hits(other, expected):
+    swarm = make_swarm([(0, 5), (15, 15), (40, 40)])
+    assert swarm.hits(other()).tolist() == expected
+    swarm.absorb([0, 1])
+    assert not swarm.hits(other()).any()
+
+
+def test_swarm_registers_as_one_entity(backend):
+    swarm = make_swarm([(10, 10), (20, 20)], [(100, 0), (100, 0)])
+    water = Water(200, 0, 100, 100)
+    backend.add_to_sector(swarm)
+    backend.add_to_sector(water)
+    backend.rebuild()
+    assert [e.id for e in backend.get_registered_entities()] == [swarm.id]
+    assert backend.get_candidate_pairs() == []
+
+    swarm.move(2)  # neutrons at x = 210 and 220, inside the water
+    backend.update_sectors()
+    pairs = backend.get_candidate_pairs()
+    assert [(a.id, b.id) for a, b in pairs] == [(swarm.id, water.id)]
+    assert swarm.hits(water).tolist() == [True, True]
+    assert backend.static_regions_at([215], [10]).tolist() == [water]
+    assert swarm.static_regions().tolist() == [water, water]
+
+
+def test_swarm_kill_unregisters(backend):
+    swarm = make_swarm([(10, 10)])
+    backend.add_to_sector(swarm)
+    backend.update_sectors()
+    swarm.kill()
+    backend.update_sectors()
+    assert not backend.is_registered(swarm)
+    assert backend.get_registered_entities() == ()
+
+
+def test_empty_swarm_has_no_pairs(backend):
+    swarm = make_swarm([(210, 10), (220, 20)])
+    water = Water(200, 0, 100, 100)
+    backend.add_to_sector(swarm)
+    backend.add_to_sector(water)
+    backend.update_sectors()
+    assert len(backend.get_candidate_pairs()) == 1
+
+    swarm.absorb(swarm.hits(water))
+    swarm.move(0)
+    backend.update_sectors()
+    assert len(swarm) == 0
+    assert (swarm.left_x, swarm.bottom_y, swarm.right_x, swarm.top_y) == (0, 0, 0, 0)
+    assert backend.get_candidate_pairs() == []
+
+
+def test_swarm_collision_handler_skips_narrowphase():
+    handlers = CollisionHandlers()
+    absorbed = []
+
+    def absorb(pairs, dt):
+        for swarm, water in pairs:
+            hits = swarm.hits(water)
+            absorbed.append(int(np.count_nonzero(hits)))
+            swarm.absorb(hits)
+
+    handlers.register(NeutronSwarm, Water, absorb, narrowphase=False)
+    swarm = make_swarm([(10, 10), (60, 60)])
+    water = Water(0, 0, 50, 50)
+    handlers.run([(water, swarm)], 0.1)
+    assert absorbed == [1]
+    assert len(swarm) == 1
+
+
+def test_swarm_deepcopy():
+    swarm = make_swarm([(1, 2)], [(3, 4)])
+    clone = copy.deepcopy(swarm)
+    assert clone.id != swarm.id
+    clone.move(1)
+    assert swarm.positions[0].tolist() == [1, 2]
+    assert clone.positions[0].tolist() == [4, 6]
@@ -0,0 +1,108 @@
+import random
+
+import numpy as np
+import pytest
+
+from conftest import make_circle
+from entities import PointEntity, RectangleEntity
+from geometry import Vector
+from util import Physics, Settings
+from util.occupancy import StaticRaster
+
+
+def make_rect(x, y, w, h):
+    return RectangleEntity(x, y, 0, 0, (255, 255, 255), w, h, static=True)
+
+
+def test_raster_rectangle_and_circle():
+    rect = make_rect(10, 10, 40, 20)
+    circle = make_circle(100, 100, 15, static=True)
+    raster = StaticRaster(200, 200, 1)
+    raster.bake([rect, circle])
+
+    assert raster.region_at(30, 20) is rect
+    assert raster.region_at(100, 110) is circle
+    assert raster.region_at(112, 112) is None  # inside the circle's box but outside the circle
+    assert raster.region_at(5, 5) is None
+    assert raster.region_at(-5, 500) is None
+
+
+def test_raster_points_are_not_baked():
+    raster = StaticRaster(100, 100, 1)
+    raster.bake([PointEntity(50, 50, 0, 0, (255, 255, 255), 5, static=True)])
+    assert raster.entities == []
+    assert raster.region_at(50, 50) is None
+
+
+def test_raster_later_region_wins():
+    below = make_rect(0, 0, 50, 50)
+    above = make_rect(20, 20, 10, 10)
+    raster = StaticRaster(100, 100, 1)
+    raster.bake([below, above])
+    assert raster.region_at(25, 25) is above
+    assert raster.region_at(10, 10) is below
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_raster_batch_matches_scalar(seed):
+    rand = random.Random(seed)
+    shapes = [make_rect(rand.uniform(0, 150), rand.uniform(0, 150), rand.uniform(5, 40), rand.uniform(5, 40))
+              for _ in range(10)]
+    shapes += [make_circle(rand.uniform(0, 200), rand.uniform(0, 200), rand.uniform(3, 20), static=True)
+               for _ in range(10)]
+    raster = StaticRaster(200, 200, 2)
+    raster.bake(shapes)
+
+    xs = np.array([rand.uniform(-20, 220) for _ in range(500)])
+    ys = np.array([rand.uniform(-20, 220) for _ in range(500)])
+    labels = raster.labels_at(xs, ys)
+    assert labels.tolist() == [raster.label_at(x, y) for x, y in zip(xs, ys)]
+    assert list(raster.regions_at(xs, ys)) == [raster.region_at(x, y) for x, y in zip(xs, ys)]
+
+
+def test_raster_accurate_to_half_a_cell():
+    rect = make_rect(10.3, 20.7, 33.1, 17.9)
+    raster = StaticRaster(100, 100, Settings.PHYSICS_RASTER_CELL)
+    raster.bake([rect])
+    half = raster.cell_size / 2
+
+    rand = random.Random(0)
+    for _ in range(500):
+        x, y = rand.uniform(0, 100), rand.uniform(0, 100)
+        inside = rect.left_x < x < rect.right_x and rect.bottom_y < y < rect.top_y
+        clear_inside = rect.left_x + half < x < rect.right_x - half and rect.bottom_y + half < y < rect.top_y - half
+        clear_outside = not (rect.left_x - half < x < rect.right_x + half
+                             and rect.bottom_y - half < y < rect.top_y + half)
+        if clear_inside or clear_outside:
+            assert (raster.region_at(x, y) is rect) == inside
+
+
+def test_physics_static_regions_rebake_on_change():
+    rect = make_rect(0, 0, 50, 50)
+    Physics.add_to_sector(rect)
+    assert Physics.static_region_at(25, 25) is rect
+    assert Physics.static_regions_at([25, 200], [25, 200]).tolist() == [rect, None]
+
+    rect.translate(Vector(100, 100))  # marks the layer dirty
+    assert Physics.static_region_at(125, 125) is rect
+    assert Physics.static_region_at(25, 25) is None
+
+    Physics.remove_from_sector(rect)
+    assert Physics.static_region_at(125, 125) is None
+
+
+def test_physics_static_regions_drop_dead_and_moved_in_update(backend):
+    rod = make_rect(0, 0, 50, 50)
+    other = make_rect(100, 0, 50, 50)
+    backend.add_to_sector(rod)
+    backend.add_to_sector(other)
+    assert backend.static_regions_at([25, 125], [25, 25]).tolist() == [rod, other]
+
+    other.alive = False  # dead but not yet purged
+    assert backend.static_regions_at([25, 125], [25, 25]).tolist() == [rod, None]
+
+    rod.translate(Vector(0, 100))
+    backend.update_sectors()  # refiles both and re-bakes the raster in the same call
+    assert backend._raster.version == backend._static.version
+    assert backend.get_static_entities() == (rod,)
+    assert backend.static_regions_at([25, 25, 125], [25, 125, 25]).tolist() == [None, rod, None]
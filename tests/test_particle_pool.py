@@ -0,0 +1,101 @@
+import pytest
+
+from entities import Components, Emitter, Particle, ParticlePool, PointEntity
+from geometry import Point, Vector
+from image import Layer
+from util import PhysicsLib
+
+
+@pytest.fixture
+def pool():
+    return ParticlePool()
+
+
+def test_pool_acquire_creates_particles(pool):
+    particle = pool.acquire(1, 2, 3, 4)
+    assert isinstance(particle, Particle) and isinstance(particle, PointEntity)
+    assert particle.pos == Point(1, 2)
+    assert particle.vel == Vector(3, 4)
+    assert particle.alive and particle.enable
+    assert particle.image.layer == Layer.FOREGROUND
+    assert pool.allocated == 1
+    assert len(pool) == 0
+
+
+def test_pool_reuses_dead_particles(pool):
+    particle = pool.acquire(0, 0, 1, 1)
+    old_id = particle.id
+    particle.alive = False
+    particle.color = (255, 0, 0)
+    particle.prepare()
+    assert len(pool) == 1
+    assert not particle.image.visible
+
+    particle.prepare()  # released only once
+    assert len(pool) == 1
+
+    reused = pool.acquire(5, 6, 7, 8)
+    assert reused is particle
+    assert reused.id != old_id
+    assert reused.alive
+    assert reused.pos == Point(5, 6)
+    assert reused.vel == Vector(7, 8)
+    assert reused.color == (128, 128, 128, 255)
+    assert reused.image.visible
+    assert pool.allocated == 1
+
+
+def test_pool_reserve(pool):
+    pool.reserve(10)
+    assert len(pool) == pool.allocated == 10
+    particles = [pool.acquire(0, 0, 0, 0) for _ in range(10)]
+    assert len(pool) == 0
+    assert pool.allocated == 10
+    assert all(p.alive for p in particles)
+
+
+def test_pool_release_leaves_physics(pool):
+    physics = PhysicsLib()
+    physics.clear()
+    particle = pool.acquire(10, 10, 0, 0)
+    physics.add_to_sector(particle)
+    particle.alive = False  # died after physics last refiled it
+    particle.prepare()
+    assert physics.get_registered_entities() == ()
+    assert particle._physics is None
+    physics.clear()
+
+
+def test_pool_particles_culled_over_rows(pool, backend):
+    inside = pool.acquire(50, 50, 0, 0)
+    escaped = pool.acquire(50, 50, 0, 0)
+    assert Components.pos[escaped._slot].tolist() == [50, 50]
+    backend.add_to_sector(inside)
+    backend.add_to_sector(escaped)
+    escaped.translate(Vector(200, 0))
+    assert escaped._slot in Components.cull(0, 0, 100, 100).tolist()
+    assert inside.alive and not escaped.alive
+    backend.update_sectors()
+    assert [e.id for e in backend.get_registered_entities()] == [inside.id]
+
+    slot = escaped._slot
+    escaped.prepare()
+    assert pool.acquire(1, 2, 0, 0) is escaped
+    assert escaped._slot == slot and Components.pos[slot].tolist() == [1, 2]
+
+
+def test_emitter_emits_from_pool(pool):
+    output = []
+    emitter = Emitter(0, 0, 3, Vector(1, 0), output, pool)
+    emitter.emit()
+    assert pool.allocated == 3
+
+    for particle in output:
+        particle.alive = False
+        particle.prepare()
+    output.clear()
+
+    emitter.emit()
+    assert pool.allocated == 3
+    assert len(pool) == 0
+    assert [p.pos for p in output] == [Point(0, 0)] * 3
@@ -0,0 +1,301 @@
+
+from copy import copy, deepcopy
+
+import pytest
+
+from conftest import make_circle
+from entities import CircleEntity, Neutron, PointEntity, RectangleEntity, Water
+from entities.graphical_entity_complex import ComplexGraphicalEntity
+from geometry import Vector
+from util import Physics, Settings
+
+
+@pytest.fixture(autouse=True)
+def fixed_grid():
+    Physics.auto_tune = False
+    Physics.rebuild(Settings.WIDTH / Settings.PHYSICS_DIVISIONS)
+
+
+def make_point(x, y):
+    return PointEntity(x, y, 0, 0, (255, 255, 255), 3)
+
+
+def test_physics_add_remove():
+    p = make_point(10, 10)
+    Physics.add_to_sector(p)
+    assert Physics.get_registered_entities() == (p,)
+    assert len(Physics.get_sector(p)) == 1
+
+    assert Physics.remove_from_sector(p) is p
+    assert Physics.get_registered_entities() == ()
+    assert Physics.get_sector(p) == {}
+
+
+def test_physics_move_between_sectors():
+    p = make_point(1, 1)
+    Physics.add_to_sector(p)
+    old_sector = Physics.get_sector(p)
+
+    p.pos.coordinates = (Settings.WIDTH - 1, Settings.HEIGHT - 1)
+    Physics.update_sectors(Physics.get_registered_entities())
+    assert Physics.get_sector(p) != old_sector
+    assert Physics.get_registered_entities() == (p,)
+
+
+def test_physics_remove_after_move():
+    p = make_point(1, 1)
+    Physics.add_to_sector(p)
+    p.pos.coordinates = (Settings.WIDTH - 1, Settings.HEIGHT - 1)
+    Physics.remove_from_sector(p)  # removed from where it was filed
+    assert Physics.get_registered_entities() == ()
+
+
+def test_physics_remove_dead():
+    p = make_point(1, 1)
+    Physics.add_to_sector(p)
+    p.alive = False
+    Physics.update_sectors(Physics.get_registered_entities())
+    assert Physics.get_registered_entities() == ()
+
+
+def test_physics_neighbour_order_is_insertion_order():
+    points = [make_point(5 + i, 5) for i in range(10)]
+    for p in points:
+        Physics.add_to_sector(p)
+    Physics.remove_from_sector(points[3])
+    Physics.add_to_sector(points[3])
+
+    expected = points[:3] + points[4:] + points[3:4]
+    assert Physics.get_neighbour_entities(points[0]) == expected
+
+
+def test_physics_complex_spans_sectors():
+    r = RectangleEntity(0, 0, 0, 0, (255, 255, 255), Settings.WIDTH, Settings.HEIGHT)
+    Physics.add_to_sector(r)
+    assert len(Physics.get_sector(r)) == Physics.divisions_x * Physics.divisions_y
+    assert Physics.get_registered_entities() == (r,)  # listed once however many sectors it spans
+    Physics.remove_from_sector(r)
+    assert Physics.get_registered_entities() == ()
+
+
+def test_physics_validation_enabled_for_tests():
+    assert Settings.VALIDATE
+    assert Physics.validate
+
+
+def test_physics_validation_catches_stale_sector():
+    p = make_point(1, 1)
+    Physics.add_to_sector(p)
+    stale = next(iter(Physics.get_sector(p)))
+    p.pos.coordinates = (Settings.WIDTH - 1, Settings.HEIGHT - 1)
+    Physics._sectors[(0, 0) if stale != (0, 0) else (1, 1)][p.id] = p  # corrupt the index
+
+    with pytest.raises(AssertionError):
+        Physics.update_sectors(Physics.get_registered_entities())
+
+    Physics.validate = False
+    try:
+        Physics.clear()
+        Physics.add_to_sector(p)
+        Physics._sectors[(3, 3)][p.id] = p
+        p.pos.coordinates = (1, 1)
+        Physics.update_sectors([p])  # unchecked
+    finally:
+        Physics.validate = True
+
+
+def test_physics_neighbour_table():
+    for (x, y), neighbours in Physics._neighbours.items():
+        assert (x, y) in neighbours
+        assert len(neighbours) == len(set(neighbours))
+        for nx, ny in neighbours:
+            assert abs(nx - x) <= 1 and abs(ny - y) <= 1
+    assert len(Physics._neighbours[0, 0]) == 4
+    assert len(Physics._neighbours[1, 1]) == 9
+
+
+def test_physics_tune_cell_size_density():
+    points = [make_point(i % Settings.WIDTH, (i * 7) % Settings.HEIGHT) for i in range(400)]
+    size = Physics.tune_cell_size(points)
+    assert size == pytest.approx((Settings.WIDTH * Settings.HEIGHT * Physics.TARGET_PER_CELL / 400) ** 0.5)
+
+
+def test_physics_tune_cell_size_fits_largest_radius():
+    points = [make_point(i, i) for i in range(400)]
+    points[0].radius = 100
+    assert Physics.tune_cell_size(points) >= 200
+
+
+def test_physics_rebuild_keeps_entities():
+    points = [make_point(i % Settings.WIDTH, (i * 7) % Settings.HEIGHT) for i in range(400)]
+    for p in points:
+        Physics.add_to_sector(p)
+    Physics.rebuild()
+
+    assert Physics.cell_width == Physics.cell_height == pytest.approx(Physics.tune_cell_size(points))
+    assert sorted(e.id for e in Physics.get_registered_entities()) == sorted(p.id for p in points)
+    for p in points:
+        assert Physics.get_sector(p) == Physics._get_sector_coords(p)
+
+
+def test_physics_auto_tune_on_population_change():
+    Physics.auto_tune = True
+    version = Physics.grid_version
+    points = [make_point(i % Settings.WIDTH, (i * 7) % Settings.HEIGHT) for i in range(400)]
+    for p in points:
+        Physics.add_to_sector(p)
+    Physics.update_sectors(Physics.get_registered_entities())
+    assert Physics.cell_width == pytest.approx(Physics.tune_cell_size(points))
+    assert Physics.grid_version > version  # so the drawn grid follows the retune
+
+
+def test_physics_collision_dispatch_subclasses():
+    neutron = Neutron(10, 10, 0, 0, 3)
+    water = Water(0, 0, 50, 50)
+    Physics._collision_dispatch.clear()
+
+    assert neutron in water  # water.__contains__(neutron)
+    assert Physics._collision_dispatch[Water, Neutron] is Physics.intersect_rectangle_point
+    assert water in neutron
+    assert Physics._collision_dispatch[Neutron, Water] is Physics.intersect_point_rectangle
+
+
+def test_physics_collision_dispatch_register():
+    class Ring(CircleEntity):
+        pass
+
+    calls = []
+
+    def ring_point(ring, point):
+        calls.append((ring, point))
+        return True
+
+    ring = Ring(100, 100, 0, 0, (255, 255, 255), 1)
+    p = make_point(10, 10)
+    assert p not in ring
+
+    Physics.register_collision(Ring, PointEntity, ring_point)
+    try:
+        assert p in ring  # ring.__contains__(p)
+        assert calls == [(ring, p)]
+        assert ring not in p  # the other order keeps the inherited point-circle kernel
+    finally:
+        del Physics._collision_kernels[Ring, PointEntity]
+        Physics._collision_dispatch.clear()
+
+
+def test_physics_collision_dispatch_unsupported():
+    with pytest.raises(NotImplementedError):
+        ComplexGraphicalEntity(10, 10, 0, 0) in make_point(10, 10)
+
+
+@pytest.mark.parametrize('make1,make2,truth', [
+    (lambda: make_circle(10, 10), lambda: make_circle(10, 10), True),
+    (lambda: make_point(10, 10), lambda: make_point(10, 10), False),
+    (lambda: make_point(10, 10), lambda: Neutron(10, 10, 0, 0, 3), False),
+    (lambda: Neutron(10, 10, 0, 0, 3), lambda: Neutron(10, 10, 0, 0, 3), False),
+    (lambda: Neutron(10, 10, 0, 0, 3), lambda: Water(0, 0, 50, 50), True),
+    (lambda: make_point(10, 10), lambda: make_circle(10, 10), True),
+])
+def test_physics_can_collide(make1, make2, truth):
+    e1 = make1()
+    e2 = make2()
+    assert Physics.can_collide(e1, e2) == truth
+    assert Physics.can_collide(e2, e1) == truth
+
+
+def test_physics_candidate_pairs_respect_masks():
+    points = [make_point(10 + i, 10) for i in range(5)]
+    circle = make_circle(12, 10)
+    for e in points + [circle]:
+        Physics.add_to_sector(e)
+
+    pairs = {frozenset((e1.id, e2.id)) for e1, e2 in Physics.get_candidate_pairs()}
+    assert pairs == {frozenset((p.id, circle.id)) for p in points}
+
+    circle.collision_mask = Physics.Category.ALL & ~Physics.Category.PARTICLE
+    assert Physics.get_candidate_pairs() == []
+
+
+def test_physics_registered_entities_cached():
+    p1 = make_point(10, 10)
+    Physics.add_to_sector(p1)
+    registered = Physics.get_registered_entities()
+    assert Physics.get_registered_entities() is registered
+
+    p2 = make_point(20, 20)
+    Physics.add_to_sector(p2)
+    assert Physics.get_registered_entities() == (p1, p2)
+    Physics.remove_from_sector(p1)
+    assert Physics.get_registered_entities() == (p2,)
+
+
+def test_physics_dirty_list_moves_and_kills():
+    moved = make_point(1, 1)
+    killed = make_point(2, 2)
+    untouched = make_point(3, 3)
+    for p in (moved, killed, untouched):
+        Physics.add_to_sector(p)
+    assert Physics._dirty == {}
+
+    moved.translate(Vector(Settings.WIDTH - 2, Settings.HEIGHT - 2))
+    killed.alive = False
+    assert set(Physics._dirty) == {moved.id, killed.id}
+
+    Physics.update_sectors()
+    assert Physics._dirty == {}
+    assert Physics.get_sector(moved) == Physics._get_sector_coords(moved)
+    assert Physics.get_registered_entities() == (moved, untouched)
+    assert killed._physics is None
+
+
+def test_physics_dirty_list_ignores_unregistered_copies():
+    p = make_point(1, 1)
+    Physics.add_to_sector(p)
+    clone = deepcopy(p)
+    assert clone._physics is Physics
+
+    clone.translate(Vector(5, 5))
+    Physics.update_sectors()
+    assert Physics.get_registered_entities() == (p,)
+
+
+def test_physics_dirty_list_ignores_shallow_copies():
+    p = make_point(1, 1)
+    Physics.add_to_sector(p)
+    clone = copy(p)  # same id and backend as p
+    assert clone.id == p.id and clone._physics is Physics
+    old_sector = Physics.get_sector(p)
+
+    p.translate(Vector(Settings.WIDTH - 2, Settings.HEIGHT - 2))
+    clone.alive = False  # must not replace p in the dirty list
+    assert Physics._dirty == {p.id: p}
+    Physics.update_sectors()
+    assert Physics.get_registered_entities() == (p,)
+    assert Physics.get_sector(p) != old_sector
+    assert Physics.get_sector(p) == Physics._get_sector_coords(p)
+
+
+def test_physics_in_place_moves_need_explicit_entities():
+    p = make_point(1, 1)
+    Physics.add_to_sector(p)
+    old_sector = Physics.get_sector(p)
+    p.pos.coordinates = (Settings.WIDTH - 1, Settings.HEIGHT - 1)  # not tracked
+    Physics.update_sectors()
+    assert Physics.get_sector(p) == old_sector
+    Physics.update_sectors([p])
+    assert Physics.get_sector(p) == Physics._get_sector_coords(p)
+
+
+def test_physics_dirty_static_reindexes():
+    water = Water(0, 0, 50, 50)
+    Physics.add_to_sector(water)
+    assert Physics.static_region_at(25, 25) is water
+
+    water.translate(Vector(100, 100))
+    Physics.update_sectors()
+    assert Physics.static_region_at(125, 125) is water
+
+    water.alive = False
+    Physics.update_sectors()
+    assert Physics.get_static_entities() == ()
@@ -0,0 +1,105 @@
+import pytest
+
+from entities import CircleEntity, Entity, ParticlePool, PointEntity, UpdatePipeline, Water
+from entities.pipeline import _FLATTEN, _OPAQUE, _SKIP
+from image import CircleImage
+
+
+class Counter(Entity):  # component with update logic of its own
+    def __init__(self, log, name):
+        super().__init__()
+        self.log = log
+        self.name = name
+
+    def _update(self, dt):
+        self.log.append((self.name, dt))
+        super()._update(dt)
+
+    def _prepare(self):
+        self.log.append((self.name, 'prepare'))
+        super()._prepare()
+
+
+class Scripted(Entity):  # overrides the public update like the emitters do
+    def __init__(self, log):
+        super().__init__()
+        self.log = log
+
+    def update(self, dt):
+        self.log.append(('scripted', dt))
+
+
+@pytest.fixture
+def pipeline():
+    return UpdatePipeline()
+
+
+def make_point(x=0, y=0):
+    return PointEntity(x, y, 0, 0, (255, 255, 255), 3)
+
+
+def test_pipeline_plans(pipeline):
+    pipeline.update([make_point(), Counter([], 'c'), Scripted([])], 1)
+    assert pipeline._update_plans == {PointEntity: _FLATTEN, CircleImage: _SKIP, Counter: _OPAQUE, Scripted: _OPAQUE}
+
+
+def test_pipeline_skips_images(pipeline):
+    points = [make_point(i, i) for i in range(5)]
+    pipeline.update(points, 1)
+    pipeline.prepare(points)
+
+
+def test_pipeline_runs_nested_components(pipeline):
+    log = []
+    outer = Entity()
+    inner = Entity()
+    inner.repr.append(Counter(log, 'inner'))
+    outer.repr.extend([inner, Counter(log, 'outer')])
+    point = make_point()
+    point.repr.append(Counter(log, 'point'))
+
+    pipeline.update([outer, point], 0.5)
+    assert sorted(log) == [('inner', 0.5), ('outer', 0.5), ('point', 0.5)]
+
+    log.clear()
+    pipeline.prepare([outer, point])
+    assert sorted(log) == [('inner', 'prepare'), ('outer', 'prepare'), ('point', 'prepare')]
+
+
+def test_pipeline_runs_opaque_entities_once(pipeline):
+    log = []
+    parent = Counter(log, 'parent')
+    parent.repr.append(Counter(log, 'child'))  # reached through the parent's own super()._update
+    pipeline.update([parent, Scripted(log)], 1)
+    assert sorted(log) == [('child', 1), ('parent', 1), ('scripted', 1)]
+
+
+@pytest.mark.parametrize('enable, alive', [(False, True), (True, False), (False, False)])
+def test_pipeline_skips_disabled_and_dead(pipeline, enable, alive):
+    log = []
+    e = Entity()
+    e.repr.append(Counter(log, 'c'))
+    e.enable = enable
+    e.alive = alive
+    pipeline.update([e], 1)
+    pipeline.prepare([e])
+    assert log == []
+
+
+def test_pipeline_kills_dead_entities(pipeline):
+    pool = ParticlePool()
+    particles = [pool.acquire(0, 0, 0, 0) for _ in range(3)]
+    particles[1].alive = False
+    pipeline.prepare(particles)
+    assert len(pool) == 1
+
+
+@pytest.mark.parametrize('cls, plan', [
+    (Entity, _FLATTEN),
+    (PointEntity, _FLATTEN),
+    (CircleEntity, _FLATTEN),
+    (Water, _OPAQUE),  # _update of its own which skips repr
+    (CircleImage, _SKIP),
+])
+def test_pipeline_compiles_classes(pipeline, cls, plan):
+    assert pipeline._update_plan(cls) == plan
@@ -206,3 +206,31 @@ def test_point_from_origin(x1, y1, x2, y2):
 def test_point_from_coordinates(x1, y1, x2, y2):
     assert Point.from_coordinates((x1, y1)) == Point(x1, y1)
     assert Point.from_coordinates((x2, y2)) == Point(x2, y2)
+
+
+@pytest.mark.parametrize('x1,y1,x2,y2', params_coord_math_auto_verify)
+def test_point_make(x1, y1, x2, y2):
+    p1 = Point._make(float(x1), float(y1))
+    assert p1 == Point(x1, y1)
+    assert type(p1) is Point
+    p1.x = x2
+    p1.y = y2
+    assert p1 == Point(x2, y2)
+
+
+def test_point_slots():
+    p1 = Point(1, 2)
+    assert not hasattr(p1, '__dict__')
+    with pytest.raises(AttributeError):
+        p1.z = 3
+
+
+@pytest.mark.parametrize('x,y,dx,dy', params_coord_math_auto_verify)
+def test_point_add_scaled(x, y, dx, dy):
+    p1 = Point(x, y)
+    v1 = Vector(dx, dy)
+    result = p1.add_scaled(v1, 0.5)
+    assert result is p1
+    assert p1 == Point(x, y) + v1 * 0.5
+    p1.add_scaled(v1, -0.5)
+    assert p1 == Point(x, y)
@@ -0,0 +1,96 @@
+
+import random
+
+import pytest
+
+from conftest import boxes_overlap
+from entities import PointEntity, RectangleEntity
+from util import PhysicsLib, QuadtreePhysicsLib, Settings
+from util.quadtree import QuadTree
+
+Quadtree = QuadtreePhysicsLib()
+
+
+def make_point(x, y, r=3):
+    return PointEntity(x, y, 0, 0, (255, 255, 255), r)
+
+
+def make_cluster(n, cx, cy, spread, seed=0):
+    rand = random.Random(seed)
+    return [make_point(cx + rand.uniform(-spread, spread), cy + rand.uniform(-spread, spread)) for _ in range(n)]
+
+
+def test_quadtree_is_separate_singleton():
+    assert QuadtreePhysicsLib() is Quadtree
+    assert PhysicsLib() is not Quadtree
+
+
+def test_quadtree_splits_crowded_region():
+    tree = QuadTree(0, 0, 100, 100, capacity=4)
+    points = make_cluster(20, 10, 10, 5)
+    for p in points:
+        tree.insert(p)
+
+    assert len(tree) == 20
+    assert tree.root.children is not None
+    assert max(node.depth for node in tree.nodes()) > 1
+    assert all(len(node.items) <= 4 or node.depth == tree.max_depth or node.children is not None
+               for node in tree.nodes())
+    assert sorted(e.id for e in tree) == sorted(p.id for p in points)
+
+
+def test_quadtree_collapses_after_removal():
+    tree = QuadTree(0, 0, 100, 100, capacity=4)
+    points = make_cluster(20, 10, 10, 5)
+    for p in points:
+        tree.insert(p)
+    for p in points[2:]:
+        tree.remove(p)
+
+    assert tree.root.children is None
+    assert tree.root.count == 2
+    assert all(tree.location[p.id] is tree.root for p in points[:2])
+
+
+def test_quadtree_large_rectangle_stays_high():
+    tree = QuadTree(0, 0, 100, 100, capacity=2)
+    for p in make_cluster(10, 10, 10, 5):
+        tree.insert(p)
+    rect = RectangleEntity(20, 20, 0, 0, (255, 255, 255), 60, 60)
+    assert tree.insert(rect) is tree.root
+
+
+@pytest.mark.parametrize('scene', ['uniform', 'clustered'])
+def test_quadtree_neighbours_cover_overlaps(scene):
+    if scene == 'uniform':
+        rand = random.Random(1)
+        points = [make_point(rand.uniform(0, Settings.WIDTH), rand.uniform(0, Settings.HEIGHT), 8) for _ in range(200)]
+    else:
+        points = make_cluster(200, Settings.WIDTH / 3, Settings.HEIGHT / 3, 30)
+    rect = RectangleEntity(Settings.WIDTH / 4, 0, 0, 0, (255, 255, 255), Settings.WIDTH / 2, Settings.HEIGHT / 2)
+    entities = points + [rect]
+    for e in entities:
+        Quadtree.add_to_sector(e)
+
+    for e1 in entities:
+        neighbours = {e.id for e in Quadtree.get_neighbour_entities(e1)}
+        box = PhysicsLib.bounding_box(e1)
+        for e2 in entities:
+            if boxes_overlap(box, PhysicsLib.bounding_box(e2)):
+                assert e2.id in neighbours
+
+
+def test_quadtree_update_and_remove():
+    points = make_cluster(50, 100, 100, 10)
+    for p in points:
+        Quadtree.add_to_sector(p)
+
+    for p in points[:25]:
+        p.pos.coordinates = (Settings.WIDTH - 100, Settings.HEIGHT - 100)
+    points[-1].alive = False
+    Quadtree.update_sectors(Quadtree.get_registered_entities())
+
+    assert len(Quadtree.get_registered_entities()) == 49
+    for p in points[:25]:
+        assert Quadtree.get_sector(p).contains(PhysicsLib.bounding_box(p))
+    assert Quadtree.get_sector(points[-1]) == {}
@@ -0,0 +1,118 @@
+import math
+import random
+
+import pytest
+
+from entities import CircleEntity, PointEntity, RectangleEntity, Water
+from geometry import Point, Vector
+from util import PhysicsLib, Settings
+
+def make_scene(physics, seed=0):
+    rand = random.Random(seed)
+    entities = []
+    for _ in range(80):
+        x, y = rand.uniform(0, Settings.WIDTH), rand.uniform(0, Settings.HEIGHT)
+        entities.append(PointEntity(x, y, 0, 0, (255, 255, 255), 3))
+    for _ in range(40):
+        x, y = rand.uniform(0, Settings.WIDTH), rand.uniform(0, Settings.HEIGHT)
+        entities.append(CircleEntity(x, y, 0, 0, (255, 255, 255), rand.uniform(3, 30)))
+    for _ in range(10):
+        x, y = rand.uniform(0, Settings.WIDTH), rand.uniform(0, Settings.HEIGHT)
+        entities.append(RectangleEntity(x, y, 0, 0, (255, 255, 255), rand.uniform(10, 80), rand.uniform(10, 80)))
+    entities.append(Water(100, 100, 200, 50))
+    for e in entities:
+        physics.add_to_sector(e)
+    physics.rebuild(Settings.WIDTH / Settings.PHYSICS_DIVISIONS)
+    return entities
+
+
+def ids(entities):
+    return sorted(e.id for e in entities)
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_query_radius_matches_brute_force(backend, seed):
+    entities = make_scene(backend, seed)
+    rand = random.Random(seed + 10)
+    for _ in range(20):
+        x, y, r = rand.uniform(0, Settings.WIDTH), rand.uniform(0, Settings.HEIGHT), rand.uniform(5, 150)
+        expected = [e for e in entities if PhysicsLib.distance_to(e, x, y) <= r]
+        assert ids(backend.query_radius(Point(x, y), r)) == ids(expected)
+
+
+def test_query_radius_type_filter_and_ignore(backend):
+    entities = make_scene(backend)
+    centre = Point(Settings.WIDTH / 2, Settings.HEIGHT / 2)
+    circles = backend.query_radius(centre, 400, types=CircleEntity)
+    assert circles and all(isinstance(e, CircleEntity) for e in circles)
+    assert ids(circles) == ids(e for e in entities
+                               if isinstance(e, CircleEntity) and PhysicsLib.distance_to(e, *centre.coordinates) <= 400)
+
+    target = circles[0]
+    assert target not in backend.query_radius(target.pos, 1, ignore=target)
+
+
+def test_query_rect(backend):
+    make_scene(backend)
+    inside = CircleEntity(500, 500, 0, 0, (255, 255, 255), 5)
+    touching = CircleEntity(520, 500, 0, 0, (255, 255, 255), 11)  # reaches over the right edge
+    corner = CircleEntity(515, 515, 0, 0, (255, 255, 255), 6)  # box overlaps but the circle misses the corner
+    for e in (inside, touching, corner):
+        backend.add_to_sector(e)
+    found = backend.query_rect(490, 490, 510, 510, types=CircleEntity)
+    assert inside in found
+    assert touching in found
+    assert corner not in found
+
+
+def test_raycast_first_hit(backend):
+    near = CircleEntity(100, 10, 0, 0, (255, 255, 255), 5)
+    far = CircleEntity(300, 10, 0, 0, (255, 255, 255), 5)
+    wall = RectangleEntity(600, 0, 0, 0, (255, 255, 255), 10, 50)
+    for e in (near, far, wall):
+        backend.add_to_sector(e)
+
+    entity, distance = backend.raycast(Point(0, 10), Vector(1, 0))
+    assert entity is near
+    assert distance == pytest.approx(95)
+
+    entity, distance = backend.raycast(Point(0, 10), Vector(1, 0), types=RectangleEntity)
+    assert entity is wall
+    assert distance == pytest.approx(600)
+
+    assert backend.raycast(Point(0, 10), Vector(1, 0), max_distance=50) is None
+    assert backend.raycast(Point(0, 10), Vector(-1, 0)) is None
+    assert backend.raycast(Point(100, 10), Vector(1, 0), ignore=near)[0] is far
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_raycast_matches_brute_force(backend, seed):
+    entities = make_scene(backend, seed)
+    rand = random.Random(seed + 20)
+    for _ in range(20):
+        origin = Point(rand.uniform(0, Settings.WIDTH), rand.uniform(0, Settings.HEIGHT))
+        angle = rand.uniform(0, 2 * math.pi)
+        direction = Vector(math.cos(angle), math.sin(angle))
+        hits = [(PhysicsLib._ray_distance(e, origin.x, origin.y, direction.x, direction.y), e) for e in entities]
+        hits = [(t, e) for t, e in hits if t is not None and t <= 1000]
+        result = backend.raycast(origin, direction, max_distance=1000)
+        if not hits:
+            assert result is None
+        else:
+            assert result[1] == pytest.approx(min(t for t, _ in hits))
+
+
+def test_nearest(backend):
+    entities = make_scene(backend)
+    pos = Point(Settings.WIDTH / 3, Settings.HEIGHT / 3)
+    expected = sorted(entities, key=lambda e: (PhysicsLib.distance_to(e, *pos.coordinates), e.id))
+
+    assert backend.nearest(pos, 5) == expected[:5]
+    assert backend.nearest(pos, 3, types=RectangleEntity) == [e for e in expected if isinstance(e, RectangleEntity)][:3]
+    assert backend.nearest(pos, len(entities) + 10) == expected
+
+
+def test_nearest_off_screen(backend):
+    far = CircleEntity(Settings.WIDTH * 5, Settings.HEIGHT * 5, 0, 0, (255, 255, 255), 3)
+    backend.add_to_sector(far)
+    assert backend.nearest(Point(0, 0)) == [far]
@@ -0,0 +1,31 @@
+from conftest import make_circle, pair_ids
+from entities import PointEntity
+from util import PhysicsLib, SweepAndPrunePhysicsLib
+
+SweepAndPrune = SweepAndPrunePhysicsLib()
+
+
+def test_sweep_and_prune_is_separate_singleton():
+    assert SweepAndPrunePhysicsLib() is SweepAndPrune
+    assert PhysicsLib() is not SweepAndPrune
+
+
+def test_sweep_and_prune_neighbours():
+    a = make_circle(10, 10)
+    b = make_circle(14, 10)
+    c = make_circle(100, 100)
+    for e in (a, b, c):
+        SweepAndPrune.add_to_sector(e)
+
+    assert {e.id for e in SweepAndPrune.get_neighbour_entities(a)} == {a.id, b.id}
+    assert [e.id for e in SweepAndPrune.get_neighbour_entities(c)] == [c.id]
+
+
+def test_sweep_and_prune_masks_reject_pairs():
+    points = [PointEntity(10 + i, 10, 0, 0, (255, 255, 255), 3) for i in range(5)]
+    circle = make_circle(12, 10)
+    for e in points + [circle]:
+        SweepAndPrune.add_to_sector(e)
+
+    pairs = pair_ids(SweepAndPrune.get_candidate_pairs())
+    assert pairs == {frozenset((p.id, circle.id)) for p in points}
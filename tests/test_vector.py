@@ -484,3 +484,30 @@ def test_vector_degrees_between(v1, v2, w1, w2):
 
 def test_vector_from_positions():
     assert False
+
+
+@pytest.mark.parametrize('x1,y1,x2,y2', params_coord_math_auto_verify_le)
+def test_vector_make(x1, y1, x2, y2):
+    v1 = Vector._make(float(x1), float(y1))
+    assert v1 == Vector(x1, y1)
+    assert type(v1) is Vector
+    v1.x = x2
+    v1.y = y2
+    assert v1 == Vector(x2, y2)
+
+
+def test_vector_slots():
+    v1 = Vector(1, 2)
+    assert not hasattr(v1, '__dict__')
+    with pytest.raises(AttributeError):
+        v1.z = 3
+    with pytest.raises(TypeError, match=r'\'x\' must be a number$'):
+        v1.x = 'w'
+
+
+@pytest.mark.parametrize('x1,y1,x2,y2', params_coord_math_auto_verify_le)
+def test_vector_add_scaled(x1, y1, x2, y2):
+    v1 = Vector(x1, y1)
+    v2 = Vector(x2, y2)
+    assert v1.add_scaled(v2, 2) is v1
+    assert v1 == Vector(x1, y1) + v2 * 2
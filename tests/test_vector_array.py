@@ -0,0 +1,151 @@
+import copy
+import math
+
+import numpy as np
+import pytest
+
+from geometry import EPSILON, Point, Vector, VectorArray
+
+params_vectors = [
+    [(1, 0), (0, 1), (3, 4)],
+    [(-1, 2.5), (0, 0), (1/3, -2)],
+]
+
+params_polar = [
+    ([1, 1, 2], [0, 90, 180]),
+    ([5, 0.5], [-45, 270]),
+]
+
+params_math_invalid_types = [
+    ('w',),
+    (True,),
+    (object(),),
+    (Point(1, 2),),
+]
+
+
+@pytest.mark.parametrize('xy', params_vectors)
+def test_vector_array_creation(xy):
+    a = VectorArray(xy)
+    assert len(a) == len(xy)
+    for i, (x, y) in enumerate(xy):
+        assert a[i] == Vector(x, y)
+        assert type(a[i]) is Vector
+    assert all(type(v) is Vector and type(v.x) is type(v.y) is float for v in a)
+    if len(a):
+        assert a[np.int64(0)] == a[0]
+
+
+def test_vector_array_invalid_shape():
+    with pytest.raises(ValueError):
+        VectorArray([1, 2, 3])
+
+
+@pytest.mark.parametrize('xy', params_vectors)
+def test_vector_array_iter(xy):
+    assert list(VectorArray(xy)) == [Vector(x, y) for x, y in xy]
+
+
+@pytest.mark.parametrize('xy', params_vectors)
+def test_vector_array_slice_is_view(xy):
+    a = VectorArray(xy)
+    view = a[1:]
+    view += Vector(1, 1)
+    assert a[0] == Vector(*xy[0])
+    assert a[1] == Vector(*xy[1]) + Vector(1, 1)
+
+
+@pytest.mark.parametrize('xy', params_vectors)
+def test_vector_array_setitem(xy):
+    a = VectorArray(xy)
+    a[0] = Vector(7, 8)
+    assert a[0] == Vector(7, 8)
+    with pytest.raises(TypeError):
+        a[0] = Point(7, 8)
+
+
+@pytest.mark.parametrize('xy', params_vectors)
+def test_vector_array_copy(xy):
+    a = VectorArray(xy)
+    for b in (copy.copy(a), copy.deepcopy(a), a.copy()):
+        assert a == b
+        b.x += 1
+        assert a != b
+
+
+@pytest.mark.parametrize('xy', params_vectors)
+def test_vector_array_add_sub(xy):
+    a = VectorArray(xy)
+    b = VectorArray(xy[::-1])
+    v = Vector(2, -1)
+    for i, (x, y) in enumerate(xy):
+        assert (a + b)[i] == Vector(x, y) + Vector(*xy[::-1][i])
+        assert (a - b)[i] == Vector(x, y) - Vector(*xy[::-1][i])
+        assert (a + v)[i] == Vector(x, y) + v
+        assert (a - v)[i] == Vector(x, y) - v
+
+
+@pytest.mark.parametrize('o2', params_math_invalid_types)
+def test_vector_array_add_invalid(o2):
+    a = VectorArray(params_vectors[0])
+    with pytest.raises(TypeError):
+        a + o2
+    with pytest.raises(TypeError):
+        a * o2
+
+
+@pytest.mark.parametrize('xy', params_vectors)
+def test_vector_array_scale(xy):
+    a = VectorArray(xy)
+    scale = np.arange(len(xy), dtype=float)
+    for i, (x, y) in enumerate(xy):
+        assert (a * 2)[i] == Vector(x, y) * 2
+        assert (a / 2)[i] == Vector(x, y) / 2
+        assert (a * scale)[i] == Vector(x, y) * float(scale[i])
+        assert (-a)[i] == -Vector(x, y)
+
+
+@pytest.mark.parametrize('scale', [np.int64(3), np.int32(3), np.float32(3), np.float64(3)])
+def test_vector_array_scale_numpy_scalars(scale):
+    a = VectorArray(params_vectors[0])
+    assert (a * scale).data.tolist() == (a * 3).data.tolist()
+    assert (a / scale).data.tolist() == (a / 3).data.tolist()
+
+
+@pytest.mark.parametrize('xy', params_vectors)
+def test_vector_array_dot_cross(xy):
+    a = VectorArray(xy)
+    b = VectorArray(xy[::-1])
+    dots = a.dot(b)
+    crosses = a.cross(b)
+    for i, (x, y) in enumerate(xy):
+        assert abs(dots[i] - Vector(x, y).dot(Vector(*xy[::-1][i]))) < EPSILON
+        assert abs(crosses[i] - Vector(x, y).cross(Vector(*xy[::-1][i]))) < EPSILON
+    assert np.allclose(a * Vector(1, 0), a.x)
+
+
+@pytest.mark.parametrize('xy', params_vectors)
+def test_vector_array_magnitude_angle(xy):
+    a = VectorArray(xy)
+    for i, (x, y) in enumerate(xy):
+        assert abs(a.magnitude[i] - Vector(x, y).magnitude) < EPSILON
+        assert abs(a.angle[i] - Vector(x, y).angle) < EPSILON
+
+
+@pytest.mark.parametrize('xy', params_vectors)
+def test_vector_array_normalize(xy):
+    a = VectorArray(xy).normalize()
+    for i, (x, y) in enumerate(xy):
+        if x == 0 and y == 0:
+            assert a[i] == Vector(0, 0)
+        else:
+            assert abs(a[i].magnitude - 1) < EPSILON
+
+
+@pytest.mark.parametrize('m,d', params_polar)
+def test_vector_array_from_polar(m, d):
+    a = VectorArray.from_polar_degrees(np.array(m), np.array(d))
+    b = VectorArray.from_polar_radians(np.array(m), np.radians(d))
+    for i in range(len(m)):
+        assert a[i] == Vector.from_polar_degrees(m[i], d[i])
+        assert b[i] == Vector.from_polar_radians(m[i], math.radians(d[i]))
@@ -0,0 +1,173 @@
+import copy
+import gc
+
+import numpy as np
+import pytest
+
+from entities import CircleEntity, PointEntity, RowPoint, RowVector, World, WorldProxy
+from geometry import Point, Vector
+
+
+LocalWorld = World(capacity=4)
+
+
+class ProxyPoint(WorldProxy, PointEntity):
+    world = LocalWorld
+
+
+class ProxyCircle(WorldProxy, CircleEntity):
+    world = LocalWorld
+
+
+@pytest.fixture(autouse=True)
+def clear_world():
+    LocalWorld.clear()
+    yield
+    LocalWorld.clear()
+
+
+def make_proxy(x, y, dx=0, dy=0, r=3):
+    return ProxyCircle(x, y, dx, dy, (255, 255, 255), r)
+
+
+def test_world_spawn_grows_columns():
+    world = World(capacity=2)
+    slots = [world.spawn(i, 2 * i, 1, 0, radius=i) for i in range(5)]
+    assert slots == [0, 1, 2, 3, 4]
+    assert world.capacity >= 5
+    assert len(world) == 5
+    assert world.pos[:5].tolist() == [[i, 2 * i] for i in range(5)]
+    assert world.radius[:5].tolist() == [0, 1, 2, 3, 4]
+    assert world.slots().tolist() == slots
+
+
+def test_world_release_reuses_rows():
+    world = World(capacity=2)
+    a = world.spawn(0, 0)
+    world.spawn(1, 1)
+    world.release(a)
+    assert len(world) == 1
+    assert world.spawn(5, 5) == a
+    assert world.pos[a].tolist() == [5, 5]
+
+
+@pytest.mark.parametrize('n, free', [(0, 0), (3, 0), (3, 2), (10, 2)])
+def test_world_spawn_many(n, free):
+    world = World(capacity=2)
+    released = [world.spawn(0, 0) for _ in range(free)]
+    for slot in released:
+        world.release(slot)
+    xy = np.arange(2 * n, dtype=float).reshape(n, 2)
+    slots = world.spawn_many(xy, np.ones((n, 2)), radius=2)
+    assert len(slots) == len(set(slots.tolist())) == n
+    assert set(released[:n]) <= set(slots.tolist())
+    assert world.pos[slots].tolist() == xy.tolist()
+    assert np.all(world.radius[slots] == 2)
+    assert len(world) == n
+
+
+def test_world_integrate():
+    world = World()
+    moving = world.spawn(0, 0, 2, -1)
+    dead = world.spawn(0, 0, 2, -1)
+    world.alive[dead] = False
+    world.integrate(0.5)
+    assert world.pos[moving].tolist() == [1, -0.5]
+    assert world.pos[dead].tolist() == [0, 0]
+
+
+def test_world_cull_and_collect():
+    world = World()
+    inside = world.spawn(5, 5)
+    outside = [world.spawn(-1, 5), world.spawn(5, 11), world.spawn(11, 11)]
+    assert sorted(world.cull(0, 0, 10, 10).tolist()) == outside
+    assert world.slots().tolist() == [inside]
+    assert world.collect() == 3
+    assert world.collect() == 0
+    assert world.spawn(0, 0) in outside
+
+
+def test_world_dissipate():
+    world = World()
+    hot = world.spawn(0, 0, temperature=100)
+    cold = world.spawn(0, 0, temperature=10)
+    world.dissipate(0.5, 1, minimum=20)
+    assert world.temperature[hot] == 50
+    assert world.temperature[cold] == 20
+
+
+def test_proxy_reads_and_writes_row():
+    e = make_proxy(1, 2, 3, 4, r=5)
+    slot = e._slot
+    world = LocalWorld
+    assert isinstance(e.pos, RowPoint) and isinstance(e.vel, RowVector)
+    assert world.pos[slot].tolist() == [1, 2]
+    assert world.vel[slot].tolist() == [3, 4]
+    assert world.radius[slot] == e.radius == 5
+
+    e.translate(e.vel, 2)
+    assert world.pos[slot].tolist() == [7, 10]
+    assert e.pos == Point(7, 10)
+
+    e.vel.x = -e.vel.x
+    e.pos.x = 0
+    assert world.vel[slot].tolist() == [-3, 4]
+    assert world.pos[slot].tolist() == [0, 10]
+
+    e.vel = Vector(1, 1)
+    e.radius = 2
+    assert world.vel[slot].tolist() == [1, 1]
+    assert world.radius[slot] == e.image.radius == 2
+
+    e.alive = False
+    assert not world.alive[slot]
+
+
+def test_proxy_validates_coordinates():
+    e = make_proxy(0, 0)
+    with pytest.raises(TypeError):
+        e.pos.x = 'a'
+
+
+def test_proxy_copies_detach():
+    e = make_proxy(1, 2, 3, 4)
+    pos = copy.copy(e.pos)
+    assert type(pos) is Point
+    e.translate(e.vel, 1)
+    assert pos == Point(1, 2)
+
+    clone = copy.deepcopy(e)
+    assert clone._slot != e._slot
+    assert clone.pos == e.pos and clone.vel == e.vel
+    clone.translate(clone.vel, 1)
+    assert clone.pos != e.pos
+
+
+def test_proxy_moves_itself():
+    e = make_proxy(0, 0, 1, 0)
+    LocalWorld.integrate(1)
+    assert e.pos == Point(0, 0)
+    e.move(1)
+    assert e.pos == Point(1, 0)
+
+
+def test_proxy_row_released_on_collection():
+    e = make_proxy(0, 0)
+    slot = e._slot
+    e.alive = False
+    assert LocalWorld.collect() == 0  # still held by the proxy
+    del e
+    gc.collect()
+    assert slot in LocalWorld._free
+
+
+def test_proxy_cull_marks_physics(backend):
+    physics = backend
+    e = make_proxy(50, 50)
+    point = ProxyPoint(60, 60, 0, 0, (255, 255, 255), 3)
+    physics.add_to_sector(e)
+    physics.add_to_sector(point)
+    e.pos.x = -50  # moved behind physics' back
+    LocalWorld.cull(0, 0, 100, 100)
+    physics.update_sectors()
+    assert [x.id for x in physics.get_registered_entities()] == [point.id]